@@ -5,11 +5,48 @@ Aggregates top engineering trends + generates Miro content recommendations.
 Hackathon POC - 2026
 """
 
-import requests
-import feedparser
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict, deque
+import argparse
+import array
+import codecs
+import contextlib
+import functools
+import glob
+import gzip
+import hashlib
+import heapq
 import html as html_lib
+import importlib
+import io
+import json
+import math
+import os
+import queue
+import re
+import struct
+import sys
+import threading
+import time
+import urllib.parse
+
+
+class _LazyModule:
+    """Stand-in for a third-party module that is imported on first attribute
+    access, so commands that never fetch don't pay for requests/feedparser."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = _LazyModule("requests")
+feedparser = _LazyModule("feedparser")
 
 # ─── CONFIG ────────────────────────────────────────────────────────────────────
 
@@ -93,6 +130,163 @@ SUBREDDITS = [
 ]
 
 REDDIT_HEADERS = {"User-Agent": "EngBrandMachine/1.0 (hackathon project)"}
+# Subreddits are fetched as multireddits (/r/a+b+c/top.json): this many per
+# listing, paged REDDIT_PAGE_SIZE posts at a time for up to REDDIT_MAX_PAGES.
+REDDIT_BATCH_SIZE = 6
+REDDIT_PAGE_SIZE = 100
+REDDIT_MAX_PAGES = 3
+# A 429 is retried after its Retry-After (else REDDIT_BACKOFF_SECONDS, doubling)
+# up to REDDIT_MAX_RETRIES times; waits over REDDIT_MAX_BACKOFF_SECONDS give up at once.
+REDDIT_MAX_RETRIES = 2
+REDDIT_BACKOFF_SECONDS = 2
+REDDIT_MAX_BACKOFF_SECONDS = 60
+FEED_HEADERS = {"User-Agent": "EngBrandMachine/1.0 (feed reader)"}
+
+# RSS ingestion: downloads are I/O-bound (threads), parsing is CPU-bound (processes).
+RSS_DOWNLOAD_WORKERS = 16
+RSS_PARSE_WORKERS = os.cpu_count() or 2
+RSS_SUMMARY_CHARS = 500          # of each entry's summary kept for reclassification
+
+# --export: columnar article file layout (see ColumnarWriter) and the Atom feed id.
+COLUMNAR_VERSION = 1
+COLUMNAR_SCHEMA = [  # (article field, array typecode); "I" = index into the string table
+    ("title", "I"), ("url", "I"), ("source", "I"), ("topic", "I"),
+    ("score", "q"), ("comments", "i"), ("published", "q"),
+]
+COLUMNAR_GROUP_ROWS = 4096
+ATOM_FEED_ID = "tag:eng-brand-machine,2026:recommendations"
+
+# Webhook notifications (--webhook / $EBM_WEBHOOKS).
+NOTIFY_TOP_STORIES = 10          # how many of the hottest stories count as "top"
+NOTIFY_WORKERS = 4               # concurrent deliveries / pooled connections
+NOTIFY_TIMEOUT = 10              # seconds per POST
+NOTIFY_BACKOFF_SECONDS = 30      # first retry delay, doubled per attempt …
+NOTIFY_BACKOFF_MAX_SECONDS = 3600  # … up to this
+NOTIFY_MAX_ATTEMPTS = 8
+NOTIFY_FLUSH_SECONDS = 15        # how long a one-shot build waits for delivery before exiting
+NOTIFY_SEEN_DAYS = 7             # an event isn't sent again while seen within this many days
+
+# `miro`: Miro REST API (token in $MIRO_ACCESS_TOKEN) and board export tuning.
+MIRO_API_URL = "https://api.miro.com/v2"
+MIRO_BULK_LIMIT = 20             # items per bulk-create call (the API maximum)
+MIRO_WORKERS = 4                 # concurrent bulk calls over the pooled session
+MIRO_MAX_ATTEMPTS = 6
+MIRO_STICKY_WIDTH = 360
+MIRO_MOCK_RATE_PER_MINUTE = 100  # `miro-mock` rate limit
+
+# `simulate`: a local stand-in for every upstream API and feed (builds reach it
+# through --upstream). Faults are per request; override any with --faults.
+SIM_FEEDS = 2000                 # feeds listed at /opml.xml (?feeds=N overrides)
+SIM_FAULTS = {
+    "latency": 40,               # median response delay in ms (log-normal) …
+    "jitter": 0.8,               # … and its sigma: above ~1 the tail gets long
+    "429": 0.01,                 # share of requests refused with 429 + Retry-After
+    "5xx": 0.005,                # chance a request starts a run of 503s on its host …
+    "burst": 8,                  # … this many requests long
+    "truncate": 0.005,           # share of bodies cut off mid-transfer
+    "hang": 0.002,               # share of requests that never get an answer
+    "seed": 0,
+}
+SIM_HANG_SECONDS = 300
+
+# `build --shard I/N` writes its slice here; `merge` reads it back.
+PARTIALS_DIR = "partials"
+
+# Streaming pipeline: max articles buffered between two stages (backpressure).
+PIPELINE_QUEUE_SIZE = 256
+
+# Link resolution: click-tracking and shortener links (matched from the start
+# of the URL) are followed to their target before dedupe. Stable redirectors
+# always point to the same place, so their results are cached for good; the
+# rest are re-checked after RESOLVE_TTL_HOURS, failures after RESOLVE_RETRY_HOURS.
+REDIRECTORS = [
+    (r"https?://(t\.co|bit\.ly|buff\.ly|ow\.ly|lnkd\.in|dlvr\.it|trib\.al|tinyurl\.com)/", True),
+    (r"https?://[^/]*(weekly\.com|frontendfoc\.us|cooperpress\.com)/link/\d+/", True),
+    (r"https?://(tracking|links)\.tldrnewsletter\.com/", True),
+    (r"https?://feedproxy\.google\.com/", False),
+]
+RESOLVE_WORKERS = 8              # HEAD requests in flight at once
+RESOLVE_MAX_HOPS = 5
+RESOLVE_TIMEOUT = 5
+RESOLVE_TTL_HOURS = 7 * 24
+RESOLVE_RETRY_HOURS = 1
+RESOLVE_CACHE_MAX = 50_000       # entries kept in CACHE_DIR/links.json, newest first
+
+# --enrich: article pages fetched so classification sees their text, not just
+# the title. Bodies are streamed and abandoned after ENRICH_MAX_BYTES; each host
+# gets at most ENRICH_PER_HOST requests at once, ENRICH_HOST_INTERVAL seconds apart.
+ENRICH_WORKERS = 16
+ENRICH_PER_HOST = 2
+ENRICH_HOST_INTERVAL = 0.25
+ENRICH_MAX_BYTES = 512 * 1024
+ENRICH_TIMEOUT = 8
+ENRICH_TEXT_CHARS = 2000         # extracted text kept per page
+ENRICH_RETRY_HOURS = 6           # failed pages are retried after this long
+ENRICH_CACHE_MAX = 20_000        # pages kept in CACHE_DIR/bodies.json, newest first
+ENRICH_SKIP = re.compile(r"https?://([^/]*\.)?(github\.com|reddit\.com|youtube\.com|youtu\.be|twitter\.com|x\.com)/"
+                         r"|.*\.(pdf|png|jpe?g|gif|mp4|zip)([?#].*)?$", re.I)
+
+# --profile: stack depth tracemalloc records per allocation (deeper attributes
+# more allocations to a stage, at the cost of memory and speed), report sizes.
+PROFILE_TRACE_FRAMES = 16
+PROFILE_TOP_FUNCTIONS = 12
+PROFILE_TOP_HOTSPOTS = 8
+
+# Daemon mode: how often each source (see SOURCES) is refetched, in minutes.
+SOURCE_REFRESH_MINUTES = {
+    "hn":          5,
+    "hn-ask-show": 15,
+    "devto":       60,
+    "rss":         60,
+    "github":      24 * 60,
+    "reddit":      30,
+}
+
+# Run state that later runs build on (per-source snapshots, …). Unlike the
+# cache, deleting it loses information — e.g. what --only can merge with.
+STATE_DIR = ".ebm-state"
+
+# Content-addressed stage cache (classification, aggregation, HTML fragments).
+# Safe to delete at any time — it only makes unchanged builds cheaper.
+CACHE_DIR = ".ebm-cache"
+CACHE_MAX_AGE_DAYS = 14
+
+# Page-weight budget for the gzipped dashboard (what a phone actually downloads).
+PAGE_BUDGET_BYTES = 40_000
+
+# --split writes the article set here, next to the HTML shell.
+ARTICLES_PAYLOAD = "articles.json"
+
+# Client-side search index, written next to the dashboard on every build.
+SEARCH_INDEX = "search-index.json"
+SEARCH_STOPWORDS = {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in",
+                    "is", "it", "of", "on", "or", "the", "this", "to", "what", "why", "with", "you", "your"}
+
+# Emerging terms: title words and word pairs counted in count-min sketches of
+# fixed size (width × depth float32 cells) against a baseline kept in STATE_DIR.
+BURST_SKETCH_WIDTH = 1 << 15
+BURST_SKETCH_DEPTH = 4
+BURST_CANDIDATES = 256           # heavy-hitter terms tracked per run
+BURST_HALF_LIFE_HOURS = 72       # how fast the baseline forgets, whatever the run cadence
+BURST_MIN_COUNT = 3              # articles a term needs this run to be considered
+BURST_MIN_SCORE = 2.0            # (count − expected) / √(expected + 1)
+BURST_TOP = 10
+# Changes since the last run: the badges for new, rising, falling and returning stories.
+DIFF_MIN_DELTA = 5               # a score must move by at least this many points …
+DIFF_CHANGE_RATIO = 0.25         # … and by this fraction of its previous value
+DIFF_BLOOM_BITS = 1 << 23        # "ever seen" filter: 1 MB, ~1% false positives …
+DIFF_BLOOM_HASHES = 7
+DIFF_BLOOM_CAPACITY = 800_000    # … up to this many URLs, after which it starts over
+CHANGE_LABELS = {"new": "🆕 New", "rising": "▲ Rising", "falling": "▼ Falling", "returning": "↩ Back"}
+# Known tracking keys only: a bare "ref" is often functional (GitHub's ?ref=branch).
+TRACKING_PARAMS = re.compile(r"utm_.*|fbclid|gclid|dclid|msclkid|mc_cid|mc_eid|igshid|ref_src|ref_url|_hsenc|_hsmi|mkt_tok")
+
+BURST_STOPWORDS = SEARCH_STOPWORDS | {
+    "about", "after", "all", "am", "ask", "but", "can", "do", "does", "get", "has", "have", "hn", "i",
+    "if", "into", "just", "me", "more", "my", "new", "not", "now", "one", "our", "out", "over", "show",
+    "so", "than", "that", "their", "them", "they", "up", "use", "using", "vs", "was", "we", "when",
+    "which", "who", "will", "without", "yet",
+}
 
 TOPIC_KEYWORDS = {
     "🤖 AI / ML":        ["ai", "machine learning", "llm", "gpt", "neural", "ml", "deep learning",
@@ -124,478 +318,532 @@ TOPIC_KEYWORDS = {
 # ─── MIRO RECOMMENDATION TEMPLATES ────────────────────────────────────────────
 # Each template maps a topic to a Miro content idea.
 # We'll pick the best ones based on what's actually trending.
+# The library (MIRO_CONTENT_TEMPLATES + DEFAULT_RECS) lives in miro_templates.json
+# and is only parsed the first time something needs it — see load_templates().
+
+TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro_templates.json")
+
+
+@functools.lru_cache(maxsize=None)
+def load_templates():
+    with open(TEMPLATES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TemplateIndex:
+    """Inverted index over the whole template library: term → [(template id,
+    weight)], where a template's terms are the words of its tags and title.
+    A run's trending terms only touch the templates that mention them, so
+    matching stays cheap however large the library grows."""
+
+    TAG_WEIGHT = 1.0
+    TITLE_WEIGHT = 0.5
+
+    def __init__(self, library):
+        self.templates = []  # id → (topic, template)
+        self.postings = defaultdict(list)
+        self.by_topic = defaultdict(list)
+        self.norms = []
+        for topic, templates in library["MIRO_CONTENT_TEMPLATES"].items():
+            for template in templates:
+                self._add(topic, template)
+        self.defaults = library["DEFAULT_RECS"]
+        self.terms = frozenset(self.postings)
+
+    def _add(self, topic, template):
+        tid = len(self.templates)
+        self.templates.append((topic, template))
+        self.by_topic[topic].append(tid)
+        weights = {}
+        for term in search_tokens(template.get("title", "")):
+            weights[term] = self.TITLE_WEIGHT
+        for term in search_tokens(" ".join(template.get("tags", [])).replace("-", " ")):
+            weights[term] = self.TAG_WEIGHT
+        for term, weight in weights.items():
+            self.postings[term].append((tid, weight))
+        # Long tag lists shouldn't win just by covering more words.
+        self.norms.append(math.sqrt(len(weights)) or 1.0)
+
+    def match(self, topic_weights, term_weights, k=5):
+        """Best k (topic, template) pairs, at most one per topic. A template
+        scores its topic's trend weight plus the trend weight of each of its
+        terms (scaled by the term's weight in the template and the template's size).
+        When fewer than k topics score at all, the rest are filled with the first
+        template of each remaining topic, in library order."""
+        scores = defaultdict(float)
+        for term, trend in term_weights.items():
+            for tid, weight in self.postings.get(term, ()):
+                scores[tid] += trend * weight
+        for tid in scores:
+            scores[tid] /= self.norms[tid]
+        for topic, trend in topic_weights.items():
+            for tid in self.by_topic.get(topic, ()):
+                scores[tid] += trend
+        heap = [(-score, tid) for tid, score in scores.items()]
+        heapq.heapify(heap)
+        picked, topics = [], set()
+        while heap and len(picked) < k:
+            tid = heapq.heappop(heap)[1]
+            topic = self.templates[tid][0]
+            if topic not in topics:
+                topics.add(topic)
+                picked.append(self.templates[tid])
+        for topic, tids in self.by_topic.items():
+            if len(picked) >= k:
+                break
+            if topic not in topics:
+                topics.add(topic)
+                picked.append(self.templates[tids[0]])
+        return picked
+
+
+@functools.lru_cache(maxsize=None)
+def template_index():
+    return TemplateIndex(load_templates())
+
+
+def __getattr__(name):
+    # Lazy module attributes: eng_brand_machine.MIRO_CONTENT_TEMPLATES still works.
+    if name in ("MIRO_CONTENT_TEMPLATES", "DEFAULT_RECS"):
+        return load_templates()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ─── TRACING ───────────────────────────────────────────────────────────────────
+# --trace out.json records a span for every HTTP request, fetcher, pipeline
+# stage and build step in Chrome's trace-event format (open it in
+# https://ui.perfetto.dev or chrome://tracing). Timestamps are wall-clock
+# microseconds so spans recorded in RSS parse worker processes line up too.
+# With tracing off, span() hands back a shared no-op and costs a function call.
+
+TRACER = None
+
+
+class _Span:
+    def __init__(self, tracer, name, cat, args):
+        self.tracer, self.name, self.cat, self.args = tracer, name, cat, args
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self):
+        self.start = time.time_ns() // 1000
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.add(self.event())
+        return False
+
+    def event(self):
+        return {"name": self.name, "cat": self.cat, "ph": "X", "ts": self.start,
+                "dur": time.time_ns() // 1000 - self.start, "pid": os.getpid(),
+                "tid": threading.get_ident(), "args": self.args}
+
+
+class _NoSpan:
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Collects complete ("X") trace events from any thread, plus the thread
+    names Perfetto shows as track labels. Python reuses a finished thread's
+    id, so each (id, name) pair gets its own track id."""
+
+    def __init__(self):
+        self.events = []
+        self._threads = {}  # (thread id, name) → track id
+        self._lock = threading.Lock()
+
+    def span(self, name, cat, **args):
+        return _Span(self, name, cat, args)
+
+    def add(self, event):
+        with self._lock:
+            if event["pid"] == os.getpid():
+                key = (event["tid"], threading.current_thread().name)
+                event["tid"] = self._threads.setdefault(key, len(self._threads) + 1)
+            self.events.append(event)
+
+    def write(self, path):
+        meta = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                 "args": {"name": "eng_brand_machine" if pid == os.getpid() else "rss parse worker"}}
+                for pid in {e["pid"] for e in self.events} | {os.getpid()}]
+        meta += [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                 for (_, name), tid in self._threads.items()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + self.events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        print(f"🧭 Trace: {len(self.events)} spans → {path} (open in https://ui.perfetto.dev)")
+
+
+def span(name, cat="build", **args):
+    """Context manager timing one step; a no-op unless --trace is on."""
+    return TRACER.span(name, cat, **args) if TRACER else _NO_SPAN
+
+
+# --upstream URL sends every fetcher request to one server (see `simulate`):
+# https://host/path?query becomes URL/host/path?query.
+UPSTREAM = None
+
+
+def upstream_url(url):
+    if not UPSTREAM or url.startswith(UPSTREAM):
+        return url
+    parts = urllib.parse.urlsplit(url)
+    return f"{UPSTREAM.rstrip('/')}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def http_request(method, url, **kwargs):
+    """requests.request for every fetcher, traced with host, status and response
+    size (unless streamed), and rewritten to --upstream when one is set."""
+    url = upstream_url(url)
+    with span(urllib.parse.urlsplit(url).netloc, "http", url=url, method=method) as s:
+        resp = requests.request(method, url, **kwargs)
+        s.set(status=resp.status_code)
+        if not kwargs.get("stream"):
+            s.set(bytes=len(resp.content))
+    return resp
+
+
+def http_get(url, **kwargs):
+    return http_request("GET", url, **kwargs)
+
+
+# ─── PROFILING ─────────────────────────────────────────────────────────────────
+# --profile DIR runs the build on the main thread, one stage at a time (no
+# pipeline threads, RSS downloaded and parsed in-process), so each stage's
+# CPU time and memory are its own. Every stage gets a cProfile profile and
+# tracemalloc accounting: the peak above the level it started at, and the
+# allocations still alive at the end of the run whose stack passes through
+# the stage's code (retained memory, grouped into line hotspots). Results go
+# to DIR/report.txt and one DIR/<stage>.pstats per stage (`python -m pstats`,
+# snakeviz, …). Combine with --replay to profile a fixed data set offline.
+# cProfile, pstats and tracemalloc are imported only once a Profiler exists.
+
+PROFILER = None
+
+
+class _ProfiledStage:
+    def __init__(self, profiler, name, code):
+        self.profiler, self.stats = profiler, profiler.stage(name, code)
+
+    def __enter__(self):
+        import tracemalloc
+        stack = self.profiler.stack
+        if stack:  # the outer stage pauses; note its high-water mark before resetting it
+            stack[-1].stats["profile"].disable()
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self.base = self.peak = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+        stack.append(self)
+        self.stats["profile"].enable()
+        return self
+
+    def set(self, **args):
+        pass
+
+    def __exit__(self, exc_type, exc, tb):
+        import tracemalloc
+        self.stats["profile"].disable()
+        stack = self.profiler.stack
+        stack.pop()
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        self.stats["calls"] += 1
+        self.stats["seconds"] += time.perf_counter() - self.start
+        self.stats["peak"] = max(self.stats["peak"], self.peak - self.base)
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, self.peak)
+            stack[-1].stats["profile"].enable()
+        return False
+
+
+class Profiler:
+    """Per-stage CPU profiles and memory attribution for --profile (see above)."""
+
+    def __init__(self, directory):
+        self.dir = directory
+        self.stages = {}  # name → {"calls", "seconds", "peak", "profile", "code"}
+        self.stack = []
+        import tracemalloc  # deferred: only --profile needs it
+        tracemalloc.start(PROFILE_TRACE_FRAMES)
+
+    def stage(self, name, code):
+        """Stats for a stage; allocations made under code count towards it."""
+        import cProfile
+        stats = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "peak": 0,
+                                              "profile": cProfile.Profile(), "code": set()})
+        if code is not None and code not in stats["code"]:
+            lines = [line for _, _, line in code.co_lines() if line] or [code.co_firstlineno]
+            stats["code"].add(code)
+            stats.setdefault("ranges", []).append((code.co_filename, code.co_firstlineno, max(lines)))
+        return stats
+
+    def _retained(self):
+        """stage → (bytes, {(file, line): [bytes, blocks]}) for live allocations,
+        each charged to the innermost stage on its stack."""
+        import tracemalloc
+        ranges = [(name, f, lo, hi) for name, st in self.stages.items() for f, lo, hi in st.get("ranges", ())]
+        retained = {name: [0, defaultdict(lambda: [0, 0])] for name in self.stages}
+        for trace in tracemalloc.take_snapshot().traces:
+            frames = list(trace.traceback)
+            for frame in reversed(frames):  # oldest first, so reversed starts at the allocation
+                owner = next((name for name, f, lo, hi in ranges
+                              if frame.filename == f and lo <= frame.lineno <= hi), None)
+                if owner:
+                    where = retained[owner][1][(frames[-1].filename, frames[-1].lineno)]
+                    where[0] += trace.size
+                    where[1] += 1
+                    retained[owner][0] += trace.size
+                    break
+        return retained
+
+    def write(self):
+        import pstats
+        import tracemalloc
+        os.makedirs(self.dir, exist_ok=True)
+        retained = self._retained()
+        tracemalloc.stop()
+        mb = 1 / 2 ** 20
+        lines = [f"{'Stage':34} {'calls':>7} {'wall s':>8} {'peak MB':>8} {'retained MB':>12}"]
+        details = []
+        for name, st in sorted(self.stages.items(), key=lambda kv: -kv[1]["seconds"]):
+            size, spots = retained[name]
+            lines.append(f"{name:34} {st['calls']:>7} {st['seconds']:>8.3f} {st['peak'] * mb:>8.2f} {size * mb:>12.2f}")
+            path = os.path.join(self.dir, re.sub(r"[^\w.-]+", "_", name) + ".pstats")
+            st["profile"].create_stats()
+            if st["profile"].stats:
+                st["profile"].dump_stats(path)
+            out = io.StringIO()
+            if st["profile"].stats:
+                pstats.Stats(st["profile"], stream=out).strip_dirs().sort_stats("tottime").print_stats(PROFILE_TOP_FUNCTIONS)
+            hot = sorted(spots.items(), key=lambda kv: -kv[1][0])[:PROFILE_TOP_HOTSPOTS]
+            details.append(f"\n{'═' * 78}\n{name}\n{'═' * 78}\nAllocation hotspots (still alive at the end of the run):\n"
+                           + ("".join(f"  {b * mb:8.3f} MB {n:>8} blocks  {os.path.basename(f)}:{line}\n"
+                                      for (f, line), (b, n) in hot) or "  (none)\n")
+                           + "\nTop functions by own time:" + out.getvalue().split("\n", 1)[-1].rstrip() + "\n")
+        report = "\n".join(lines) + "\n" + "".join(details)
+        with open(os.path.join(self.dir, "report.txt"), "w", encoding="utf-8") as f:
+            f.write(report)
+        print("\n🔬 Profile by stage (report and .pstats files in " + self.dir + "):")
+        for line in lines:
+            print("   " + line)
+
+
+def profiled(stage, entry=None):
+    """Context manager attributing the enclosed work to a --profile stage; a
+    no-op otherwise. Memory allocated under entry (a function or generator;
+    default: the calling function) is charged to the stage."""
+    if PROFILER is None:
+        return _NO_SPAN
+    code = (getattr(entry, "__code__", None) or getattr(entry, "gi_code", None) if entry is not None
+            else sys._getframe(1).f_code)
+    return _ProfiledStage(PROFILER, stage, code)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs each call inside submit(), on the calling
+    thread — how --profile keeps the RSS fetcher on the main thread."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
 
-MIRO_CONTENT_TEMPLATES = {
-    "🤖 AI / ML": [
-        {
-            "title": "How to Map Your AI Agent Architecture in Miro",
-            "description": "A step-by-step guide showing engineering teams how to visualize LLM pipelines, RAG architectures, and multi-agent systems on a Miro board — making complex AI stacks legible to every stakeholder.",
-            "demo": "Live Miro board with a RAG pipeline diagram: data ingestion → chunking → vector DB → retriever → LLM → output. Clickable nodes link to real code.",
-            "format": "Blog Post + Free Template",
-            "cta": "Download the AI Architecture Template →",
-            "tags": ["ai", "llm", "rag", "agent-architecture", "miro-templates", "machine-learning"],
-            "seo_description": "Map your RAG pipeline and multi-agent AI architecture in Miro — a step-by-step guide for engineering teams building LLM systems.",
-            "read_time": "6 min read",
-            "hero_prompt": "A glowing RAG pipeline architecture diagram on a dark background, luminous arrows flowing from document corpus through vector database to large language model, isometric tech illustration, purple and cyan color palette, ultra-detailed",
-            "body": """
-<p>Your AI architecture document is already out of date. The moment you finished that Confluence page describing your RAG pipeline, a teammate added a re-ranking step, swapped the vector database, and introduced a second agent loop. Keeping everyone — product, design, leadership — aligned on what your AI system <em>actually</em> does has become a full-time job that nobody signed up for.</p>
-
-<h2>Why the Existing Approach Fails</h2>
-<p>Most teams default to one of two paths: dense technical diagrams buried in Notion that only the original author can decode, or live whiteboard sessions that evaporate the moment the meeting ends. Neither scales. With LLM architectures evolving weekly — new models, new orchestration frameworks, new retrieval strategies — your diagrams need to be living documents, not frozen snapshots.</p>
-<p>The real problem isn't complexity. It's that your documentation toolchain was designed for static content in a world that demands dynamic collaboration.</p>
-
-<h2>The Miro Framework: Map Your AI Stack in 5 Steps</h2>
-<ol>
-  <li><strong>Start with the data journey.</strong> Draw every stage from raw data ingestion to output: source → chunking → embedding → vector store → retriever → LLM → response. Don't skip preprocessing — it's where most production bugs hide.</li>
-  <li><strong>Layer in your infrastructure.</strong> Add swim lanes for model serving, monitoring, and feedback loops. Use a consistent color code: green for stable/live, yellow for in-flight, red for known issues or technical debt.</li>
-  <li><strong>Link to code, not just diagrams.</strong> Every node in Miro holds a hyperlink. Attach the GitHub file, PR, or experiment run directly so engineers jump from diagram to implementation in one click.</li>
-  <li><strong>Annotate decisions, not just mechanics.</strong> Use sticky notes for "why we chose this" — model selection rationale, chunking strategy trade-offs, latency budgets. Your future self will thank you.</li>
-  <li><strong>Run async design reviews.</strong> Share the board, enable comments, and let people question and suggest changes without scheduling yet another meeting.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "A multi-agent system diagram showing three specialized AI agents (retriever, reasoner, synthesizer) exchanging messages via a shared memory store, dark background with luminous connection arrows, isometric perspective, cyan and violet color scheme"
-</div>
 
-<h2>Practical Workflow: Keeping the Board Alive</h2>
-<p>Assign one engineer per sprint as the "architecture steward." Their job: 15 minutes before the sprint retro, update the Miro board with any changes. Use Miro's comment notifications to automatically loop in stakeholders. For multi-agent systems, create a separate frame per agent with clear input/output contracts visible at a glance.</p>
-<p>Teams that implement this consistently report two outcomes: product managers stop asking "how does the AI actually work?" in stand-up, and new engineers onboard to the AI stack in days, not weeks. When something breaks at 2 AM, your on-call engineer can navigate the architecture map directly to the failing component instead of grep-ing through Slack history.</p>
-<p>The best AI systems aren't just well-built — they're well-explained. <em>Download the free Miro AI Architecture Template and have your RAG pipeline mapped in under an hour.</em></p>
-""",
-        },
-        {
-            "title": "AI System Design Reviews, Async — A Miro Playbook",
-            "description": "How ML teams at fast-moving companies run async architecture reviews using Miro: annotating architecture diagrams, leaving context-rich comments, and shipping decisions 2x faster.",
-            "demo": "Before/after: messy Notion doc vs a Miro board with swimlanes for model training, serving, and monitoring pipelines.",
-            "format": "Case Study + Video Walkthrough",
-            "cta": "Watch the 3-min demo →",
-            "tags": ["ai", "ml", "async", "system-design", "miro-templates", "machine-learning"],
-            "seo_description": "Run async AI architecture reviews in Miro — how ML teams annotate diagrams, resolve decisions faster, and ship with shared understanding.",
-            "read_time": "5 min read",
-            "hero_prompt": "ML system architecture with training pipeline, model serving layer, and monitoring dashboard as glowing swim lanes on dark background, async comment bubbles floating above components, collaborative visualization, indigo and teal palette",
-            "body": """
-<p>ML teams move fast and break things — but when your model serving pipeline breaks at scale, "move fast" becomes "spend three days untangling who made what decision and why." Async design reviews in Miro change this. Instead of a 90-minute all-hands architecture call, you share a board, give people 48 hours to annotate, and walk into a 30-minute sync already 80% aligned.</p>
-
-<h2>Why Synchronous ML Design Reviews Don't Work</h2>
-<p>ML system design involves too many specializations for synchronous review to be efficient. Your data engineers care about the ingestion pipeline. Your ML engineers care about training infrastructure. Your platform engineers care about serving latency. Your product team cares about what any of this means for the feature they're shipping next week. Getting all of these stakeholders in a room at the same time, for long enough to reach meaningful decisions, is a coordination tax that compounds sprint over sprint.</p>
-<p>The alternative — email threads with architecture diagrams attached — produces 47-message threads where the final decision is buried in a reply-all that half the team missed.</p>
-
-<h2>The Miro Async Review Framework</h2>
-<ol>
-  <li><strong>Publish the board 48 hours before any sync.</strong> Share a Miro board with the architecture diagram and a structured comment guide: "Please annotate with your concerns, questions, and +1s."</li>
-  <li><strong>Use swim lanes for each stakeholder perspective.</strong> Data engineering, ML research, platform, and product each get a lane. Reviewers add their annotations to their lane — no cross-talk, clear ownership.</li>
-  <li><strong>Color-code by decision type.</strong> Green sticky = decision made, Yellow = open question, Red = blocker, Blue = nice-to-have future consideration.</li>
-  <li><strong>The sync is for red items only.</strong> Everything green and blue is resolved async. The 30-minute sync is laser-focused on blockers. Teams report shipping decisions 2x faster with this model.</li>
-  <li><strong>Archive every review.</strong> Create a new Miro frame for each review cycle. Your architecture history is now searchable, visual, and connected to the decisions that shaped it.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Before-and-after comparison: left side shows a cluttered Notion document with nested bullets, right side shows a clean Miro board with swim lanes, color-coded sticky notes, and clear decision indicators, split-screen visualization"
-</div>
+def _process_pool(workers):
+    """ProcessPoolExecutor whose workers never come from a plain fork(): the
+    pools start while fetch and stage threads run, and a forked child can
+    inherit a lock one of them held. Workers import this module afresh, so
+    the --upstream/--enrich settings are handed over explicitly."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method),
+                               initializer=_inherit_settings, initargs=(UPSTREAM, ENRICH))
 
-<h2>Team Adoption: Starting With One Review</h2>
-<p>Don't try to transform your entire review process overnight. Pick one upcoming architecture decision — the next model upgrade, a new data pipeline, a serving layer change — and run it async in Miro. Invite the five people who need to sign off. Give them 48 hours. See how the sync goes. The first time you finish a design review in 25 minutes instead of 90, the team will ask why you ever did it any other way.</p>
-<p>Async-first ML teams ship better systems because the review process doesn't bottleneck on calendar availability. <em>Watch the 3-minute demo and run your first async architecture review this sprint.</em></p>
-""",
-        },
-    ],
-    "☁️ Cloud / Infra": [
-        {
-            "title": "Kubernetes Architecture Diagrams That Actually Stay Up to Date",
-            "description": "Most K8s architecture docs go stale in days. This post shows how platform teams use Miro's live embed + diagram features to keep cluster topology, service maps, and resource flows always current.",
-            "demo": "An interactive Miro board with K8s namespace layout, pod communication, and HPA configs. Arrows update with sticky note annotations from the on-call engineer.",
-            "format": "Tutorial + Template",
-            "cta": "Grab the K8s Miro Template →",
-            "tags": ["kubernetes", "cloud", "infrastructure", "k8s", "miro-templates", "platform-engineering"],
-            "seo_description": "Keep Kubernetes architecture diagrams accurate and up-to-date with Miro — live annotations, team collaboration, and always-current cluster topology.",
-            "read_time": "5 min read",
-            "hero_prompt": "Kubernetes cluster architecture diagram with glowing nodes representing pods, services, ingress, and namespaces, floating in a dark space environment, connected by illuminated network paths, technical illustration, teal and blue palette",
-            "body": """
-<p>Kubernetes documentation has a half-life measured in sprint cycles. You update the architecture diagram, merge the PR, and by the time the next on-call rotation starts, three new services have been added, a namespace was restructured, and the HPA configs everyone agreed on last quarter have been quietly changed. The diagram in your wiki is now a liability, not an asset.</p>
-
-<h2>Why Static K8s Docs Always Go Stale</h2>
-<p>The root cause is a mismatch between how Kubernetes moves and how documentation tools work. Wikis and Confluence are document stores — they're great for stable reference material, terrible for representing infrastructure that changes daily. When the cost of updating a diagram is high (find the tool, open the file, re-export, re-upload, update the link), people stop updating it. That's not a discipline problem; it's a tooling problem.</p>
-<p>Additionally, K8s architecture involves multiple stakeholder perspectives simultaneously: cluster topology matters to SREs, service communication maps matter to backend engineers, and resource quota summaries matter to platform teams. No single static diagram serves all three audiences.</p>
-
-<h2>The Miro Framework: Living K8s Architecture in 4 Layers</h2>
-<ol>
-  <li><strong>Layer 1 — Cluster topology.</strong> One frame per cluster (production, staging, dev). Show namespaces as swim lanes, node groups as colored regions. Sticky notes carry current node counts and instance types.</li>
-  <li><strong>Layer 2 — Service communication map.</strong> Draw your services, their ports, and the protocols between them. Color edges by traffic type: internal gRPC, external HTTP, async event streams. Link each service to its Helm chart.</li>
-  <li><strong>Layer 3 — HPA and resource configs.</strong> A simple table frame per namespace: service name, CPU request/limit, memory request/limit, current HPA min/max. Update it in the Miro board, then copy to your YAML. One source of truth.</li>
-  <li><strong>Layer 4 — On-call annotations.</strong> During incidents, on-call engineers drop timestamped sticky notes directly on the affected component. After the post-mortem, those notes become permanent annotations — institutional memory baked into the diagram.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Kubernetes namespace swim lane layout showing pods, services, ingress controllers and config maps as glowing icons, dark terminal background with teal highlights, real-time annotation sticky notes overlaid on affected components"
-</div>
 
-<h2>Team Adoption: The Friday Update Ritual</h2>
-<p>The platform teams who stick with this approach all share one habit: a recurring 15-minute calendar block every Friday afternoon titled "Update the K8s board." It's not a meeting — it's a solo ritual. The engineer who touched the cluster that week spends 15 minutes reflecting changes in Miro. After three sprints, the board becomes the team's most-visited resource, displacing the wiki entirely.</p>
-<p>Pair this with a Miro board link in your runbook template, and every incident starts with a visual overview of the affected system — not a frantic search for documentation that may or may not be accurate.</p>
-<p>Platform teams spend too much time answering "how does our infrastructure work?" questions. <em>Grab the Kubernetes Architecture Template and let the diagram answer for you.</em></p>
-""",
-        },
-    ],
-    "🛠️ DevOps / SRE": [
-        {
-            "title": "Visualize Your CI/CD Pipeline in Miro — A Template for Every Team",
-            "description": "From GitHub Actions to complex multi-repo pipelines: how DevOps and platform engineers use Miro to document, onboard, and improve their delivery workflows.",
-            "demo": "Miro board: trigger → build → test → staging deploy → canary → prod. Each stage has linked runbooks and post-mortem notes embedded inline.",
-            "format": "Free Template Pack (5 pipelines)",
-            "cta": "Download the CI/CD Template Pack →",
-            "tags": ["devops", "cicd", "pipelines", "sre", "miro-templates", "platform-engineering"],
-            "seo_description": "Visualize your CI/CD pipeline in Miro — from GitHub Actions to multi-repo deployments. A template guide for DevOps and platform engineers.",
-            "read_time": "7 min read",
-            "hero_prompt": "CI/CD pipeline flowchart visualization on a dark terminal-inspired background, stages glowing in sequence from code commit through build test deploy to production, green checkmarks and orange warning indicators, cyberpunk aesthetic",
-            "body": """
-<p>Your CI/CD pipeline is your team's most critical shared system — and the one with the least documentation. Ask three engineers to describe the full delivery workflow and you'll get three different answers, each missing pieces the others take for granted. For new teammates, understanding the pipeline means weeks of tribal knowledge accumulation, not hours of reading.</p>
-
-<h2>Why Pipeline Docs Are Always Wrong</h2>
-<p>Most CI/CD documentation lives in two places: README files that describe the pipeline as it was designed six months ago, and the YAML config itself — which is accurate but impenetrable to anyone who doesn't already know what they're looking at. The missing layer is a visual representation that bridges intention and implementation: "here's what we're trying to do and why each stage exists."</p>
-<p>The consequences of bad pipeline documentation surface predictably: failed deployments that take hours to debug because nobody knows which stage introduced the regression, onboarding that drags for weeks, and post-mortems that reveal the team had conflicting mental models of how their own deployment works.</p>
-
-<h2>The Miro Framework: Pipeline Visualization in 5 Stages</h2>
-<ol>
-  <li><strong>Map the happy path first.</strong> Draw the end-to-end flow: trigger (commit/PR/tag) → build → test → artifact publish → staging deploy → smoke test → canary → full production. Resist adding exceptions until the main path is clear.</li>
-  <li><strong>Add gate logic.</strong> Mark every decision point: what does a failed test gate do? What triggers a rollback? Use diamond shapes for gates and color them by severity (green = auto-proceed, yellow = manual approval, red = auto-block).</li>
-  <li><strong>Embed runbooks inline.</strong> Each pipeline stage gets a linked Miro card with: what it does, what can go wrong, and the runbook link for when it does. On-call engineers thank you at 3 AM.</li>
-  <li><strong>Show the multi-repo picture.</strong> For complex systems with multiple repos or services, add a frame per service and show how they chain together with dependency arrows. Critical path is immediately visible.</li>
-  <li><strong>Annotate your environment strategy.</strong> Add a swim lane per environment (dev, staging, canary, prod) and show which pipeline stages touch which environment. Compliance reviewers love this view.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "CI/CD pipeline with glowing stage nodes: code commit, automated tests, Docker build, staging deployment, canary release, production — connected by animated arrows on dark background, green checkmarks and red failure states visible, DevOps visualization"
-</div>
+def _inherit_settings(upstream, enrich):
+    global UPSTREAM, ENRICH
+    UPSTREAM, ENRICH = upstream, enrich
 
-<h2>Team Adoption: Making It Part of the Post-Mortem</h2>
-<p>The most effective teams integrate pipeline board updates into their post-mortem process. Every incident that touches the delivery pipeline ends with a board annotation: what stage failed, what the fix was, and what guardrail was added. Over six months, the board becomes an institutional memory of every hard lesson the team has learned — visual, searchable, and immediately actionable for the next on-call engineer.</p>
-<p>Schedule a 30-minute "pipeline review" in your quarterly planning cycle. Pull up the Miro board, walk through each stage, and ask: "Is this still accurate? Is this still the right approach?" It's the most valuable 30 minutes of the quarter for your platform team.</p>
-<p>Delivery pipelines that are understood are pipelines that get improved. <em>Download the CI/CD Template Pack and give your whole team a shared mental model of how your software ships.</em></p>
-""",
-        },
-    ],
-    "🔐 Security": [
-        {
-            "title": "Collaborative Threat Modeling on Miro: A Developer's Guide",
-            "description": "Security doesn't have to happen in silos. This guide shows dev teams how to run STRIDE threat modeling sessions in Miro — mapping trust boundaries, attack surfaces, and mitigations together in real time.",
-            "demo": "Live threat model for a typical SaaS app: user → API gateway → auth service → DB. Each node color-coded by risk level, with mitigation sticky notes.",
-            "format": "Workshop Guide + Template",
-            "cta": "Run your first threat model session →",
-            "tags": ["security", "threat-modeling", "stride", "devsecops", "miro-templates", "appsec"],
-            "seo_description": "Run collaborative STRIDE threat modeling sessions in Miro — map attack surfaces, trust boundaries, and mitigations with your whole engineering team.",
-            "read_time": "8 min read",
-            "hero_prompt": "STRIDE threat model diagram on a dark background, nodes representing API gateway, auth service, and database with red threat arrows and green mitigation shields overlaid, security visualization, dark mode, red and green palette",
-            "body": """
-<p>Security reviews are too often a checkbox at the end of a project — a rushed 30-minute meeting where a security engineer skims an architecture doc they've never seen before and signs off under deadline pressure. The result: real threats get missed, mitigations are bolted on as afterthoughts, and the security team gets blamed when something breaks in production. The problem isn't lack of expertise. It's lack of shared context.</p>
-
-<h2>Why Siloed Security Reviews Fail</h2>
-<p>Traditional threat modeling — STRIDE, PASTA, attack trees — is powerful on paper and painful in practice. The tools are often heavyweight (dedicated software with steep learning curves), the output is hard to share (dense Word documents nobody reads), and the process is designed for security specialists, not the development teams who need to act on the findings.</p>
-<p>When security happens in a silo, developers see it as a blocker, not a collaborator. Threat models sit in a security team's shared drive, disconnected from the architecture diagrams developers actually use. Mitigations get forgotten. The same vulnerabilities get introduced sprint after sprint.</p>
-
-<h2>The Miro STRIDE Framework: 6 Steps to Collaborative Threat Modeling</h2>
-<ol>
-  <li><strong>Start with your data flow diagram.</strong> Draw every component, data store, external actor, and trust boundary on a Miro board. This is the shared foundation everyone in the room works from.</li>
-  <li><strong>Apply STRIDE categories.</strong> For each component and data flow, add color-coded sticky notes: Spoofing (red), Tampering (orange), Repudiation (yellow), Information Disclosure (purple), Denial of Service (blue), Elevation of Privilege (pink).</li>
-  <li><strong>Run the async review phase.</strong> Share the board 48 hours before the session. Let engineers, product managers, and the security team add their own threat notes asynchronously. You walk into the meeting with richer input than any single expert could generate alone.</li>
-  <li><strong>Score and prioritize threats.</strong> In the live session, use Miro voting to score threats by likelihood × impact. The board updates in real time, giving you a prioritized risk register by the end of the meeting.</li>
-  <li><strong>Map mitigations to components.</strong> For each high-priority threat, add a green sticky with the mitigation strategy and the engineering owner. This becomes your security backlog.</li>
-  <li><strong>Link to code and tickets.</strong> Connect each mitigation sticky to the relevant Jira ticket or GitHub issue. The threat model stays connected to actual remediation work.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "STRIDE threat model showing SaaS components — API gateway, auth service, user database — with colored threat annotation sticky notes (red, orange, yellow, purple, blue, pink) and green mitigation shields, dark security dashboard aesthetic"
-</div>
 
-<h2>Team Adoption: Threat Modeling as a Sprint Ritual</h2>
-<p>The teams that make threat modeling stick don't treat it as a project milestone — they treat it as a recurring sprint ritual. Every time a new feature introduces a data flow, API, or third-party integration, a 45-minute threat modeling session is automatically scheduled. The Miro board template is already there; you just add a new frame for the new feature.</p>
-<p>After three months, something shifts in the team culture: developers start thinking about trust boundaries during design, not after implementation. Security stops being a gate and becomes a design input. And when an auditor asks "how do you manage security risk?", you open the Miro board instead of scrambling for documentation.</p>
-<p>Security built collaboratively is security that actually holds. <em>Run your first STRIDE threat modeling session in Miro — the template takes 5 minutes to set up.</em></p>
-""",
-        },
-    ],
-    "🏗️ Architecture": [
-        {
-            "title": "System Design on a Whiteboard, Scaled to Your Whole Org",
-            "description": "How engineering orgs use Miro to replace one-off whiteboard sessions with living architecture docs that the whole team can read, comment on, and evolve over time.",
-            "demo": "A C4 model (Context → Container → Component) built in Miro, with drill-down navigation between levels and inline ADR (Architecture Decision Record) stickies.",
-            "format": "Deep Dive Post + C4 Template",
-            "cta": "Explore the C4 Model Template →",
-            "tags": ["architecture", "c4-model", "system-design", "adr", "miro-templates", "engineering"],
-            "seo_description": "Build a living C4 architecture model in Miro with embedded Architecture Decision Records — system design docs your whole org can read and evolve.",
-            "read_time": "7 min read",
-            "hero_prompt": "Multi-level C4 architecture diagram zooming from system context to containers to components, nested glowing boxes connected with arrows, dark background with glowing borders, architectural blueprint aesthetic, indigo and white palette",
-            "body": """
-<p>Your system architecture exists in three places simultaneously: in the heads of your senior engineers, in the whiteboard photos from last quarter's design session, and in the code itself — none of which a new engineer, product manager, or executive can actually use to understand how your system works. The gap between "we have architecture docs" and "anyone can understand our architecture" is where most engineering organizations permanently live.</p>
-
-<h2>Why One-Off Whiteboards Don't Scale</h2>
-<p>Whiteboard sessions are great for reaching alignment in the moment. They're terrible for preserving that alignment over time. The photo fades from everyone's Slack history. The decisions get lost in meeting notes nobody reads. Six months later, a new engineer makes the same architectural mistake you already solved, because the reasoning behind the current design was never captured in a place they could find it.</p>
-<p>Architecture Decision Records (ADRs) solve the "why" problem in text, but they create a new problem: the context that makes an ADR meaningful — the diagram it references, the alternative it rejected — lives in a completely different system. The connection breaks as soon as someone changes the architecture.</p>
-
-<h2>The Miro C4 Framework: Four Levels of Clarity</h2>
-<ol>
-  <li><strong>Level 1 — System Context.</strong> One frame showing your system as a single box, surrounded by the people and external systems that interact with it. Audience: everyone, including non-technical stakeholders. Answer: "What does this system do and who uses it?"</li>
-  <li><strong>Level 2 — Container Diagram.</strong> Zoom in to show the major deployable units: web app, API, database, background workers, external services. Audience: developers and architects. Answer: "How is the system divided and how do the parts communicate?"</li>
-  <li><strong>Level 3 — Component Diagram.</strong> For each container, show its internal components and their responsibilities. Audience: the engineers building that container. Answer: "How is this container structured internally?"</li>
-  <li><strong>ADR Stickies.</strong> At every level, pin Architecture Decision Record stickies to the relevant component: "Why we chose PostgreSQL over MongoDB," "Why we went with a monolith first," "Why we're using event sourcing here." Decisions stay permanently connected to their context.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "C4 architecture model showing three nested zoom levels — system context, containers, and components — as glowing rectangular frames on dark background, drill-down navigation arrows between levels, architectural blueprint aesthetic with indigo highlights"
-</div>
+# ─── BUILD CACHE ───────────────────────────────────────────────────────────────
+# Every stage is keyed by a hash of its inputs plus the code version, so a
+# cached result can never outlive a change to the data or to this file.
 
-<h2>Team Adoption: Architecture as a Living Document</h2>
-<p>The most successful implementations treat the Miro C4 board as a first-class engineering artifact — not documentation, but design infrastructure. The rule is simple: if you're proposing an architectural change, you update the board before the PR is merged. The PR description includes a link to the Miro board showing the before and after state.</p>
-<p>This creates a virtuous cycle: the board is always accurate because changes require it to be updated; the board is trusted because it's always accurate; engineers consult the board because they trust it. Within a quarter, your senior engineers stop being the single point of contact for "how does our system work?" questions.</p>
-<p>Great architecture isn't just built — it's explained. <em>Start with the C4 Model Template and give your organization the architectural clarity it has been missing.</em></p>
-""",
-        },
-    ],
-    "🌐 Web / Frontend": [
-        {
-            "title": "Frontend Architecture Maps: How to Onboard Engineers in Half the Time",
-            "description": "Miro as the missing layer between your code and your docs — showing how frontend teams map component hierarchies, data flow, and routing so new engineers hit the ground running.",
-            "demo": "React app architecture: routing tree, state management layers (Zustand/Redux), API boundaries — all in one scrollable Miro board with code links.",
-            "format": "Blog Post + Template",
-            "cta": "See the Frontend Architecture Template →",
-            "tags": ["frontend", "react", "architecture", "onboarding", "miro-templates", "web-development"],
-            "seo_description": "Cut frontend onboarding time in half with a Miro architecture map — component hierarchies, data flow, and routing all in one collaborative board.",
-            "read_time": "6 min read",
-            "hero_prompt": "React frontend architecture map showing component hierarchy tree, state management layers, and API boundaries as glowing connected nodes on dark background, colorful lines connecting components, modern web development visualization",
-            "body": """
-<p>The first week for a new frontend engineer follows a predictable arc: clone the repo, spend two hours getting the dev environment running, then spend two more hours trying to understand why there are four different state management patterns in the same codebase, who owns which components, and where the API calls actually live. By day three, they're productive. By week two, they're slowing down senior engineers with questions that a good architecture map would have answered immediately.</p>
-
-<h2>Why Frontend Architecture Is Hardest to Document</h2>
-<p>Backend systems have decades of tooling for architecture visualization — ERDs, service maps, flow diagrams. Frontend architecture has almost none, despite being just as complex. A modern React application involves routing trees, state management layers, component hierarchies, API boundaries, and build pipeline configuration — and the relationships between all of these are implicit in the code, not visible anywhere else.</p>
-<p>The result: frontend architecture lives entirely in senior engineers' heads. When they leave, the knowledge leaves with them. When you hire, onboarding takes weeks that should take days. And when you need a significant refactor, you're flying blind — unable to see the full blast radius before making the change.</p>
-
-<h2>The Miro Framework: Frontend Architecture in 4 Views</h2>
-<ol>
-  <li><strong>The routing tree.</strong> Draw every route in your application as a tree. Mark which routes are public vs. authenticated, which are lazy-loaded, and which share layouts. New engineers can see the entire navigation structure at a glance.</li>
-  <li><strong>State management topology.</strong> Map your state: global store (Zustand, Redux, Jotai), server state (React Query, SWR), local component state, and URL state. Draw which components read from and write to each state source. This is the view that prevents the "why is this component re-rendering?" debug session.</li>
-  <li><strong>API boundaries and data flow.</strong> Show which components fetch data, which transform it, and which display it. Draw the API endpoints they call. This view is gold during onboarding and indispensable during debugging.</li>
-  <li><strong>Component ownership map.</strong> Organize components by team or feature area. Mark which are shared design system components, which are feature-specific, and which are currently being refactored. Prevents accidental coupling between feature teams.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "React application architecture map with component hierarchy tree on the left, state management topology in the center, and API boundary diagram on the right, connected by glowing data flow arrows, dark mode visualization, blue and purple palette"
-</div>
+CACHE_STATS = {"hits": 0, "misses": 0}
 
-<h2>Team Adoption: The Living Frontend Docs Habit</h2>
-<p>Frontend architecture boards work best when updated continuously rather than in big batches. The habit to build: any PR that adds a new route, introduces a new state pattern, or changes a major component boundary includes a Miro board update in the PR checklist. It takes five minutes per PR and means the board is always accurate.</p>
-<p>Use the board in sprint planning to identify coupling risks before they become bugs. Use it in architecture reviews to give stakeholders a visual before committing to a refactor. And use it in onboarding — new frontend engineers report that a good architecture board cuts their ramp-up time in half.</p>
-<p>Great frontend teams build great documentation habits. <em>Get the Frontend Architecture Template and give your next new hire the map they wish they had on day one.</em></p>
-""",
-        },
-    ],
-    "🗄️ Databases": [
-        {
-            "title": "Database Schema Design in Miro: From ERD to Production",
-            "description": "How data teams and backend engineers use Miro to collaboratively design schemas, map data lineage, and communicate database decisions across product and infra — all before writing a single migration.",
-            "demo": "An ERD for a multi-tenant SaaS built live in Miro, with sharding strategy annotated, and query performance notes per table.",
-            "format": "Tutorial + ERD Template",
-            "cta": "Download the Schema Design Template →",
-            "tags": ["databases", "erd", "data-modeling", "postgres", "miro-templates", "backend"],
-            "seo_description": "Design database schemas collaboratively in Miro — build ERDs, map data lineage, and communicate data decisions before writing a single migration.",
-            "read_time": "6 min read",
-            "hero_prompt": "Entity-relationship diagram (ERD) for a multi-tenant SaaS glowing on dark background, table boxes with columns connected by crow-foot notation arrows, data lineage flowing between tables and analytics pipelines, dark mode visualization, amber and teal",
-            "body": """
-<p>Database schema decisions are permanent in a way that most engineering choices aren't. You can refactor code, rewrite services, re-architect your backend — but a poorly designed schema that's been live in production for a year generates migration debt that follows a team for a decade. And yet, in most organizations, schema design happens in a developer's local environment, reviewed in a GitHub PR that nobody outside engineering can meaningfully comment on, and documented nowhere.</p>
-
-<h2>Why Schema Design Happens Too Late</h2>
-<p>The standard workflow — write the migration, open the PR, get it reviewed by one engineer who approves it in 10 minutes — treats schema design as an implementation detail rather than an architectural decision. Product managers, data analysts, and data engineers who will live with the schema for years have no input. The people who know the business domain best aren't in the room when the modeling decisions are made.</p>
-<p>This creates predictable failure modes: schemas that don't support the query patterns that emerge six months later, normalization choices that make reporting queries impossibly slow, and multi-tenant data isolation decisions that weren't fully thought through until the first security audit.</p>
-
-<h2>The Miro Framework: Collaborative Schema Design in 5 Steps</h2>
-<ol>
-  <li><strong>Start with an entity map, not a schema.</strong> Before opening your database client, draw the domain entities on a Miro board — just boxes and relationship lines. Invite product managers and data engineers to this view. They'll catch modeling mistakes before any SQL is written.</li>
-  <li><strong>Layer in the ERD.</strong> Once entity relationships are agreed on, formalize them into an ERD with actual column names, types, and constraints. Use Miro's table shapes or the built-in ERD diagramming tool.</li>
-  <li><strong>Annotate query patterns.</strong> For each major table, add sticky notes showing the top 3 queries that will run against it. This drives index design conversations before you're optimizing production queries at 2 AM.</li>
-  <li><strong>Map data lineage.</strong> Draw arrows showing how data flows between tables, microservices, and data pipelines. Highlight tables read by analytics, those that feed event streams, and those written by external services.</li>
-  <li><strong>Document sharding and tenancy strategy.</strong> For multi-tenant systems, add a frame showing your tenancy model — shared schema, separate schemas, or separate databases per tenant — with trade-offs visible to everyone.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Database data lineage diagram showing tables flowing data into analytics pipelines and event streams, ERD overlay with crow-foot notation, dark background with glowing amber data flow paths and teal table borders, technical data engineering visualization"
-</div>
 
-<h2>Team Adoption: Schema Reviews Before Migrations</h2>
-<p>The most impactful change a team can make: require a Miro board review before any significant schema migration is written. Post the board link in the design review channel, give it 48 hours for async comment, then spend 30 minutes in a synchronous review with the data engineer and product manager most affected by the change. The migrations that result from this process are dramatically better than those designed in isolation.</p>
-<p>Teams that implement this consistently report a meaningful reduction in major schema revisions — not because they're doing less, but because they catch mistakes early, when they're cheap to fix.</p>
-<p>Schema decisions made in public are schema decisions made well. <em>Download the Schema Design Template and start your next data model with the whole team in the room.</em></p>
-""",
-        },
-    ],
-    "🧪 Testing / QA": [
-        {
-            "title": "Test Coverage Maps: Visualize What You're Actually Testing",
-            "description": "Beyond line coverage percentages — how engineering teams map their test pyramid, identify blind spots, and align QA strategy using Miro boards in sprint planning.",
-            "demo": "A test pyramid in Miro: unit → integration → e2e, with color-coded coverage by feature area and links to failing test suites.",
-            "format": "Blog Post + Workshop Template",
-            "cta": "Map your test coverage in Miro →",
-            "tags": ["testing", "qa", "test-pyramid", "coverage", "miro-templates", "quality-engineering"],
-            "seo_description": "Visualize your test pyramid and identify coverage blind spots in Miro — map unit, integration, and e2e tests by feature area with your whole team.",
-            "read_time": "5 min read",
-            "hero_prompt": "Test pyramid visualization on dark background, three glowing tiers representing unit tests at base, integration tests in middle, and end-to-end tests at apex, color-coded coverage grid showing feature areas in green yellow and red, QA engineering illustration",
-            "body": """
-<p>Your team has 87% line coverage. The dashboard is green. Then a critical user flow breaks in production because nobody was testing the integration between the payment service and the notification system — a gap that would have been obvious on a test coverage map, but invisible in a coverage percentage. Line coverage metrics tell you what percentage of your code is executed during tests. They don't tell you whether you're testing the right things.</p>
-
-<h2>Why Coverage Numbers Lie</h2>
-<p>The coverage number is a proxy metric that the industry has elevated to a north star metric, often to its detriment. Teams optimize for the number — hitting 80%, then 90% — without asking whether the tests they're writing actually protect against the failures that matter. Unit tests on pure functions are cheap to write and inflate coverage metrics without adding much protection. Tests on complex integration paths are hard to write but prevent the failures that actually wake up on-call engineers.</p>
-<p>The deeper problem: without a visual map, it's impossible to answer the question "what are we not testing?" You can see coverage per file, per function, per line — but you can't see which user journeys, which integration paths, or which risk areas have no test coverage at all.</p>
-
-<h2>The Miro Framework: Building a Test Coverage Map</h2>
-<ol>
-  <li><strong>Draw the test pyramid.</strong> Three tiers: unit tests at the base (fast, isolated, many), integration tests in the middle (testing component interactions), end-to-end tests at the apex (complete user flows, fewer). This shared model aligns your whole team on testing philosophy.</li>
-  <li><strong>Map coverage by feature area.</strong> Divide your application into feature areas (auth, payment flow, notifications, data export) and assign each a column. For each feature × test tier intersection, assess coverage: green (well-covered), yellow (partial), red (minimal or none).</li>
-  <li><strong>Identify the critical paths.</strong> Mark the user journeys that, if broken, would cause the most user pain or business impact. These are your highest-priority coverage targets regardless of what the line coverage number says.</li>
-  <li><strong>Add test suite health notes.</strong> For each area, sticky notes capture: flaky tests (name them!), tests that are slow, tests not updated since a major refactor. This is your technical debt backlog for the testing layer.</li>
-  <li><strong>Link to failing tests.</strong> Connect red areas to CI dashboard links and open tickets. The map becomes an actionable backlog, not just a diagnostic.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Test coverage grid visualization showing feature areas as columns and test pyramid tiers as rows, green cells for well-covered areas, yellow for partial, red for gaps, glowing on dark background, QA engineering dashboard aesthetic with clean typography"
-</div>
+def content_hash(value):
+    """Stable SHA-256 of any JSON-serializable value."""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-<h2>Team Adoption: Coverage Review in Sprint Planning</h2>
-<p>The most effective use of a test coverage map is in sprint planning. Before committing to new feature work, spend 10 minutes reviewing the map: "Are we adding tests for the new feature? What existing coverage gaps does this sprint create the opportunity to close?"</p>
-<p>Pair the coverage map with a "testing debt" sprint story every three sprints — a dedicated allocation for closing the highest-priority coverage gaps. Teams that do this see fewer production incidents and faster debugging when incidents do happen, because the test suite reliably narrows the search space.</p>
-<p>Testing strategy deserves the same architectural rigor as system design. <em>Map your test coverage in Miro and finally answer the question: what are we not testing?</em></p>
-""",
-        },
-    ],
-    "🎨 Dev Experience": [
-        {
-            "title": "Developer Onboarding Boards That Don't Suck",
-            "description": "The best onboarding experience a new engineer can get: a Miro board that maps the entire system, annotated with 'start here' paths, gotchas, and links to code — built by the team, for the team.",
-            "demo": "Day 1 onboarding board: team structure → codebase map → dev environment setup → first PR checklist → who to ask for what.",
-            "format": "Template + Blog Post",
-            "cta": "Get the Engineering Onboarding Template →",
-            "tags": ["developer-experience", "onboarding", "dx", "documentation", "miro-templates", "engineering"],
-            "seo_description": "Build developer onboarding boards in Miro that new engineers actually use — codebase maps, first-PR checklists, and who-to-ask guides all in one place.",
-            "read_time": "5 min read",
-            "hero_prompt": "Developer onboarding board showing team structure, codebase map, and first PR checklist as interconnected glowing nodes, warm amber paths guiding a new engineer through their first week on dark background, welcoming tech visualization",
-            "body": """
-<p>The first PR a new engineer merges should happen in their first week. In most organizations, it happens in their third. The gap isn't talent — it's friction. Friction from a dev environment setup that requires tribal knowledge to get working. Friction from a codebase with no map. Friction from not knowing which Slack channel to ask for help without feeling like you're bothering someone. Good onboarding eliminates friction. Most onboarding just documents it.</p>
-
-<h2>Why Most Onboarding Documentation Doesn't Work</h2>
-<p>Engineering onboarding docs share a universal failure mode: they're written by senior engineers who've forgotten what it's like to not know things, last updated during a sprint where someone had too much spare time, and structured around what the team thought was important rather than what a new person needs to know first.</p>
-<p>The other failure mode is format. Long markdown docs in a wiki require a level of contextual understanding to parse that the new engineer doesn't yet have. "Set up your local environment by following CONTRIBUTING.md" is useless when you don't know what any of the tools mentioned are or why you need them.</p>
-
-<h2>The Miro Framework: The Engineering Onboarding Board</h2>
-<ol>
-  <li><strong>The "Start Here" path.</strong> A visual, numbered trail through the board — like a guided tour — that explicitly sequences the information a new engineer needs. Start: team structure and who to ask for what. Then: codebase overview. Then: dev environment setup with screenshots. Then: first PR checklist.</li>
-  <li><strong>The codebase map.</strong> A diagram showing the major repositories, their purposes, and how they relate. Link each box to the actual GitHub repo. Color codes: green = stable/mature, yellow = active development, red = known issues / scheduled for refactor. New engineers instantly know which areas to explore and which to approach with caution.</li>
-  <li><strong>The "who to ask" guide.</strong> A Miro frame with team members, their areas of ownership, and their preferred contact method. Eliminates the anxiety of "am I asking the right person?" that slows down new engineers for their first month.</li>
-  <li><strong>First PR checklist.</strong> A visual checklist of everything needed before opening a PR: linting, tests passing, docs updated, PR template filled out, code review assigned. Interactive checkboxes appreciated.</li>
-  <li><strong>Gotchas and institutional knowledge.</strong> A frame just for "things we wish someone had told us" — the surprising behavior in the deployment pipeline, the Slack channel that sounds unrelated but is actually important, the testing shortcut that saves 20 minutes. Crowdsourced from the whole team.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Developer onboarding journey map with numbered stages — team introduction, codebase tour, environment setup, first PR — connected by warm glowing trail on dark background, sticky notes with tips and gotchas attached to each stage, friendly tech illustration"
-</div>
 
-<h2>Team Adoption: The Board Built by the Team, for the Team</h2>
-<p>The secret to an onboarding board that stays useful: every new engineer, during their first two weeks, adds at least one thing to the "gotchas" frame that they wish they'd known earlier. This creates a flywheel — the board gets more useful with each hire, and new engineers contribute to the team from their very first week.</p>
-<p>Assign the most recent new engineer as the "onboarding board maintainer." They're best positioned to know what's missing or misleading, and the responsibility gives them ownership of a team artifact from day one.</p>
-<p>The best onboarding experience is one that new engineers wish they'd had at every previous company. <em>Get the Engineering Onboarding Template and give your next hire the start they deserve.</em></p>
-""",
-        },
-    ],
-    "🦀 Languages": [
-        {
-            "title": "Rust Ownership & Borrowing, Visualized: Teaching Hard Concepts with Miro",
-            "description": "How developer advocates and educators use Miro to turn notoriously complex language concepts (ownership, lifetimes, async) into interactive visual explainers that engineers actually bookmark.",
-            "demo": "An animated Miro board stepping through a Rust ownership example — stack frames, heap allocations, and borrow checker rules all drawn out live.",
-            "format": "Educational Post + Interactive Board",
-            "cta": "Open the interactive explainer →",
-            "tags": ["rust", "programming", "ownership", "visualization", "miro-templates", "languages"],
-            "seo_description": "Teach Rust's ownership and borrowing model with interactive Miro visualizations — turn the borrow checker into an approachable, visual concept for your team.",
-            "read_time": "7 min read",
-            "hero_prompt": "Rust programming language ownership diagram with stack and heap memory visualized as glowing labeled boxes, ownership arrows moving between scopes, mutable and immutable borrow markers, dark background with rust-orange and steel-blue color scheme",
-            "body": """
-<p>Rust's ownership system is one of the most powerful ideas in systems programming — and one of the most difficult to teach. The borrow checker enforces rules that are logically consistent and learnable, but deeply counterintuitive to engineers who've spent years working in garbage-collected languages. The result: learning Rust takes longer than it should, not because the concepts are inherently hard, but because most learning resources are primarily textual in a domain where visuals make everything click faster.</p>
-
-<h2>Why Text-Based Rust Education Falls Short</h2>
-<p>The Rust book is excellent. The rustlings exercises are well-designed. And yet, engineers routinely report spending days fighting the borrow checker on concepts that, once explained visually, become immediately intuitive. "A value can have only one owner" is an abstract statement. A diagram showing a value moving from one stack frame to another — and disappearing from the first — is a mental model that sticks.</p>
-<p>The problem extends beyond individual learning. Teams adopting Rust need shared mental models: what does it mean to "move" a value in a code review? How do you reason about lifetimes in an API design? When is an <em>Arc&lt;Mutex&lt;T&gt;&gt;</em> the right choice? These conversations are faster and more productive when the team shares a visual vocabulary.</p>
-
-<h2>The Miro Framework: Visualizing Rust Concepts</h2>
-<ol>
-  <li><strong>Ownership diagrams.</strong> For each code example, draw the stack and heap side by side. Show values as labeled boxes. Draw arrows for ownership. When a move happens, redraw the arrow to its new owner and visually erase it from the previous one. The borrow checker's rules become self-evident.</li>
-  <li><strong>Borrow visualizations.</strong> Show immutable borrows as read-only arrows (multiple allowed simultaneously). Show mutable borrows as exclusive arrows (only one at a time, blocks immutable borrows). This visual makes the borrow checker's invariants immediately legible.</li>
-  <li><strong>Lifetime scope diagrams.</strong> Draw scopes as nested boxes. Show a borrow's lifetime as a colored region that must not outlive the value it borrows. Lifetime annotation syntax suddenly makes sense when you can see what the <em>'a</em> represents spatially.</li>
-  <li><strong>Async ownership flow.</strong> For async Rust, draw a timeline showing when ownership moves across await points. Show which values must be Send and why. This is the visualization that unlocks async Rust for engineers who've been stuck.</li>
-  <li><strong>Pattern decision tree.</strong> A flowchart for "which smart pointer should I use?" — from simple owned values through <em>Box</em>, <em>Rc</em>, <em>Arc</em>, <em>Mutex</em> — with decision criteria at each fork. Teams use this in code reviews to align on ownership patterns.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Rust borrow checker visualization showing stack and heap memory as glowing labeled boxes, ownership transfer arrows between scopes, mutable borrow shown as exclusive red arrow, immutable borrows as shared blue arrows, dark background, rust-orange and steel-blue palette"
-</div>
+@functools.lru_cache(maxsize=None)
+def _files_digest(*paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()[:16]
 
-<h2>Team Adoption: Visual Rust Reviews</h2>
-<p>Engineering teams adopting Rust report that the biggest accelerator isn't better documentation — it's better communication patterns. Starting a "visual Rust review" practice — where complex ownership or lifetime questions get drawn out on the Miro board before being answered in text — dramatically reduces the time senior Rust engineers spend unblocking teammates.</p>
-<p>The board also serves as a growing library. Every time a tricky ownership pattern gets solved visually, the diagram stays on the board as a reference. After six months, you have a custom visual Rust guide tailored to the exact patterns your codebase uses.</p>
-<p>The borrow checker isn't your enemy — it's a collaborator that rewards clear thinking. <em>Open the interactive Rust Ownership Explainer and see the concepts click in a way they never did in a text editor.</em></p>
-""",
-        },
-    ],
-}
 
-DEFAULT_RECS = [
-    {
-        "title": "Engineering Team Rituals, Visualized: Standups, Retros & More in Miro",
-        "description": "How high-performing engineering teams run their core rituals — standup, sprint planning, retros, and incident reviews — asynchronously and visually in Miro, cutting meeting time by 40%.",
-        "demo": "A complete sprint board: backlog → in-progress → done, with inline retro stickies, velocity chart, and blocked items highlighted.",
-        "format": "Playbook + 5 Templates",
-        "cta": "Download the Engineering Rituals Template Pack →",
-        "topic": "🔧 Engineering",
-        "tags": ["engineering", "team-rituals", "agile", "retros", "miro-templates", "productivity"],
-        "seo_description": "Run your engineering team's core rituals — standups, retros, sprint planning, and incident reviews — async and visually in Miro.",
-        "read_time": "5 min read",
-        "hero_prompt": "Engineering team sprint board with backlog, in-progress, and done swim lanes as glowing columns, retro sticky notes and velocity chart overlaid, dark background with purple sprint highlights and green completion indicators",
-        "body": """
-<p>Engineering rituals are the connective tissue of a high-performing team — standups, sprint planning, retrospectives, incident reviews. Done well, they align the team, surface blockers, and drive continuous improvement. Done poorly, they waste 20% of the team's week and leave everyone feeling like they could have sent an email. The difference is rarely the ritual itself; it's the tooling and structure around it.</p>
-
-<h2>Why Meeting-Heavy Rituals Don't Scale</h2>
-<p>Most engineering teams run their rituals synchronously by default — everyone in a video call at the same time, waiting for their turn to share an update. This works at 5 people. At 15 people, standup takes 25 minutes. At 25 people, you've split into sub-teams and lost the cross-team visibility that made standup valuable in the first place.</p>
-<p>The ritual infrastructure hasn't kept pace with team size. A virtual sticky note board gets teams partway there, but without a structured template, each ritual devolves into a blank canvas that someone has to organize from scratch every sprint.</p>
-
-<h2>The Miro Framework: Five Core Engineering Rituals</h2>
-<ol>
-  <li><strong>Async standup.</strong> A daily Miro frame with three columns: Done Yesterday, Doing Today, Blockers. Engineers update their row asynchronously. Blockers get a red sticky; the Scrum Master scans them in 5 minutes instead of a 20-minute meeting.</li>
-  <li><strong>Sprint planning board.</strong> Backlog → Sprint → In Progress → Done. Each card links to the Jira ticket. Story point estimates visible at a glance. Capacity planning via swim lanes per engineer.</li>
-  <li><strong>Retrospective template.</strong> Four quadrants: Went Well, Could Improve, Action Items, Kudos. Team adds stickies async before the meeting; the sync session focuses on discussion and actions, not brainstorming. 45 minutes instead of 90.</li>
-  <li><strong>Incident review board.</strong> Timeline of the incident, contributing factors, detection lag, and action items — all visible in one frame. Linked to the post-mortem doc. Referenced in the next sprint planning for remediation tickets.</li>
-  <li><strong>Velocity and health dashboard.</strong> A simple chart frame updated each sprint: story points completed, escaped defects, on-call incidents. Not for management — for the team to see their own trajectory.</li>
-</ol>
-
-<div class="image-callout">
-  <strong>🎨 Mid-Post Image Suggestion</strong><br>
-  <em>AI prompt:</em> "Agile sprint board with four swim lanes showing team members' work items in backlog, in-progress, review, and done states, colorful sticky notes and a velocity trend chart in the corner, dark background with purple sprint cycle highlights"
-</div>
+def code_version():
+    """Hash of this file and the current template library — any edit, or a
+    --dashboards entry with its own library, invalidates the cache."""
+    return _files_digest(__file__, TEMPLATES_PATH)
 
-<h2>Team Adoption: The Ritual Refresh</h2>
-<p>The most common failure mode for Miro-based rituals: teams set them up with enthusiasm, use them for two sprints, and then revert to the old way when the board gets cluttered and nobody takes ownership of maintaining it. The fix is simple: assign a "board keeper" role that rotates each sprint. Their job is to archive last sprint's board, set up the new one, and ensure everyone knows where to go. 30 minutes of work that keeps the whole team's ritual infrastructure clean.</p>
-<p>Teams that run async rituals consistently report meaningful time savings per engineer per week — reclaimed for actual engineering. The rituals become more valuable, not less, because the focused sync time is used for discussion rather than status updates.</p>
-<p>The best meetings are the ones that are short because the async work was done first. <em>Download the Engineering Rituals Template Pack and run your next sprint on autopilot.</em></p>
-""",
-    },
-]
+
+def _tmp_path(path):
+    """Where to write path before os.replace() swaps it in: unique per process
+    and thread, so concurrent writers of one file never share a temp file."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _write_json_atomic(path, value):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def cached_stage(stage, inputs, compute):
+    """Return compute() for these inputs, reusing an identical earlier result from disk."""
+    with span(stage, "stage") as s:
+        key = content_hash([stage, code_version(), inputs])
+        path = os.path.join(CACHE_DIR, stage.replace(":", "-"), key[:2], key + ".json")
+        try:
+            if PROFILER:
+                raise OSError("--profile measures the work, not the cache")
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)  # keep recently used entries out of prune_cache()
+            CACHE_STATS["hits"] += 1
+            s.set(cache="hit")
+            return result
+        except (OSError, ValueError):
+            pass
+        result = compute()
+        CACHE_STATS["misses"] += 1
+        s.set(cache="miss")
+        try:
+            _write_json_atomic(path, result)
+        except (OSError, TypeError) as e:
+            print(f"  ⚠️  cache write failed ({stage}): {e}")
+        return result
+
+
+def prune_cache(max_age_days=CACHE_MAX_AGE_DAYS):
+    """Drop cache entries that no build has touched in max_age_days."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for root, _dirs, files in os.walk(CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+    return removed
+
+
+# Classification memo: title+description digest → topic, persisted per
+# TOPIC_KEYWORDS version so editing the keywords invalidates it.
+_topic_memo = None
+_topic_memo_used = set()
+
+
+def _topic_memo_path():
+    return os.path.join(CACHE_DIR, "classify", content_hash([code_version(), TOPIC_KEYWORDS])[:16] + ".json")
+
+
+def _load_topic_memo():
+    global _topic_memo
+    if _topic_memo is None:
+        try:
+            with open(_topic_memo_path(), encoding="utf-8") as f:
+                _topic_memo = json.load(f)
+        except (OSError, ValueError):
+            _topic_memo = {}
+    return _topic_memo
+
+
+def save_topic_memo():
+    """Persist the classifications used by this run (older ones are dropped)."""
+    if _topic_memo is None:
+        return
+    try:
+        _write_json_atomic(_topic_memo_path(), {k: _topic_memo[k] for k in _topic_memo_used if k in _topic_memo})
+    except OSError as e:
+        print(f"  ⚠️  cache write failed (classify): {e}")
+
+
+def write_if_changed(path, html):
+    """Write html to path unless the file already holds a page with the same fingerprint."""
+    match = re.search(r'<meta name="ebm-fingerprint" content="([0-9a-f]+)">', html[:2048])
+    if match:
+        try:
+            with open(path, encoding="utf-8") as f:
+                if match.group(0) in f.read(2048):
+                    return False
+        except OSError:
+            pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return True
+
+
+def _topic_key(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=10).hexdigest()
 
 
 def classify_topic(title, description=""):
     text = (title + " " + description).lower()
+    memo = _load_topic_memo()
+    key = _topic_key(text)
+    _topic_memo_used.add(key)
+    if key in memo:
+        return memo[key]
+    memo[key] = _classify_text(text)
+    return memo[key]
+
+
+def remember_topic(key, topic):
+    """Record a classification made in a worker process so save_topic_memo keeps it."""
+    _load_topic_memo()[key] = topic
+    _topic_memo_used.add(key)
+
+
+def _classify_text(text):
     for topic, keywords in TOPIC_KEYWORDS.items():
         for kw in keywords:
             if kw in text:
@@ -603,36 +851,44 @@ def classify_topic(title, description=""):
     return "🔧 Engineering"
 
 
+def iso_timestamp(value):
+    """Epoch seconds for an ISO-8601 string such as "2026-10-12T09:30:00Z", 0 if unparseable."""
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except (AttributeError, ValueError):
+        return 0
+
+
 def fetch_hn_top(limit=30):
     print("  Fetching Hacker News...")
-    articles = []
+    count = 0
     try:
-        ids = requests.get(HN_TOP_STORIES_URL, timeout=8).json()[:limit]
+        ids = http_get(HN_TOP_STORIES_URL, timeout=8).json()[:limit]
         for item_id in ids[:limit]:
             try:
-                item = requests.get(HN_ITEM_URL.format(item_id), timeout=5).json()
+                item = http_get(HN_ITEM_URL.format(item_id), timeout=5).json()
                 if item and item.get("type") == "story" and item.get("title"):
-                    articles.append({
+                    yield {
                         "title": item.get("title", ""),
                         "url": item.get("url", f"https://news.ycombinator.com/item?id={item_id}"),
                         "score": item.get("score", 0),
                         "source": "Hacker News", "source_icon": "🟠",
-                        "topic": classify_topic(item.get("title", "")),
                         "comments_url": f"https://news.ycombinator.com/item?id={item_id}",
                         "comments": item.get("descendants", 0),
                         "date": datetime.fromtimestamp(item.get("time", 0)).strftime("%b %d") if item.get("time") else "",
-                    })
+                        "published": item.get("time", 0),
+                    }
+                    count += 1
             except Exception:
                 continue
     except Exception as e:
         print(f"  ⚠️  HN error: {e}")
-    print(f"  ✅ HN: {len(articles)} articles")
-    return articles
+    print(f"  ✅ HN: {count} articles")
 
 
 def fetch_devto(limit=20):
     print("  Fetching dev.to...")
-    articles = []
+    count = 0
     endpoints = [
         f"{DEVTO_API_URL}?per_page={limit}&top=7",
         f"{DEVTO_API_URL}?per_page={limit}&tag=programming&top=3",
@@ -642,136 +898,238 @@ def fetch_devto(limit=20):
     seen = set()
     for url in endpoints:
         try:
-            data = requests.get(url, timeout=8, headers={"User-Agent": "EngBrandMachine/1.0"}).json()
+            data = http_get(url, timeout=8, headers={"User-Agent": "EngBrandMachine/1.0"}).json()
             for a in data:
                 if a.get("id") not in seen:
                     seen.add(a.get("id"))
-                    articles.append({
+                    yield {
                         "title": a.get("title", ""),
                         "url": a.get("url", ""),
                         "score": a.get("positive_reactions_count", 0) + a.get("comments_count", 0) * 2,
                         "source": "dev.to", "source_icon": "🟣",
-                        "topic": classify_topic(a.get("title", ""), a.get("description", "")),
+                        "_classify": (a.get("title", ""), a.get("description", "")),
                         "comments_url": a.get("url", ""),
                         "comments": a.get("comments_count", 0),
                         "date": a.get("published_at", "")[:10] if a.get("published_at") else "",
+                        "published": iso_timestamp(a.get("published_at")),
                         "reading_time": a.get("reading_time_minutes", 0),
-                    })
+                    }
+                    count += 1
         except Exception as e:
             print(f"  ⚠️  dev.to error ({url[:50]}): {e}")
-    print(f"  ✅ dev.to: {len(articles)} articles")
-    return articles
-
-
-def fetch_rss_feeds():
-    print("  Fetching RSS feeds...")
-    articles = []
-    for name, url in RSS_FEEDS:
+    print(f"  ✅ dev.to: {count} articles")
+
+
+def _download_feed(url, parse_pool):
+    """Download one feed and queue it for parsing; returns the parse future."""
+    resp = http_get(url, headers=FEED_HEADERS, timeout=10)
+    resp.raise_for_status()
+    return parse_pool.submit(_parse_feed, resp.content, TRACER is not None)
+
+
+def _parse_feed(raw, traced=False):
+    """Parse + classify one feed document. Runs in a worker process, so it
+    returns compact (title, link, date, published, topic_key, topic, summary)
+    tuples rather than article dicts; the parent turns them into articles and records the topics.
+    Also returns the worker's trace event when the parent is tracing."""
+    timer = _Span(None, "parse feed", "parse", {"bytes": len(raw)}).__enter__() if traced else None
+    memo = _load_topic_memo()
+    records = []
+    for entry in feedparser.parse(raw).entries[:8]:
+        title = entry.get("title", "")
+        link = entry.get("link", "")
+        if title and link:
+            text = (title + " " + entry.get("summary", "")).lower()
+            key = _topic_key(text)
+            topic = memo[key] if key in memo else _classify_text(text)
+            parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            published = int(datetime(*parsed[:6], tzinfo=timezone.utc).timestamp()) if parsed else 0
+            records.append((title, link, (entry.get("published") or "")[:10], published, key, topic,
+                            entry.get("summary", "")[:RSS_SUMMARY_CHARS]))
+    return records, timer.event() if timer else None
+
+
+def _feed_parse_pool():
+    from concurrent.futures import ThreadPoolExecutor
+    if PROFILER:
+        return _InlineExecutor()
+    try:
+        return _process_pool(RSS_PARSE_WORKERS)
+    except (OSError, NotImplementedError) as e:
+        # No working multiprocessing (some sandboxes/serverless runtimes): parse serially
+        print(f"    ⚠️  process pool unavailable ({e}), parsing feeds in-process")
+        return ThreadPoolExecutor(max_workers=1)
+
+
+def fetch_rss_feeds(feeds=None):
+    """Download feeds (default RSS_FEEDS) on a thread pool and hand each document
+    to a process pool for parsing as soon as it arrives — feedparser is CPU-bound
+    pure Python, so parsing on the download threads would serialize on the GIL."""
+    from concurrent.futures import ThreadPoolExecutor
+    feeds = RSS_FEEDS if feeds is None else feeds
+    print(f"  Fetching {len(feeds)} RSS feeds...")
+    io_pool = (_InlineExecutor() if PROFILER else
+               ThreadPoolExecutor(max_workers=RSS_DOWNLOAD_WORKERS, thread_name_prefix="rss-download"))
+    with io_pool, _feed_parse_pool() as cpu_pool:
+        downloads = [(name, io_pool.submit(_download_feed, url, cpu_pool)) for name, url in feeds]
+        for name, download in downloads:  # config order keeps output stable run to run
+            try:
+                records, event = download.result().result()
+            except Exception as e:
+                print(f"    ⚠️  {name}: {e}")
+                continue
+            if event and TRACER:
+                TRACER.add({**event, "args": {**event["args"], "feed": name, "entries": len(records)}})
+            for title, link, date, published, key, topic, summary in records:
+                remember_topic(key, topic)
+                yield {
+                    "title": title, "url": link, "score": 0,
+                    "source": name, "source_icon": "🔵",
+                    "topic": topic,
+                    "_classify": (title, summary),  # for reclassification (--enrich, --dashboards)
+                    "comments_url": link, "comments": 0,
+                    "date": date,
+                    "published": published,
+                }
+            print(f"    ✅ {name}: {len(records)}")
+
+
+class RateLimited(RuntimeError):
+    """Reddit kept answering 429 after backing off as its Retry-After asked."""
+
+
+def _reddit_top(subs, time_filter, limit, after=None):
+    """One page of r/<subs>/top.json, where subs may be a multireddit ("a+b+c") → (posts, after).
+    A 429 is retried after the wait it asks for; RateLimited once that runs out."""
+    url = f"https://www.reddit.com/r/{subs}/top.json?t={time_filter}&limit={limit}"
+    if after:
+        url += f"&after={after}"
+    for attempt in range(REDDIT_MAX_RETRIES + 1):
+        resp = http_get(url, headers=REDDIT_HEADERS, timeout=8)
+        if resp.status_code != 429:
+            break
         try:
-            feed = feedparser.parse(url)
-            count = 0
-            for entry in feed.entries[:8]:
-                title = entry.get("title", "")
-                link = entry.get("link", "")
-                summary = entry.get("summary", "")
-                if title and link:
-                    articles.append({
-                        "title": title, "url": link, "score": 0,
-                        "source": name, "source_icon": "🔵",
-                        "topic": classify_topic(title, summary),
-                        "comments_url": link, "comments": 0,
-                        "date": entry.get("published", "")[:10] if entry.get("published") else "",
-                    })
-                    count += 1
-            print(f"    ✅ {name}: {count}")
-        except Exception as e:
-            print(f"    ⚠️  {name}: {e}")
-    return articles
+            wait = float(resp.headers.get("Retry-After") or 0) or REDDIT_BACKOFF_SECONDS * 2 ** attempt
+        except ValueError:
+            wait = REDDIT_BACKOFF_SECONDS * 2 ** attempt
+        if attempt == REDDIT_MAX_RETRIES or wait > REDDIT_MAX_BACKOFF_SECONDS:
+            raise RateLimited(f"rate limited (Retry-After {wait:.0f}s)")
+        time.sleep(wait)
+    resp.raise_for_status()
+    data = resp.json().get("data", {})
+    return data.get("children", []), data.get("after")
 
 
 def fetch_reddit(time_filter="week", limit=15):
-    """Fetch top posts from each subreddit using the public JSON API — no auth needed."""
+    """Fetch top posts from each subreddit using the public JSON API — no auth needed.
+    Subreddits are requested REDDIT_BATCH_SIZE at a time as one multireddit
+    listing, paged until every sub in the batch has `limit` posts; subs still
+    short when REDDIT_MAX_PAGES runs out (quiet ones next to busy ones) are
+    backfilled with a request of their own. A listing that stays rate limited
+    ends the fetch with what arrived so far: more requests would only make
+    the limit worse."""
     print("  Fetching Reddit (JSON API, no auth)...")
-    articles = []
+    total = 0
     seen = set()
-    for display_name, sub in SUBREDDITS:
-        url = f"https://www.reddit.com/r/{sub}/top.json?t={time_filter}&limit={limit}"
+    limited = False
+    for start in range(0, len(SUBREDDITS), REDDIT_BATCH_SIZE):
+        if limited:
+            break
+        batch = SUBREDDITS[start:start + REDDIT_BATCH_SIZE]
+        by_sub = {sub.lower(): [] for _, sub in batch}
+        exhausted, after, pages = False, None, 0
         try:
-            resp = requests.get(url, headers=REDDIT_HEADERS, timeout=8)
-            if resp.status_code == 429:
-                print(f"    ⚠️  {display_name}: rate limited, skipping")
-                continue
-            data = resp.json()
-            posts = data.get("data", {}).get("children", [])
-            count = 0
-            for post in posts:
-                p = post.get("data", {})
-                title = p.get("title", "").strip()
-                # Skip low-effort posts, image-only, and meta posts
-                if not title or p.get("is_video") or p.get("score", 0) < 50:
-                    continue
-                url_dest = p.get("url", f"https://reddit.com{p.get('permalink','')}")
-                post_id = p.get("id")
-                if post_id in seen:
-                    continue
-                seen.add(post_id)
-                articles.append({
-                    "title": title,
-                    "url": url_dest,
-                    "score": p.get("score", 0),
-                    "source": display_name,
-                    "source_icon": "🔴",
-                    "topic": classify_topic(title, p.get("selftext", "")[:300]),
-                    "comments_url": f"https://reddit.com{p.get('permalink','')}",
-                    "comments": p.get("num_comments", 0),
-                    "date": datetime.fromtimestamp(p.get("created_utc", 0)).strftime("%b %d") if p.get("created_utc") else "",
-                    "subreddit": display_name,
-                    "upvote_ratio": p.get("upvote_ratio", 0),
-                })
-                count += 1
-            print(f"    ✅ {display_name}: {count}")
-        except Exception as e:
-            print(f"    ⚠️  {display_name}: {e}")
-    print(f"  ✅ Reddit total: {len(articles)} posts")
-    return articles
+            while pages < REDDIT_MAX_PAGES:
+                posts, after = _reddit_top("+".join(sub for _, sub in batch), time_filter, REDDIT_PAGE_SIZE, after)
+                pages += 1
+                for post in posts:
+                    by_sub.get(post.get("data", {}).get("subreddit", "").lower(), []).append(post)
+                exhausted = not after
+                if exhausted or all(len(p) >= limit for p in by_sub.values()):
+                    break
+        except RateLimited as e:
+            print(f"    ⚠️  {' + '.join(name for name, _ in batch)}: {e}, stopping Reddit for this run")
+            limited = True
+        except Exception as e:  # backfill below covers the subs this left short
+            print(f"    ⚠️  {' + '.join(name for name, _ in batch)}: {e}, falling back to one request per subreddit")
+        for display_name, sub in batch:
+            posts = by_sub[sub.lower()]
+            try:
+                if len(posts) < limit and not exhausted and not limited:
+                    posts, _ = _reddit_top(sub, time_filter, limit)
+                count = 0
+                for post in posts[:limit]:
+                    p = post.get("data", {})
+                    title = p.get("title", "").strip()
+                    # Skip low-effort posts, image-only, and meta posts
+                    if not title or p.get("is_video") or p.get("score", 0) < 50:
+                        continue
+                    url_dest = p.get("url", f"https://reddit.com{p.get('permalink','')}")
+                    post_id = p.get("id")
+                    if post_id in seen:
+                        continue
+                    seen.add(post_id)
+                    yield {
+                        "title": title,
+                        "url": url_dest,
+                        "score": p.get("score", 0),
+                        "source": display_name,
+                        "source_icon": "🔴",
+                        "_classify": (title, p.get("selftext", "")[:300]),
+                        "comments_url": f"https://reddit.com{p.get('permalink','')}",
+                        "comments": p.get("num_comments", 0),
+                        "date": datetime.fromtimestamp(p.get("created_utc", 0)).strftime("%b %d") if p.get("created_utc") else "",
+                        "published": int(p.get("created_utc", 0)),
+                        "subreddit": display_name,
+                        "upvote_ratio": p.get("upvote_ratio", 0),
+                    }
+                    count += 1
+                total += count
+                print(f"    ✅ {display_name}: {count}")
+            except RateLimited as e:
+                print(f"    ⚠️  {display_name}: {e}, stopping Reddit for this run")
+                limited = True
+            except Exception as e:
+                print(f"    ⚠️  {display_name}: {e}")
+    print(f"  ✅ Reddit total: {total} posts")
 
 
 def fetch_hn_ask_show(limit=20):
     """Fetch Ask HN and Show HN stories — surfaces project launches and community debates."""
     print("  Fetching HN Ask + Show HN...")
-    articles = []
+    count = 0
     for label, url in [("Ask HN", HN_ASK_URL), ("Show HN", HN_SHOW_URL)]:
         try:
-            ids = requests.get(url, timeout=8).json()[:limit]
+            ids = http_get(url, timeout=8).json()[:limit]
             for item_id in ids:
                 try:
-                    item = requests.get(HN_ITEM_URL.format(item_id), timeout=5).json()
+                    item = http_get(HN_ITEM_URL.format(item_id), timeout=5).json()
                     if item and item.get("title"):
-                        articles.append({
+                        yield {
                             "title": item.get("title", ""),
                             "url": item.get("url", f"https://news.ycombinator.com/item?id={item_id}"),
                             "score": item.get("score", 0),
                             "source": label, "source_icon": "🟠",
-                            "topic": classify_topic(item.get("title", "")),
                             "comments_url": f"https://news.ycombinator.com/item?id={item_id}",
                             "comments": item.get("descendants", 0),
                             "date": datetime.fromtimestamp(item.get("time", 0)).strftime("%b %d") if item.get("time") else "",
-                        })
+                            "published": item.get("time", 0),
+                        }
+                        count += 1
                 except Exception:
                     continue
         except Exception as e:
             print(f"  ⚠️  {label} error: {e}")
-    print(f"  ✅ HN Ask/Show: {len(articles)} items")
-    return articles
+    print(f"  ✅ HN Ask/Show: {count} items")
 
 
 def fetch_github_trending(limit=25):
     """Fetch trending repos created in the past week using GitHub Search API (no auth needed)."""
     print("  Fetching GitHub Trending...")
-    articles = []
+    count = 0
     try:
         week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        resp = requests.get(
+        resp = http_get(
             GITHUB_SEARCH_URL,
             params={"q": f"created:>{week_ago}", "sort": "stars", "order": "desc", "per_page": limit},
             headers={"User-Agent": "EngBrandMachine/1.0", "Accept": "application/vnd.github.v3+json"},
@@ -779,563 +1137,1566 @@ def fetch_github_trending(limit=25):
         )
         if resp.status_code == 403:
             print("  ⚠️  GitHub Trending: rate limited, skipping")
-            return articles
+            return
         for repo in resp.json().get("items", []):
             desc = (repo.get("description") or "")[:120]
             topics_text = " ".join(repo.get("topics", []))
             title = f"{repo['full_name']} — {desc}" if desc else repo["full_name"]
-            articles.append({
+            yield {
                 "title": title,
                 "url": repo["html_url"],
                 "score": repo.get("stargazers_count", 0),
                 "source": "GitHub Trending", "source_icon": "⚫",
-                "topic": classify_topic(repo.get("name", ""), desc + " " + topics_text),
+                "_classify": (repo.get("name", ""), desc + " " + topics_text),
                 "comments_url": repo["html_url"],
                 "comments": repo.get("open_issues_count", 0),
                 "date": repo.get("created_at", "")[:10],
-            })
+                "published": iso_timestamp(repo.get("created_at")),
+            }
+            count += 1
     except Exception as e:
         print(f"  ⚠️  GitHub Trending error: {e}")
-    print(f"  ✅ GitHub Trending: {len(articles)} repos")
+    print(f"  ✅ GitHub Trending: {count} repos")
+
+
+# ─── SOURCE REGISTRY ───────────────────────────────────────────────────────────
+# Every fetcher by name, in the order their articles are combined. Fetchers are
+# generators: they yield raw article dicts (topic still to be assigned, with an
+# optional "_classify" (title, description) override) as each one is parsed.
+
+SOURCES = {
+    "hn":          lambda: fetch_hn_top(30),
+    "hn-ask-show": lambda: fetch_hn_ask_show(20),
+    "devto":       lambda: fetch_devto(20),
+    "rss":         fetch_rss_feeds,
+    "github":      lambda: fetch_github_trending(25),
+    "reddit":      fetch_reddit,
+}
+
+
+def load_opml(path):
+    """(title, xmlUrl) for every feed outline in an OPML export (a file or an
+    http(s) URL), folders included."""
+    from xml.etree import ElementTree
+    if re.match(r"https?://", path):
+        resp = http_get(path, headers=FEED_HEADERS, timeout=30)
+        resp.raise_for_status()
+        root = ElementTree.fromstring(resp.content)
+    else:
+        root = ElementTree.parse(path).getroot()
+    feeds = []
+    for outline in root.iter("outline"):
+        url = (outline.get("xmlUrl") or "").strip()
+        if url:
+            feeds.append(((outline.get("title") or outline.get("text") or url).strip(), url))
+    return feeds
+
+
+def in_shard(key, shard):
+    """Stable shard assignment: the same key lands in the same slice on every
+    machine and every run (unlike hash(), which is salted per process)."""
+    if not shard:
+        return True
+    i, n = shard
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big") % n == i - 1
+
+
+def plan_sources(args):
+    """The SOURCES mapping and source names this run should fetch: RSS_FEEDS
+    plus any --opml feeds and, with --shard, only this shard's slice — feeds are
+    sharded by URL, the other sources by name."""
+    feeds, urls = [], set()
+    for name, url in RSS_FEEDS + [f for path in args.opml for f in load_opml(path)]:
+        if url not in urls and in_shard(url, args.shard):
+            urls.add(url)
+            feeds.append((name, url))
+    sources = dict(SOURCES, rss=lambda: fetch_rss_feeds(feeds))
+    names = [n for n in (args.only or SOURCES) if n == "rss" or in_shard(n, args.shard)]
+    return sources, names
+
+
+def _snapshot_path(name):
+    return os.path.join(STATE_DIR, "snapshot", f"{name}.jsonl")
+
+
+class SnapshotWriter:
+    """Streaming sink that writes each source's articles (one JSON object per
+    line) for later --only runs. Files are swapped in on close(), so an
+    interrupted run leaves the previous snapshots intact, and so does a source
+    whose fetch failed or came back empty."""
+
+    def __init__(self, names):
+        self._files = {}
+        self._counts = defaultdict(int)
+        for name in names:
+            path = _snapshot_path(name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._files[name] = (path, open(_tmp_path(path), "w", encoding="utf-8"))
+
+    def __call__(self, name, position, article):
+        self._files[name][1].write(json.dumps(article, ensure_ascii=False) + "\n")
+        self._counts[name] += 1
+
+    def close(self, failed=()):
+        """Swap the new snapshots in, except for the sources in failed (and
+        those that yielded nothing — fetchers report most errors that way)."""
+        for name, (path, f) in self._files.items():
+            f.close()
+            if name in failed or not self._counts[name]:
+                os.remove(f.name)
+            else:
+                os.replace(f.name, path)
+
+
+def save_snapshot(results, failed=()):
+    """Persist {name: articles} in one go (daemon refreshes)."""
+    writer = SnapshotWriter(results)
+    for name, articles in results.items():
+        for a in articles:
+            writer(name, None, a)
+    writer.close(failed)
+
+
+def replay_snapshot(name):
+    """Fetcher stand-in for --replay: the source's last snapshot, with topics
+    dropped so the articles are classified again (from title and summary)."""
+    for article in load_snapshot(name):
+        article.pop("topic", None)
+        yield article
+
+
+def load_snapshot(name):
+    """Articles saved by the last run that fetched this source, or [] if none."""
+    try:
+        with open(_snapshot_path(name), encoding="utf-8") as f:
+            articles = [json.loads(line) for line in f if line.strip()]
+        age_h = (time.time() - os.path.getmtime(_snapshot_path(name))) / 3600
+    except (OSError, ValueError):
+        print(f"  ⚠️  {name}: no snapshot from a previous run")
+        return []
+    print(f"  ♻️  {name}: {len(articles)} articles from snapshot ({age_h:.1f}h old)")
     return articles
 
 
-def count_topics(articles):
-    counts = defaultdict(int)
-    for a in articles:
-        counts[a["topic"]] += 1
-    return sorted(counts.items(), key=lambda x: -x[1])
+# ─── LINK RESOLUTION ───────────────────────────────────────────────────────────
+# Newsletter feeds link through click-trackers and shorteners, so the same story
+# arrives under several URLs and every click costs extra hops. Links matching
+# REDIRECTORS are followed with HEAD requests, RESOLVE_WORKERS at a time, and the
+# target replaces the article URL before dedupe. Results are kept in
+# CACHE_DIR/links.json, and concurrent lookups of one link share one request.
 
+_REDIRECTORS = [(re.compile(pattern, re.I), stable) for pattern, stable in REDIRECTORS]
 
-def generate_miro_recommendations(articles, topic_counts):
-    """Pick top 5 Miro content recommendations based on what's actually trending."""
-    by_topic = defaultdict(list)
-    for a in articles:
-        by_topic[a["topic"]].append(a)
 
-    recs = []
-    used_topics = set()
+def redirector(url):
+    """None unless url is a known redirect link; otherwise whether its target is stable."""
+    for pattern, stable in _REDIRECTORS:
+        if pattern.match(url):
+            return stable
+    return None
 
-    for topic, _count in topic_counts:
-        if len(recs) >= 5:
-            break
-        if topic in MIRO_CONTENT_TEMPLATES and topic not in used_topics:
-            template = MIRO_CONTENT_TEMPLATES[topic][0]
-            # Pick the top scored article as "inspiration"
-            top_arts = sorted(by_topic[topic], key=lambda x: -x["score"])[:2]
-            inspired = [a["title"] for a in top_arts if a["title"]]
+
+def strip_tracking(url):
+    """url without tracking parameters (utm_*, fbclid, …); otherwise unchanged."""
+    try:
+        parts = urllib.parse.urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.query:
+        return url
+    pairs = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    query = [(k, v) for k, v in pairs if not TRACKING_PARAMS.fullmatch(k.lower())]
+    if len(query) == len(pairs):
+        return url
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+class _CachedLookup:
+    """A slow lookup (network) behind a persistent JSON cache of key → [value,
+    expiry], where expiry 0 means never. Concurrent misses for one key wait
+    for a single lookup rather than repeating it."""
+
+    filename = ""
+    max_entries = 0
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, self.filename)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._cache = json.load(f)
+        except (OSError, ValueError):
+            self._cache = {}
+        self._pending = {}  # key → Event set once its owner has looked it up
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.requests = 0
+
+    def get(self, key, lookup, default=None):
+        """Cached value for key, or lookup() → (value, expiry) stored and returned."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and (entry[1] == 0 or entry[1] > time.time()):
+                return entry[0]
+            done = self._pending.get(key)
+            owner = done is None
+            if owner:
+                done = self._pending[key] = threading.Event()
+        if not owner:
+            done.wait()
+            with self._lock:
+                return self._cache.get(key, [default])[0]
+        try:
+            value, expiry = lookup()
+            with self._lock:
+                self._cache.pop(key, None)  # re-insert so the newest entries survive save()
+                self._cache[key] = [value, expiry]
+                self._dirty = True
+        finally:
+            with self._lock:
+                del self._pending[key]
+            done.set()
+        return value
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def save(self):
+        """Persist unexpired entries, at most max_entries of them."""
+        if not self._dirty:
+            return
+        now = time.time()
+        with self._lock:
+            kept = [(k, v) for k, v in self._cache.items() if v[1] == 0 or v[1] > now][-self.max_entries:]
+        try:
+            _write_json_atomic(self.path, dict(kept))
+            self._dirty = False
+        except OSError as e:
+            print(f"  ⚠️  cache write failed ({self.filename}): {e}")
+
+
+class LinkResolver(_CachedLookup):
+    """Redirect-chain resolution; links from stable redirectors are never rechecked."""
+
+    filename = "links.json"
+    max_entries = RESOLVE_CACHE_MAX
+
+    def resolve(self, url):
+        """Final URL after redirects, or url itself if it isn't a redirect link."""
+        stable = redirector(url)
+        if stable is None:
+            return url
+
+        def lookup():
+            target, ok = self._follow(url)
+            if ok and stable:
+                return target, 0
+            return target, int(time.time() + (RESOLVE_TTL_HOURS if ok else RESOLVE_RETRY_HOURS) * 3600)
+
+        return self.get(url, lookup, url)
+
+    def _follow(self, url):
+        """(last URL reached, whether the chain ended cleanly) within RESOLVE_MAX_HOPS."""
+        current = url
+        for _ in range(RESOLVE_MAX_HOPS):
+            try:
+                self._count_request()
+                kwargs = dict(headers=FEED_HEADERS, timeout=RESOLVE_TIMEOUT, allow_redirects=False)
+                resp = http_request("HEAD", current, **kwargs)
+                if resp.status_code in (405, 501):  # HEAD not supported: GET, but leave the body unread
+                    resp = http_request("GET", current, stream=True, **kwargs)
+                    resp.close()
+            except requests.RequestException:
+                return current, False
+            location = resp.headers.get("Location")
+            if not (300 <= resp.status_code < 400 and location):
+                return current, resp.status_code < 400
+            current = urllib.parse.urljoin(current, location)
+            if redirector(current) is None:
+                return current, True
+        return current, True
+
+
+_link_resolver = None
+
+
+def link_resolver():
+    global _link_resolver
+    if _link_resolver is None:
+        _link_resolver = LinkResolver()
+    return _link_resolver
+
+
+def save_lookup_caches():
+    """Persist the link and page-text caches of the lookups this run made."""
+    for lookup in (_link_resolver, _enricher):
+        if lookup is not None:
+            lookup.save()
+
+
+def resolve_article(position, article):
+    """Point the article at its canonical target: redirects followed, tracking
+    parameters dropped (from comments_url too when it was the same link)."""
+    url = article.get("url")
+    if url:
+        article["url"] = strip_tracking(link_resolver().resolve(url))
+        if article.get("comments_url") == url:
+            article["comments_url"] = article["url"]
+    return article
+
+
+# ─── ARTICLE ENRICHMENT ────────────────────────────────────────────────────────
+# --enrich: after dedupe, each article's page is fetched (ENRICH_WORKERS at once,
+# politely per host, never more than ENRICH_MAX_BYTES) and its main text is
+# extracted as the bytes stream in, so classify_topic sees what the article is
+# about rather than only its title. Text is cached by canonical URL in
+# CACHE_DIR/bodies.json, so a page is downloaded once however often it appears.
+
+ENRICH = False
+
+
+@functools.lru_cache(maxsize=None)
+def _text_extractor_class():
+    """_TextExtractor, defined on first use so html.parser is only imported
+    by runs that --enrich."""
+    from html.parser import HTMLParser
+
+    class _TextExtractor(HTMLParser):
+        """Incremental main-text extraction: the meta description, then paragraph,
+        heading and list text outside navigation and other page furniture."""
+
+        SKIP = {"script", "style", "noscript", "template", "svg", "nav", "header", "footer", "aside", "form", "button"}
+        BLOCKS = {"p", "h1", "h2", "h3", "li", "blockquote"}
+
+        def __init__(self, limit=ENRICH_TEXT_CHARS):
+            super().__init__(convert_charrefs=True)
+            self.limit = limit
+            self.description = ""
+            self._chunks, self._size = [], 0
+            self._skip = self._block = 0  # open SKIP / BLOCKS elements
+
+        @property
+        def done(self):
+            return self._size >= self.limit
+
+        def handle_starttag(self, tag, attrs):
+            if tag in self.SKIP:
+                self._skip += 1
+            elif tag in self.BLOCKS:
+                self._block += 1
+                self._chunks.append(" ")
+            elif tag == "meta" and not self.description:
+                attrs = dict(attrs)
+                if (attrs.get("name") or attrs.get("property") or "").lower() in ("description", "og:description"):
+                    self.description = " ".join((attrs.get("content") or "").split())
+
+        def handle_endtag(self, tag):
+            if tag in self.SKIP:
+                self._skip = max(self._skip - 1, 0)
+            elif tag in self.BLOCKS:
+                self._block = max(self._block - 1, 0)
+                self._chunks.append(" ")
+
+        def handle_data(self, data):
+            # Unsplit: one text node can arrive in pieces when the page is fed in chunks.
+            if self._block and not self._skip and not self.done:
+                self._chunks.append(data)
+                self._size += len(data)
+
+        def text(self):
+            return " ".join(f"{self.description} {''.join(self._chunks)}".split())[:self.limit]
+
+    return _TextExtractor
+
+
+class _HostGate:
+    """Per-host politeness: at most ENRICH_PER_HOST requests in flight, and
+    successive requests started at least ENRICH_HOST_INTERVAL seconds apart."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots = defaultdict(lambda: threading.BoundedSemaphore(ENRICH_PER_HOST))
+        self._next = defaultdict(float)  # host → earliest monotonic start of its next request
+
+    @contextlib.contextmanager
+    def __call__(self, host):
+        with self._lock:
+            slots = self._slots[host]
+        with slots:
+            with self._lock:
+                start = max(self._next[host], time.monotonic())
+                self._next[host] = start + ENRICH_HOST_INTERVAL
+            time.sleep(max(0.0, start - time.monotonic()))
+            yield
+
+
+class Enricher(_CachedLookup):
+    """Article page text by canonical URL: kept for good once extracted, retried
+    after ENRICH_RETRY_HOURS when the page couldn't be fetched."""
+
+    filename = "bodies.json"
+    max_entries = ENRICH_CACHE_MAX
+
+    def __init__(self, path=None):
+        super().__init__(path)
+        self._gate = _HostGate()
+
+    def text(self, url):
+        """Main text of the page at url, "" if there is none to be had."""
+        if ENRICH_SKIP.match(url):
+            return ""
+
+        def lookup():
+            text = self._fetch(url)
+            return text, 0 if text is not None else int(time.time() + ENRICH_RETRY_HOURS * 3600)
+
+        return self.get(canonical_url(url), lookup) or ""
+
+    def _fetch(self, url):
+        """Extracted text; "" for pages that aren't HTML or are gone, None for
+        failures worth retrying (network errors, 429, 5xx)."""
+        extractor = _text_extractor_class()()
+        try:
+            with self._gate(urllib.parse.urlsplit(url).hostname or ""):
+                self._count_request()
+                deadline = time.monotonic() + ENRICH_TIMEOUT
+                with http_request("GET", url, headers=FEED_HEADERS, timeout=ENRICH_TIMEOUT, stream=True) as resp:
+                    if not resp.ok:
+                        return None if resp.status_code == 429 or resp.status_code >= 500 else ""
+                    content_type = resp.headers.get("Content-Type", "")
+                    if "html" not in content_type:
+                        return ""
+                    encoding = resp.encoding if "charset" in content_type else "utf-8"
+                    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                    received = 0
+                    for chunk in resp.iter_content(16 * 1024):
+                        extractor.feed(decoder.decode(chunk))
+                        received += len(chunk)
+                        if extractor.done or received >= ENRICH_MAX_BYTES or time.monotonic() > deadline:
+                            break
+        except (requests.RequestException, LookupError):
+            return None
+        return extractor.text()
+
+
+_enricher = None
+
+
+def enricher():
+    global _enricher
+    if _enricher is None:
+        _enricher = Enricher()
+    return _enricher
+
+
+def enrich_article(position, article):
+    """Add the article's page text to what classify_topic sees. Articles that
+    arrive classified (RSS, from their summary) are classified again."""
+    if article.get("url") and (text := enricher().text(article["url"])):
+        title, description = classify_input(article)
+        article.pop("topic", None)
+        article["_classify"] = (title, f"{description} {text}".strip())
+    return article
+
+
+# ─── STREAMING PIPELINE ────────────────────────────────────────────────────────
+# fetch → normalize → resolve → dedupe → (--enrich) → classify, one thread per
+# stage joined by bounded queues, so classification overlaps with network waits and a fast
+# source can only run PIPELINE_QUEUE_SIZE articles ahead of the slowest stage. Every item
+# carries its position (SOURCES rank, index within the source) so results are
+# ordered the same way however the fetches interleave. A stage that raises on
+# an article drops that article, not the stream.
+
+_END = object()
+
+
+def normalize_article(position, article):
+    """Trim and default the fields every later stage relies on; drop unusable items."""
+    title = (article.get("title") or "").strip()
+    if not title:
+        return None
+    article["title"] = title
+    article["score"] = int(article.get("score") or 0)
+    article["comments"] = int(article.get("comments") or 0)
+    article.setdefault("comments_url", article.get("url", ""))
+    article.setdefault("date", "")
+    article["published"] = int(article.get("published") or 0)
+    # The source's own description goes into snapshots with the article, so
+    # --replay, --only and --dashboards can classify it again from more than its title.
+    if (text := article.get("_classify")) and (summary := (text[1] or "").strip()):
+        article.setdefault("summary", summary)
+    return article
+
+
+def classify_input(article):
+    """The (title, description) classify_topic sees for an article."""
+    return article.pop("_classify", None) or (article["title"], article.get("summary", ""))
+
+
+def classify_article(position, article):
+    text = classify_input(article)
+    if "topic" not in article:
+        with span("classify_topic", "classify"), profiled("classify_topic"):
+            article["topic"] = classify_topic(*text)
+    return article
+
+
+def _apply(func, position, article):
+    """func(position, article), or None (the article is dropped) when it raises:
+    one malformed item must not take down its stage thread, which would leave
+    every later stage waiting forever for the end of the stream."""
+    try:
+        return func(position, article)
+    except Exception as e:
+        title = article.get("title") if isinstance(article, dict) else article
+        print(f"  ⚠️  {func.__name__}: dropped {str(title)[:60]!r} ({type(e).__name__}: {e})")
+        return None
+
+
+def _put(q, item, cancel):
+    """q.put that gives up once cancel is set (the consumer stopped reading) → whether it was put."""
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _get(q, cancel):
+    """q.get, or _END once cancel is set."""
+    while not cancel.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return _END
+
+
+def _stage(func, inbox, outbox, cancel):
+    """Thread body for one pipeline stage: func(position, article) → article or None (dropped)."""
+    with span(threading.current_thread().name, "pipeline") as s:
+        count = 0
+        try:
+            while (item := _get(inbox, cancel)) is not _END:
+                article = _apply(func, *item)
+                count += 1
+                if article is not None and not _put(outbox, (item[0], article), cancel):
+                    break
+        finally:
+            _put(outbox, _END, cancel)
+        s.set(items=count)
+
+
+def _ordered_stage(func, inbox, outbox, cancel, workers):
+    """_stage with func(position, article) run on a thread pool, for stages that
+    wait on the network. Results leave in arrival order; at most workers × 4
+    articles are in flight."""
+    from concurrent.futures import ThreadPoolExecutor
+    name = threading.current_thread().name
+    with span(name, "pipeline") as s, ThreadPoolExecutor(workers, thread_name_prefix=name) as pool:
+        window = deque()
+        count = 0
+
+        def emit():
+            position, future = window.popleft()
+            if (article := future.result()) is not None:
+                _put(outbox, (position, article), cancel)
+
+        try:
+            while (item := _get(inbox, cancel)) is not _END:
+                window.append((item[0], pool.submit(_apply, func, *item)))
+                count += 1
+                if len(window) >= workers * 4:
+                    emit()
+            while window and not cancel.is_set():
+                emit()
+        finally:
+            _put(outbox, _END, cancel)
+        s.set(items=count)
+
+
+def _stream_serially(sources, ranks, stages, failed):
+    """stream_articles on the calling thread for --profile: each source is
+    fetched in full, then its articles go through the stages one by one."""
+    for name, rank in ranks.items():
+        try:
+            articles = sources[name]()
+            with span(f"fetch {name}", "fetch"), profiled(f"fetch:{name}", articles):
+                articles = list(articles)
+        except Exception as e:
+            print(f"  ⚠️  {name}: {e}")
+            failed.add(name)
+            continue
+        for i, article in enumerate(articles):
+            for _, stage, _ in stages:
+                if (article := _apply(stage, (rank, i), article)) is None:
+                    break
+            else:
+                yield name, (rank, i), article
+
+
+def stream_articles(names, sources=None, classify=True, failed=None):
+    """Fetch the named sources (from SOURCES, or a mapping with the same keys
+    such as plan_sources() returns) concurrently and yield (name, position,
+    article) as each article clears the pipeline. With classify=False articles
+    leave unclassified, still carrying their "_classify" input. A consumer that
+    stops early (break, close()) cancels the fetch and stage threads. Sources
+    whose fetcher raised are added to the failed set, when one is given."""
+    sources = sources or SOURCES
+    failed = set() if failed is None else failed
+    ranks = {name: rank for rank, name in enumerate(SOURCES) if name in names}
+    by_rank = {rank: name for name, rank in ranks.items()}
+    fetched = queue.Queue(PIPELINE_QUEUE_SIZE)
+    cancel = threading.Event()
+    seen = set()
+
+    def dedupe(position, article):
+        key = (position[0], dedupe_key(article))
+        if key in seen:
+            return None
+        seen.add(key)
+        return article
+
+    def fetch(name):
+        with span(f"fetch {name}", "fetch") as s:
+            try:
+                for i, article in enumerate(sources[name]()):
+                    if not _put(fetched, ((ranks[name], i), article), cancel):
+                        return
+                    s.set(articles=i + 1)
+            except Exception as e:
+                print(f"  ⚠️  {name}: {e}")
+                failed.add(name)
+
+    def fetch_all():
+        workers = [threading.Thread(target=fetch, args=(name,), name=f"fetch:{name}", daemon=True) for name in ranks]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        _put(fetched, _END, cancel)
+
+    # (label, func, workers): stages that wait on the network get a thread pool.
+    stages = [("normalize", normalize_article, 1), ("resolve", resolve_article, RESOLVE_WORKERS), ("dedupe", dedupe, 1)]
+    if ENRICH:
+        stages.append(("enrich", enrich_article, ENRICH_WORKERS))
+    if classify:
+        stages.append(("classify", classify_article, 1))
+    _load_topic_memo()  # load once here rather than racing for it in the stages
+    if PROFILER:
+        yield from _stream_serially(sources, ranks, stages, failed)
+        return
+    queues = [fetched] + [queue.Queue(PIPELINE_QUEUE_SIZE) for _ in stages]
+    threads = [threading.Thread(target=fetch_all, name="fetch", daemon=True)]
+    for (label, func, workers), inbox, outbox in zip(stages, queues, queues[1:]):
+        target, args = (_stage, (func, inbox, outbox, cancel)) if workers == 1 else \
+            (_ordered_stage, (func, inbox, outbox, cancel, workers))
+        threads.append(threading.Thread(target=target, args=args, name=f"stage:{label}", daemon=True))
+    for t in threads:
+        t.start()
+    try:
+        while (item := queues[-1].get()) is not _END:
+            position, article = item
+            yield by_rank[position[0]], position, article
+    finally:
+        cancel.set()  # a no-op once the stream has ended; otherwise unblocks every stage
+
+
+def run_pipeline(names, *sinks, sources=None, classify=True, failed=None):
+    """Stream the named sources into each sink(name, position, article)."""
+    for name, position, article in stream_articles(names, sources, classify, failed):
+        for sink in sinks:
+            sink(name, position, article)
+
+
+def _push_bounded(heap, entry, k):
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    else:
+        heapq.heappushpop(heap, entry)
+
+
+class Aggregate:
+    """Dashboard aggregates over a stream of articles in bounded memory: counts
+    per topic and source, top-k heaps per topic and overall, and score-weighted
+    trend totals per topic and per template-index term (the vocabulary bounds
+    them). Ties break on stream position, so results match a stable sort of
+    the concatenated list. Pass bursts (a BurstDetector) to also track
+    emerging terms; builds do, the list-based helpers don't need the state file."""
+
+    def __init__(self, articles=(), per_topic=5, hot=20, vocabulary=None, bursts=None):
+        self.total = 0
+        self._per_topic, self._hot_k = per_topic, hot
+        self._topics, self._sources = {}, {}  # key → [count, first position]
+        self._top = defaultdict(list)
+        self._hot = []
+        self._vocabulary = template_index().terms if vocabulary is None else vocabulary
+        self._topic_trend = defaultdict(float)
+        self._term_trend = defaultdict(float)
+        self.bursts = bursts
+        for i, a in enumerate(articles):
+            self.add(None, (0, i), a)
+
+    def add(self, name, position, article):
+        """Sink interface: fold one article in."""
+        with profiled("aggregate"):
+            self.total += 1
+            for counts, key in ((self._topics, article["topic"]), (self._sources, article["source"])):
+                if key in counts:
+                    counts[key][0] += 1
+                else:
+                    counts[key] = [1, position]
+            # Min-heaps keyed (score, reversed position): the root is the entry to evict.
+            entry = (article["score"], tuple(-p for p in position), article)
+            _push_bounded(self._top[article["topic"]], entry, self._per_topic)
+            _push_bounded(self._hot, entry, self._hot_k)
+            weight = 1 + math.log1p(max(article["score"], 0))
+            self._topic_trend[article["topic"]] += weight
+            for term in self._vocabulary.intersection(search_tokens(article["title"])):
+                self._term_trend[term] += weight
+            if self.bursts:
+                self.bursts.add(article)
+
+    __call__ = add
+
+    @staticmethod
+    def _ranked(counts):
+        return [(key, c) for key, (c, _) in sorted(counts.items(), key=lambda kv: (-kv[1][0], kv[1][1]))]
+
+    def topic_counts(self):
+        return self._ranked(self._topics)
+
+    def source_counts(self):
+        return self._ranked(self._sources)
+
+    def top(self, topic):
+        """Highest-scored articles in a topic, best first."""
+        return [e[2] for e in sorted(self._top.get(topic, ()), key=lambda e: e[:2], reverse=True)]
+
+    def hottest(self):
+        return [e[2] for e in sorted(self._hot, key=lambda e: e[:2], reverse=True)]
+
+    def trend(self):
+        """(topic → weight, term → weight); rounded so arrival order can't change them."""
+        return ({t: round(w, 6) for t, w in sorted(self._topic_trend.items())},
+                {t: round(w, 6) for t, w in sorted(self._term_trend.items())})
+
+
+def _as_aggregate(articles):
+    """An Aggregate as is; a plain article list (the pre-streaming call style) folded into one."""
+    return articles if isinstance(articles, Aggregate) else Aggregate(articles)
+
+
+def count_topics(articles):
+    """(topic, count) pairs, most common first. Kept for callers with a plain
+    article list; the build reads Aggregate.topic_counts() instead."""
+    if isinstance(articles, Aggregate):
+        return articles.topic_counts()
+    return Aggregate(articles, vocabulary=frozenset()).topic_counts()  # no trends: skip the template index
+
+
+def generate_miro_recommendations(agg, topic_counts=None):
+    """Pick top 5 Miro content recommendations based on what's actually trending:
+    the template index scores every template that shares a topic or term with
+    this run's articles, weighted by their scores. agg may also be a plain
+    article list; topic_counts is accepted for the old (articles, topic_counts)
+    call style but not needed, since the Aggregate knows them."""
+    agg = _as_aggregate(agg)
+    with profiled("generate_miro_recommendations"):
+        index = template_index()
+        recs = []
+        for topic, template in index.match(*agg.trend(), k=5):
+            # The topic's top scored articles are the "inspiration"
+            inspired = [a["title"] for a in agg.top(topic)[:2] if a["title"]]
             recs.append({**template, "topic": topic, "inspired_by": inspired})
-            used_topics.add(topic)
 
-    # Pad with default if needed
-    while len(recs) < 5:
-        recs.append({**DEFAULT_RECS[0], "inspired_by": []})
+        # A library with fewer than five topics: each default once, never a repeat.
+        for default in index.defaults[:max(0, 5 - len(recs))]:
+            recs.append({**default, "inspired_by": []})
+
+    return recs
+
+
+def aggregate(agg):
+    """Topic counts + generate_miro_recommendations, cached on what they read."""
+    topic_counts = agg.topic_counts()
+    inputs = [agg.trend(), [[a["title"], a["score"]] for topic, _ in topic_counts for a in agg.top(topic)[:2]]]
+    miro_recs = cached_stage("recommendations", inputs, lambda: generate_miro_recommendations(agg))
+    return topic_counts, miro_recs
+
+
+# ─── EMERGING TERMS ────────────────────────────────────────────────────────────
+# TOPIC_KEYWORDS only knows the words it lists; a new framework or CVE nickname
+# lands in "🔧 Engineering". Every run counts title words and word pairs in a
+# count-min sketch and compares them with a decayed baseline sketch of earlier
+# runs, keeping the terms furthest above their baseline in a small
+# heavy-hitters table. Memory and the state file stay the same size however
+# large the vocabulary or long the history.
+
+def title_ngrams(title):
+    """Distinct words and adjacent word pairs of a title, minus stopwords and bare numbers."""
+    words = re.findall(r"[a-z0-9][a-z0-9+#]*", title.lower())
+    keep = [w not in BURST_STOPWORDS and not w.isdigit() and len(w) > 1 for w in words]
+    terms = {w for w, k in zip(words, keep) if k}
+    terms.update(f"{a} {b}" for a, b, ka, kb in zip(words, words[1:], keep, keep[1:]) if ka and kb)
+    return terms
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _sketch_cells(key, width, depth):
+    a, b = struct.unpack("<II", hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest())
+    return tuple(row * width + (a + row * (b | 1)) % width for row in range(depth))
+
+
+class CountMinSketch:
+    """depth rows of width counters; a key maps to one cell per row. Estimates
+    never undercount and overcount only by hash collisions."""
+
+    def __init__(self, width=BURST_SKETCH_WIDTH, depth=BURST_SKETCH_DEPTH, counts=None):
+        self.width, self.depth = width, depth
+        self.counts = counts if counts is not None else array.array("f", bytes(4 * width * depth))
+
+    def cells(self, key):
+        return _sketch_cells(key, self.width, self.depth)
+
+    def estimate(self, cells):
+        return min(self.counts[c] for c in cells)
+
+    def add(self, cells):
+        """Count one more; conservative update (only the lowest cells rise). → new estimate."""
+        new = self.estimate(cells) + 1
+        for c in cells:
+            if self.counts[c] < new:
+                self.counts[c] = new
+        return new
+
+
+def _covers(picked, term, count):
+    """Whether an already picked emerging term absorbs term, extending its phrase if they chain."""
+    words, phrase = term.split(), picked["term"].split()
+    if set(words) <= set(phrase) or set(phrase) <= set(words):
+        return True
+    if count != picked["count"] or len(words) < 2:
+        return False
+    if phrase[-1] == words[0]:
+        picked["term"] = " ".join(phrase + words[1:])
+    elif words[-1] == phrase[0]:
+        picked["term"] = " ".join(words[:-1] + phrase)
+    else:
+        return False
+    return True
+
+
+class BurstDetector:
+    """Emerging title terms for one run. Each article's n-grams go into the
+    run's sketch; a term seen BURST_MIN_COUNT times is scored against the
+    baseline sketch (its expected count per run) and offered to a bounded
+    min-heap of the best-scoring candidates. save() folds the run into the
+    baseline with an exponential decay by elapsed time."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(STATE_DIR, "terms.sketch")
+        self.current = CountMinSketch()
+        self.baseline, self.updated = self._load()
+        self._candidates = {}  # term → [score, count, expected, article]
+        self._heap = []        # (score, term); stale entries are skipped lazily
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                magic, width, depth, updated = struct.unpack("<4sIId", f.read(20))
+                counts = array.array("f")
+                counts.frombytes(f.read())
+        except (OSError, struct.error, ValueError):
+            return None, None
+        if magic != b"EBMS" or (width, depth) != (BURST_SKETCH_WIDTH, BURST_SKETCH_DEPTH) or len(counts) != width * depth:
+            return None, None  # sketch shape changed: start a new baseline
+        return CountMinSketch(counts=counts), updated
+
+    def add(self, article):
+        for term in title_ngrams(article["title"]):
+            cells = self.current.cells(term)
+            count = self.current.add(cells)
+            if self.baseline is None or count < BURST_MIN_COUNT:
+                continue
+            expected = self.baseline.estimate(cells)
+            self._offer(term, (count - expected) / math.sqrt(expected + 1), count, expected, article)
+
+    def _offer(self, term, score, count, expected, article):
+        entry = self._candidates.get(term)
+        if entry is None and len(self._candidates) >= BURST_CANDIDATES:
+            while True:  # evict the lowest live candidate if this term beats it
+                low, low_term = self._heap[0]
+                if self._candidates.get(low_term, (None,))[0] == low:
+                    break
+                heapq.heappop(self._heap)
+            if score <= low:
+                return
+            heapq.heappop(self._heap)
+            del self._candidates[low_term]
+        if entry is None or article["score"] > entry[3]["score"]:
+            best = article
+        else:
+            best = entry[3]
+        self._candidates[term] = [score, count, expected, best]
+        heapq.heappush(self._heap, (score, term))
+        if len(self._heap) > 4 * BURST_CANDIDATES:
+            self._heap = [(e[0], t) for t, e in self._candidates.items()]
+            heapq.heapify(self._heap)
+
+    def emerging(self, k=BURST_TOP):
+        """Top-k bursting terms, best first (pairs before their words on ties).
+        Terms a higher-ranked one already covers are skipped, and pairs from the
+        same articles chain into one phrase ("zephyr js" + "js ships")."""
+        ranked = sorted(self._candidates.items(), key=lambda kv: (-kv[1][0], -kv[0].count(" "), kv[0]))
+        picked = []
+        for term, (score, count, expected, article) in ranked:
+            if score < BURST_MIN_SCORE or len(picked) == k:
+                break
+            if any(_covers(p, term, count) for p in picked):
+                continue
+            picked.append({"term": term, "count": int(count), "expected": round(expected, 2),
+                           "score": round(score, 2), "title": article["title"], "url": article["url"]})
+        return picked
+
+    def save(self, now=None):
+        """Fold this run into the baseline: baseline ← keep·baseline + (1 − keep)·run,
+        keep = ½^(hours since the last save / BURST_HALF_LIFE_HOURS)."""
+        now = time.time() if now is None else now
+        if self.baseline is None:
+            counts = self.current.counts
+        else:
+            keep = 0.5 ** (max(now - self.updated, 0) / 3600 / BURST_HALF_LIFE_HOURS)
+            counts = array.array("f", (keep * b + (1 - keep) * c
+                                       for b, c in zip(self.baseline.counts, self.current.counts)))
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = _tmp_path(self.path)
+        with open(tmp, "wb") as f:
+            f.write(struct.pack("<4sIId", b"EBMS", BURST_SKETCH_WIDTH, BURST_SKETCH_DEPTH, now))
+            f.write(counts.tobytes())
+        os.replace(tmp, self.path)
+
+
+# ─── CHANGES SINCE LAST RUN ────────────────────────────────────────────────────
+# Each run keeps a compact record of the previous one in STATE_DIR/diff/: the
+# 64-bit hash of every canonical URL with its score, the topic counts, and a
+# Bloom filter of every URL ever seen. One pass over the new articles then
+# tags each as new, rising, falling or returning (back after missing a run).
+
+def canonical_url(url):
+    """One spelling per page: https, lowercase host without "www.", no default
+    port, fragment, trailing slash or tracking parameters (utm_*, fbclid, …),
+    remaining query parameters sorted."""
+    try:
+        parts = urllib.parse.urlsplit(url.strip())
+        host = (parts.hostname or "").removeprefix("www.")
+        if parts.port and parts.port not in (80, 443):
+            host += f":{parts.port}"
+    except ValueError:
+        return url
+    query = sorted((k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+                   if not TRACKING_PARAMS.fullmatch(k.lower()))
+    scheme = "https" if parts.scheme.lower() in ("http", "https", "") else parts.scheme.lower()
+    return urllib.parse.urlunsplit((scheme, host, parts.path.rstrip("/"), urllib.parse.urlencode(query), ""))
 
-    return recs[:5]
 
+def dedupe_key(article):
+    """What makes two articles of one source the same story: the canonical URL, else the title."""
+    return canonical_url(article["url"]) if article.get("url") else article["title"]
 
-def generate_html(articles, topic_counts, miro_recs):
-    total = len(articles)
-    sources = defaultdict(int)
-    for a in articles:
-        sources[a["source"]] += 1
 
-    # ── Reddit config checkboxes (for the JS-driven interactive panel) ─────────
-    sub_checkboxes_html = ""
-    for display_name, sub in SUBREDDITS:
-        sub_checkboxes_html += f'''<label class="sub-check-label">
-          <input type="checkbox" class="sub-check" value="{html_lib.escape(sub)}" checked>
-          {html_lib.escape(display_name)}
-        </label>'''
+def url_hash(url):
+    return int.from_bytes(hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest(), "little")
 
-    top_articles = sorted(articles, key=lambda x: -x["score"])[:50]
-    by_topic = defaultdict(list)
-    for a in articles:
-        by_topic[a["topic"]].append(a)
 
-    # ── Miro Recommendations Cards ─────────────────────────────────────────────
-    rec_cards = ""
-    for i, rec in enumerate(miro_recs, 1):
-        inspired_html = ""
-        if rec.get("inspired_by"):
-            items = "".join(f"<li>{html_lib.escape(t)}</li>" for t in rec["inspired_by"][:2])
-            inspired_html = f'<div class="inspired"><strong>Inspired by trending:</strong><ul>{items}</ul></div>'
+class BloomFilter:
+    """Fixed-size set of 64-bit hashes with false positives but no false negatives."""
 
-        tags_html = "".join(
-            f'<span class="post-tag">#{html_lib.escape(t)}</span>'
-            for t in rec.get("tags", [])
-        )
-        hero_prompt_esc = html_lib.escape(rec.get("hero_prompt", ""))
-        seo_desc_esc = html_lib.escape(rec.get("seo_description", ""))
-        read_time_esc = html_lib.escape(rec.get("read_time", ""))
-        body_html = rec.get("body", "")  # raw HTML, no escaping
+    def __init__(self, bits=DIFF_BLOOM_BITS, hashes=DIFF_BLOOM_HASHES, data=None, count=0):
+        self.bits, self.hashes, self.count = bits, hashes, count
+        self.data = data if data is not None else bytearray(bits // 8)
 
-        rec_cards += f'''
-        <div class="rec-card">
-          <div class="rec-num">#{i}</div>
-          <div class="rec-topic">{html_lib.escape(rec["topic"])}</div>
-          <div class="rec-title">{html_lib.escape(rec["title"])}</div>
-          <div class="rec-desc">{html_lib.escape(rec["description"])}</div>
-          <div class="rec-demo"><strong>🎬 Demo:</strong> {html_lib.escape(rec["demo"])}</div>
-          <div class="rec-meta">
-            <span class="rec-format">📄 {html_lib.escape(rec["format"])}</span>
-            <span class="rec-cta">{html_lib.escape(rec["cta"])}</span>
-          </div>
-          {inspired_html}
-          <button class="view-draft-btn" onclick="toggleDraft(this)">📝 View Full Post Draft ↓</button>
-          <div class="post-draft">
-            <div class="post-hero">
-              <div class="post-hero-label">🎨 Hero Image Prompt (Midjourney / DALL-E)</div>
-              <div class="post-hero-prompt">{hero_prompt_esc}</div>
-            </div>
-            <div class="post-tags">{tags_html}</div>
-            <div class="post-meta-bar">⏱ {read_time_esc} &nbsp;·&nbsp; 🔍 {seo_desc_esc}</div>
-            <div class="post-body">{body_html}</div>
-            <button class="copy-draft-btn" onclick="copyDraft(this)">📋 Copy Draft to Clipboard</button>
-          </div>
-        </div>'''
+    def _positions(self, h):
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
 
-    # ── Topic Cards ────────────────────────────────────────────────────────────
-    topic_cards = ""
-    for topic, count in topic_counts[:8]:
-        topic_arts = sorted(by_topic[topic], key=lambda x: -x["score"])[:5]
-        items_html = ""
-        for art in topic_arts:
-            safe_title = html_lib.escape(art["title"])
-            safe_url = html_lib.escape(art["url"])
-            score_badge = f'<span class="badge">⬆ {art["score"]}</span>' if art["score"] > 0 else ""
-            items_html += f'''
-            <div class="article-item">
-              <a href="{safe_url}" target="_blank">{safe_title}</a>
-              <div class="meta">{art["source_icon"]} {html_lib.escape(art["source"])} {score_badge} {html_lib.escape(art.get("date",""))}</div>
-            </div>'''
-        topic_cards += f'''
-        <div class="topic-card">
-          <div class="topic-header">{html_lib.escape(topic)} <span class="count">{count}</span></div>
-          {items_html}
-        </div>'''
+    def __contains__(self, h):
+        return all(self.data[p >> 3] >> (p & 7) & 1 for p in self._positions(h))
 
-    # ── Hot Stories Table ──────────────────────────────────────────────────────
-    hot_rows = ""
-    for i, art in enumerate(top_articles[:20], 1):
-        hot_rows += f'''
-        <tr>
-          <td class="rank">{i}</td>
-          <td><a href="{html_lib.escape(art["url"])}" target="_blank">{html_lib.escape(art["title"])}</a></td>
-          <td><span class="source-badge">{art["source_icon"]} {html_lib.escape(art["source"])}</span></td>
-          <td class="score">{art["score"]}</td>
-          <td>{html_lib.escape(art["topic"])}</td>
-          <td>{html_lib.escape(art.get("date",""))}</td>
-        </tr>'''
+    def add(self, h):
+        if h not in self:
+            for p in self._positions(h):
+                self.data[p >> 3] |= 1 << (p & 7)
+            self.count += 1
 
-    # ── Source Bars ────────────────────────────────────────────────────────────
-    max_count = max(sources.values()) if sources else 1
-    source_bars = ""
-    for src, cnt in sorted(sources.items(), key=lambda x: -x[1]):
-        pct = int(cnt / max_count * 100)
-        source_bars += f'''
-        <div class="source-row">
-          <div class="source-label">{html_lib.escape(src)}</div>
-          <div class="bar-wrap"><div class="bar" style="width:{pct}%">{cnt}</div></div>
-        </div>'''
 
-    generated_at = datetime.now().strftime("%B %d, %Y at %H:%M")
+class RunDiff:
+    """Compares a run's articles with the previous run's saved state."""
 
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>🚀 Eng Brand Machine — Miro Developer Brand</title>
-<style>
-  * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-  body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-          background: #0d1117; color: #c9d1d9; min-height: 100vh; }}
+    def __init__(self, directory=None):
+        self.dir = directory or os.path.join(STATE_DIR, "diff")
+        self.previous = self._load_items()  # url hash → score; None before the first run
+        self.seen = self._load_bloom()
+        try:
+            with open(os.path.join(self.dir, "topics.json"), encoding="utf-8") as f:
+                self.previous_topics = dict(json.load(f))
+        except (OSError, ValueError):
+            self.previous_topics = {}
+        self.current = {}
+
+    def _load_items(self):
+        try:
+            with open(os.path.join(self.dir, "items.bin"), "rb") as f:
+                magic, n = struct.unpack("<4sI", f.read(8))
+                if os.fstat(f.fileno()).st_size != 8 + 12 * n:  # a damaged header must not size a read
+                    return None
+                hashes, scores = array.array("Q"), array.array("i")
+                hashes.frombytes(f.read(8 * n))
+                scores.frombytes(f.read(4 * n))
+        except (OSError, struct.error, ValueError):
+            return None
+        return dict(zip(hashes, scores)) if magic == b"EBMD" and len(scores) == n else None
+
+    def _load_bloom(self):
+        try:
+            with open(os.path.join(self.dir, "seen.bloom"), "rb") as f:
+                magic, bits, hashes, count = struct.unpack("<4sIBQ", f.read(17))
+                data = bytearray(f.read())
+        except (OSError, struct.error):
+            return BloomFilter()
+        if magic != b"EBMB" or (bits, hashes) != (DIFF_BLOOM_BITS, DIFF_BLOOM_HASHES) or len(data) != bits // 8 \
+                or count > DIFF_BLOOM_CAPACITY:
+            return BloomFilter()  # resized, or full enough that false positives climb: start over
+        return BloomFilter(bits, hashes, data, count)
+
+    def _kind(self, h, score):
+        prev = self.previous.get(h)
+        if prev is None:
+            return "returning" if h in self.seen else "new"
+        threshold = max(DIFF_MIN_DELTA, abs(prev) * DIFF_CHANGE_RATIO)
+        if score >= prev + threshold:
+            return "rising"
+        if score <= prev - threshold:
+            return "falling"
+        return None
+
+    def classify(self, articles, topic_counts):
+        """Set article["change"] (and "prev_score" where it had one) in one
+        pass. → summary dict, or None on the first run, which only records state."""
+        kinds = {}
+        self.current = {}
+        for a in articles:
+            a.pop("change", None)
+            a.pop("prev_score", None)
+            h = url_hash(a.get("url") or a["title"])
+            if h not in self.current:  # the same story from two sources shares one verdict
+                self.current[h] = a["score"]
+                kinds[h] = self._kind(h, a["score"]) if self.previous is not None else None
+            if kinds[h]:
+                a["change"] = kinds[h]
+                if h in self.previous:
+                    a["prev_score"] = self.previous[h]
+        self.topic_counts = dict(topic_counts)
+        if self.previous is None:
+            return None
+        summary = dict.fromkeys(CHANGE_LABELS, 0)
+        for kind in kinds.values():
+            if kind:
+                summary[kind] += 1
+        summary["gone"] = sum(1 for h in self.previous if h not in self.current)
+        moves = {t: c - self.previous_topics.get(t, 0) for t, c in self.topic_counts.items()}
+        summary["topics_new"] = [t for t in self.topic_counts if t not in self.previous_topics]
+        summary["topics_dropped"] = [t for t in self.previous_topics if t not in self.topic_counts]
+        summary["topic_moves"] = sorted(((t, d) for t, d in moves.items() if d and t not in summary["topics_new"]),
+                                        key=lambda td: (-abs(td[1]), td[0]))[:5]
+        return summary
+
+    def save(self):
+        """This run becomes the previous run; its URLs join the ever-seen filter."""
+        for h in self.current:
+            self.seen.add(h)
+        os.makedirs(self.dir, exist_ok=True)
+        for name, chunks in (
+            ("items.bin", [struct.pack("<4sI", b"EBMD", len(self.current)),
+                           array.array("Q", self.current).tobytes(), array.array("i", self.current.values()).tobytes()]),
+            ("seen.bloom", [struct.pack("<4sIBQ", b"EBMB", self.seen.bits, self.seen.hashes, self.seen.count),
+                            bytes(self.seen.data)]),
+        ):
+            path = os.path.join(self.dir, name)
+            with open(_tmp_path(path), "wb") as f:
+                f.writelines(chunks)
+            os.replace(f.name, path)
+        _write_json_atomic(os.path.join(self.dir, "topics.json"), sorted(self.topic_counts.items()))
+
+
+def print_change_summary(summary):
+    if summary is None:
+        print("\n🔁 Changes: first run — recording state to compare the next run with")
+        return
+    counts = " · ".join(f"{summary[k]} {k}" for k in (*CHANGE_LABELS, "gone"))
+    print(f"\n🔁 Since last run: {counts}")
+    if summary["topics_new"]:
+        print(f"   New topics: {', '.join(summary['topics_new'])}")
+    if summary["topics_dropped"]:
+        print(f"   Dropped out: {', '.join(summary['topics_dropped'])}")
+    if summary["topic_moves"]:
+        print("   Biggest moves: " + ", ".join(f"{t} {d:+d}" for t, d in summary["topic_moves"]))
+
+
+# ─── PAGE ASSETS ───────────────────────────────────────────────────────────────
+# Static CSS and JS for the dashboard. Kept out of the f-string templates so
+# they are neither re-escaped nor re-interpolated on every build.
+
+PAGE_STYLE = """
+  * { box-sizing: border-box; margin: 0; padding: 0; }
+  body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+          background: #0d1117; color: #c9d1d9; min-height: 100vh; }
 
   /* ── Header ── */
-  header {{ background: linear-gradient(135deg, #1f2937 0%, #111827 100%);
-            border-bottom: 1px solid #30363d; padding: 28px 40px; }}
-  header h1 {{ font-size: 2.4rem; font-weight: 800;
+  header { background: linear-gradient(135deg, #1f2937 0%, #111827 100%);
+            border-bottom: 1px solid #30363d; padding: 28px 40px; }
+  header h1 { font-size: 2.4rem; font-weight: 800;
                background: linear-gradient(90deg, #FFD700, #FF6B6B, #bc8cff);
-               -webkit-background-clip: text; -webkit-text-fill-color: transparent; }}
-  header .subtitle {{ color: #8b949e; margin-top: 6px; font-size: 0.95rem; }}
-  header .miro-badge {{ display: inline-block; background: #FFD700; color: #111;
+               -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
+  header .subtitle { color: #8b949e; margin-top: 6px; font-size: 0.95rem; }
+  header .miro-badge { display: inline-block; background: #FFD700; color: #111;
                         font-weight: 700; font-size: 0.75rem; border-radius: 20px;
-                        padding: 3px 10px; margin-top: 10px; }}
+                        padding: 3px 10px; margin-top: 10px; }
 
   /* ── Stats bar ── */
-  .stats-bar {{ display: flex; gap: 16px; padding: 16px 40px; background: #161b22;
-                border-bottom: 1px solid #21262d; flex-wrap: wrap; }}
-  .stat {{ background: #21262d; border-radius: 8px; padding: 10px 18px; text-align: center; }}
-  .stat .num {{ font-size: 1.6rem; font-weight: 700; color: #FFD700; }}
-  .stat .label {{ font-size: 0.72rem; color: #8b949e; text-transform: uppercase; letter-spacing: 0.5px; }}
+  .stats-bar { display: flex; gap: 16px; padding: 16px 40px; background: #161b22;
+                border-bottom: 1px solid #21262d; flex-wrap: wrap; }
+  .stat { background: #21262d; border-radius: 8px; padding: 10px 18px; text-align: center; }
+  .stat .num { font-size: 1.6rem; font-weight: 700; color: #FFD700; }
+  .stat .label { font-size: 0.72rem; color: #8b949e; text-transform: uppercase; letter-spacing: 0.5px; }
 
   /* ── Main layout ── */
-  main {{ padding: 30px 40px; max-width: 1400px; margin: 0 auto; }}
-  h2 {{ font-size: 1.25rem; color: #e6edf3; margin: 32px 0 16px; padding-bottom: 8px;
-        border-bottom: 1px solid #21262d; }}
+  main { padding: 30px 40px; max-width: 1400px; margin: 0 auto; }
+  h2 { font-size: 1.25rem; color: #e6edf3; margin: 32px 0 16px; padding-bottom: 8px;
+        border-bottom: 1px solid #21262d; }
 
   /* ── Miro Recommendations ── */
-  .recs-section {{ background: linear-gradient(135deg, #1a1025 0%, #0d1117 100%);
+  .recs-section { background: linear-gradient(135deg, #1a1025 0%, #0d1117 100%);
                    border: 1px solid #6e40c9; border-radius: 14px; padding: 28px;
-                   margin-bottom: 36px; }}
-  .recs-section h2 {{ border-bottom-color: #6e40c9; color: #e6edf3; margin-top: 0; }}
-  .recs-intro {{ color: #8b949e; font-size: 0.9rem; margin-bottom: 20px; }}
-  .recs-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 16px; }}
-  .rec-card {{ background: #161b22; border: 1px solid #30363d; border-radius: 10px;
-               padding: 18px; position: relative; transition: border-color .2s, transform .2s; }}
-  .rec-card:hover {{ border-color: #bc8cff; transform: translateY(-2px); }}
-  .rec-num {{ position: absolute; top: 14px; right: 14px; background: #6e40c9;
+                   margin-bottom: 36px; }
+  .recs-section h2 { border-bottom-color: #6e40c9; color: #e6edf3; margin-top: 0; }
+  .recs-intro { color: #8b949e; font-size: 0.9rem; margin-bottom: 20px; }
+  .recs-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 16px; }
+  .rec-card { background: #161b22; border: 1px solid #30363d; border-radius: 10px;
+               padding: 18px; position: relative; transition: border-color .2s, transform .2s; }
+  .rec-card:hover { border-color: #bc8cff; transform: translateY(-2px); }
+  .rec-num { position: absolute; top: 14px; right: 14px; background: #6e40c9;
               color: #fff; border-radius: 50%; width: 26px; height: 26px; display: flex;
-              align-items: center; justify-content: center; font-size: 0.75rem; font-weight: 700; }}
-  .rec-topic {{ font-size: 0.72rem; color: #bc8cff; font-weight: 600; text-transform: uppercase;
-                letter-spacing: 0.5px; margin-bottom: 6px; }}
-  .rec-title {{ font-size: 1rem; font-weight: 700; color: #e6edf3; margin-bottom: 10px; line-height: 1.4; }}
-  .rec-desc {{ font-size: 0.84rem; color: #8b949e; line-height: 1.55; margin-bottom: 10px; }}
-  .rec-demo {{ font-size: 0.82rem; color: #c9d1d9; background: #21262d; border-radius: 6px;
-               padding: 8px 10px; margin-bottom: 10px; line-height: 1.5; }}
-  .rec-meta {{ display: flex; gap: 10px; flex-wrap: wrap; align-items: center; margin-bottom: 8px; }}
-  .rec-format {{ background: #1f6feb22; color: #58a6ff; border-radius: 4px;
-                 padding: 2px 8px; font-size: 0.75rem; }}
-  .rec-cta {{ color: #3fb950; font-size: 0.78rem; font-style: italic; }}
-  .inspired {{ font-size: 0.75rem; color: #6e7681; border-top: 1px solid #21262d;
-               padding-top: 8px; margin-top: 4px; }}
-  .inspired ul {{ margin: 4px 0 0 14px; }}
-  .inspired li {{ margin-bottom: 2px; }}
+              align-items: center; justify-content: center; font-size: 0.75rem; font-weight: 700; }
+  .rec-topic { font-size: 0.72rem; color: #bc8cff; font-weight: 600; text-transform: uppercase;
+                letter-spacing: 0.5px; margin-bottom: 6px; }
+  .rec-title { font-size: 1rem; font-weight: 700; color: #e6edf3; margin-bottom: 10px; line-height: 1.4; }
+  .rec-desc { font-size: 0.84rem; color: #8b949e; line-height: 1.55; margin-bottom: 10px; }
+  .rec-demo { font-size: 0.82rem; color: #c9d1d9; background: #21262d; border-radius: 6px;
+               padding: 8px 10px; margin-bottom: 10px; line-height: 1.5; }
+  .rec-meta { display: flex; gap: 10px; flex-wrap: wrap; align-items: center; margin-bottom: 8px; }
+  .rec-format { background: #1f6feb22; color: #58a6ff; border-radius: 4px;
+                 padding: 2px 8px; font-size: 0.75rem; }
+  .rec-cta { color: #3fb950; font-size: 0.78rem; font-style: italic; }
+  .inspired { font-size: 0.75rem; color: #6e7681; border-top: 1px solid #21262d;
+               padding-top: 8px; margin-top: 4px; }
+  .inspired ul { margin: 4px 0 0 14px; }
+  .inspired li { margin-bottom: 2px; }
 
   /* ── Blog Post Draft ── */
-  .view-draft-btn {{ background: #e8720c; color: #fff; border: none; border-radius: 20px;
+  .view-draft-btn { background: #e8720c; color: #fff; border: none; border-radius: 20px;
                     font-size: 0.82rem; font-weight: 700; padding: 8px 16px; cursor: pointer;
-                    margin-top: 12px; width: 100%; transition: background .15s; }}
-  .view-draft-btn:hover {{ background: #ff8c2a; }}
-  .post-draft {{ display: none; margin-top: 14px; border-top: 1px solid #30363d; padding-top: 14px; }}
-  .post-draft.open {{ display: block; }}
-  .post-hero {{ background: linear-gradient(135deg, #1a0a2e 0%, #0d1117 100%);
-               border: 1px solid #6e40c9; border-radius: 8px; padding: 20px; margin-bottom: 12px; }}
-  .post-hero-label {{ font-size: 0.7rem; color: #bc8cff; text-transform: uppercase;
-                     letter-spacing: 0.5px; font-weight: 600; margin-bottom: 6px; }}
-  .post-hero-prompt {{ font-family: "SFMono-Regular", Consolas, monospace; font-size: 0.78rem;
-                      color: #8b949e; line-height: 1.5; }}
-  .post-tags {{ display: flex; flex-wrap: wrap; gap: 6px; margin-bottom: 10px; }}
-  .post-tag {{ background: #161b22; color: #58a6ff; border: 1px solid #1f6feb44;
-              border-radius: 12px; font-size: 0.72rem; padding: 2px 8px; }}
-  .post-meta-bar {{ font-size: 0.75rem; color: #8b949e; margin-bottom: 12px;
-                   border-bottom: 1px solid #21262d; padding-bottom: 8px; }}
-  .post-body h2 {{ font-size: 1rem; color: #e6edf3; margin: 16px 0 8px; padding-bottom: 4px;
-                  border-bottom: 1px solid #21262d; }}
-  .post-body h3 {{ font-size: 0.9rem; color: #c9d1d9; margin: 12px 0 6px; }}
-  .post-body p {{ font-size: 0.85rem; color: #8b949e; line-height: 1.6; margin-bottom: 10px; }}
-  .post-body ul, .post-body ol {{ font-size: 0.85rem; color: #8b949e; margin: 0 0 10px 20px; line-height: 1.6; }}
-  .post-body li {{ margin-bottom: 4px; }}
-  .post-body strong {{ color: #c9d1d9; }}
-  .post-body em {{ color: #bc8cff; font-style: italic; }}
-  .image-callout {{ background: #1a1025; border: 1px solid #6e40c922; border-left: 3px solid #bc8cff;
+                    margin-top: 12px; width: 100%; transition: background .15s; }
+  .view-draft-btn:hover { background: #ff8c2a; }
+  .post-draft { display: none; margin-top: 14px; border-top: 1px solid #30363d; padding-top: 14px; }
+  .post-draft.open { display: block; }
+  .post-hero { background: linear-gradient(135deg, #1a0a2e 0%, #0d1117 100%);
+               border: 1px solid #6e40c9; border-radius: 8px; padding: 20px; margin-bottom: 12px; }
+  .post-hero-label { font-size: 0.7rem; color: #bc8cff; text-transform: uppercase;
+                     letter-spacing: 0.5px; font-weight: 600; margin-bottom: 6px; }
+  .post-hero-prompt { font-family: "SFMono-Regular", Consolas, monospace; font-size: 0.78rem;
+                      color: #8b949e; line-height: 1.5; }
+  .post-tags { display: flex; flex-wrap: wrap; gap: 6px; margin-bottom: 10px; }
+  .post-tag { background: #161b22; color: #58a6ff; border: 1px solid #1f6feb44;
+              border-radius: 12px; font-size: 0.72rem; padding: 2px 8px; }
+  .post-meta-bar { font-size: 0.75rem; color: #8b949e; margin-bottom: 12px;
+                   border-bottom: 1px solid #21262d; padding-bottom: 8px; }
+  .post-body h2 { font-size: 1rem; color: #e6edf3; margin: 16px 0 8px; padding-bottom: 4px;
+                  border-bottom: 1px solid #21262d; }
+  .post-body h3 { font-size: 0.9rem; color: #c9d1d9; margin: 12px 0 6px; }
+  .post-body p { font-size: 0.85rem; color: #8b949e; line-height: 1.6; margin-bottom: 10px; }
+  .post-body ul, .post-body ol { font-size: 0.85rem; color: #8b949e; margin: 0 0 10px 20px; line-height: 1.6; }
+  .post-body li { margin-bottom: 4px; }
+  .post-body strong { color: #c9d1d9; }
+  .post-body em { color: #bc8cff; font-style: italic; }
+  .image-callout { background: #1a1025; border: 1px solid #6e40c922; border-left: 3px solid #bc8cff;
                    border-radius: 6px; padding: 10px 14px; margin: 12px 0; font-size: 0.82rem;
-                   color: #8b949e; line-height: 1.5; }}
-  .image-callout strong {{ color: #bc8cff; }}
-  .copy-draft-btn {{ background: #1a4a2e; color: #3fb950; border: 1px solid #3fb95044;
+                   color: #8b949e; line-height: 1.5; }
+  .image-callout strong { color: #bc8cff; }
+  .copy-draft-btn { background: #1a4a2e; color: #3fb950; border: 1px solid #3fb95044;
                     border-radius: 6px; font-size: 0.82rem; font-weight: 700; padding: 8px 16px;
-                    cursor: pointer; margin-top: 10px; width: 100%; transition: background .15s; }}
-  .copy-draft-btn:hover {{ background: #1f6b3a; }}
+                    cursor: pointer; margin-top: 10px; width: 100%; transition: background .15s; }
+  .copy-draft-btn:hover { background: #1f6b3a; }
 
   /* ── Topic cards ── */
-  .topics-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(340px, 1fr)); gap: 16px; margin-bottom: 30px; }}
-  .topic-card {{ background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 16px; transition: border-color .2s; }}
-  .topic-card:hover {{ border-color: #58a6ff; }}
-  .topic-header {{ font-size: 1rem; font-weight: 700; color: #e6edf3; margin-bottom: 12px;
-                   display: flex; justify-content: space-between; align-items: center; }}
-  .count {{ background: #1f6feb; color: #fff; border-radius: 12px; padding: 2px 8px;
-             font-size: 0.75rem; font-weight: 600; }}
-  .article-item {{ padding: 8px 0; border-bottom: 1px solid #21262d; }}
-  .article-item:last-child {{ border-bottom: none; }}
-  .article-item a {{ color: #58a6ff; text-decoration: none; font-size: 0.87rem; line-height: 1.4; }}
-  .article-item a:hover {{ text-decoration: underline; color: #79c0ff; }}
-  .meta {{ font-size: 0.73rem; color: #8b949e; margin-top: 3px; }}
-  .badge {{ background: #1f6feb22; color: #58a6ff; border-radius: 4px; padding: 1px 5px; font-size: 0.7rem; }}
+  .topics-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(340px, 1fr)); gap: 16px; margin-bottom: 30px; }
+  .topic-card { background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 16px; transition: border-color .2s; }
+  .topic-card:hover { border-color: #58a6ff; }
+  .topic-header { font-size: 1rem; font-weight: 700; color: #e6edf3; margin-bottom: 12px;
+                   display: flex; justify-content: space-between; align-items: center; }
+  .count { background: #1f6feb; color: #fff; border-radius: 12px; padding: 2px 8px;
+             font-size: 0.75rem; font-weight: 600; }
+  .article-item { padding: 8px 0; border-bottom: 1px solid #21262d; }
+  .article-item:last-child { border-bottom: none; }
+  .article-item a { color: #58a6ff; text-decoration: none; font-size: 0.87rem; line-height: 1.4; }
+  .article-item a:hover { text-decoration: underline; color: #79c0ff; }
+  .meta { font-size: 0.73rem; color: #8b949e; margin-top: 3px; }
+
+  /* ── Change badges ── */
+  .change { border-radius: 4px; padding: 1px 5px; font-size: 0.68rem; font-weight: 700; white-space: nowrap; }
+  .change-new { background: #3fb95022; color: #3fb950; }
+  .change-rising { background: #1f6feb22; color: #58a6ff; }
+  .change-falling { background: #f8514922; color: #f85149; }
+  .change-returning { background: #bc8cff22; color: #bc8cff; }
+
+  /* ── Emerging terms ── */
+  .emerging-list { display: grid; grid-template-columns: repeat(auto-fill, minmax(280px, 1fr)); gap: 10px; margin-bottom: 30px; }
+  .emerging-item { background: #161b22; border: 1px solid #21262d; border-left: 3px solid #3fb950;
+                   border-radius: 8px; padding: 10px 14px; }
+  .emerging-term { font-weight: 700; color: #e6edf3; display: flex; justify-content: space-between; gap: 8px; }
+  .emerging-item a { color: #58a6ff; text-decoration: none; font-size: 0.82rem; }
+  .badge { background: #1f6feb22; color: #58a6ff; border-radius: 4px; padding: 1px 5px; font-size: 0.7rem; }
 
   /* ── Table ── */
-  table {{ width: 100%; border-collapse: collapse; background: #161b22; border-radius: 10px;
-           overflow: hidden; border: 1px solid #21262d; margin-bottom: 30px; }}
-  thead th {{ background: #21262d; padding: 11px 14px; text-align: left; font-size: 0.78rem;
-              text-transform: uppercase; letter-spacing: 0.5px; color: #8b949e; }}
-  tbody tr {{ border-top: 1px solid #21262d; transition: background .15s; }}
-  tbody tr:hover {{ background: #1c2128; }}
-  td {{ padding: 9px 14px; font-size: 0.84rem; }}
-  td a {{ color: #58a6ff; text-decoration: none; }}
-  td a:hover {{ text-decoration: underline; }}
-  .rank {{ color: #8b949e; font-weight: 700; font-size: 1rem; width: 38px; }}
-  .score {{ color: #3fb950; font-weight: 600; }}
-  .source-badge {{ background: #21262d; border-radius: 4px; padding: 2px 6px; font-size: 0.74rem; white-space: nowrap; }}
+  table { width: 100%; border-collapse: collapse; background: #161b22; border-radius: 10px;
+           overflow: hidden; border: 1px solid #21262d; margin-bottom: 30px; }
+  thead th { background: #21262d; padding: 11px 14px; text-align: left; font-size: 0.78rem;
+              text-transform: uppercase; letter-spacing: 0.5px; color: #8b949e; }
+  tbody tr { border-top: 1px solid #21262d; transition: background .15s; }
+  tbody tr:hover { background: #1c2128; }
+  td { padding: 9px 14px; font-size: 0.84rem; }
+  td a { color: #58a6ff; text-decoration: none; }
+  td a:hover { text-decoration: underline; }
+  .rank { color: #8b949e; font-weight: 700; font-size: 1rem; width: 38px; }
+  .score { color: #3fb950; font-weight: 600; }
+  .source-badge { background: #21262d; border-radius: 4px; padding: 2px 6px; font-size: 0.74rem; white-space: nowrap; }
 
   /* ── Sources ── */
-  .sources-section {{ background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 20px; margin-bottom: 30px; }}
-  .source-row {{ display: flex; align-items: center; gap: 12px; margin-bottom: 10px; }}
-  .source-label {{ min-width: 190px; font-size: 0.84rem; color: #c9d1d9; }}
-  .bar-wrap {{ flex: 1; background: #21262d; border-radius: 4px; height: 20px; }}
-  .bar {{ background: linear-gradient(90deg, #FFD700, #FF6B6B); border-radius: 4px; height: 20px;
+  .sources-section { background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 20px; margin-bottom: 30px; }
+  .source-row { display: flex; align-items: center; gap: 12px; margin-bottom: 10px; }
+  .source-label { min-width: 190px; font-size: 0.84rem; color: #c9d1d9; }
+  .bar-wrap { flex: 1; background: #21262d; border-radius: 4px; height: 20px; }
+  .bar { background: linear-gradient(90deg, #FFD700, #FF6B6B); border-radius: 4px; height: 20px;
           display: flex; align-items: center; padding-left: 8px; color: #111; font-size: 0.74rem;
-          font-weight: 700; min-width: 30px; }}
+          font-weight: 700; min-width: 30px; }
 
   /* ── Reddit section ── */
-  .reddit-section {{ background: linear-gradient(135deg, #1a0f0f 0%, #0d1117 100%);
-                     border: 1px solid #ff4500; border-radius: 14px; padding: 28px; margin-bottom: 36px; }}
-  .reddit-section h2 {{ border-bottom-color: #ff4500; color: #e6edf3; margin-top: 0; }}
-  .reddit-badge {{ background: #ff450022; color: #ff6b35; border: 1px solid #ff450044; }}
-  .reddit-card {{ border-color: #ff450033; }}
-  .reddit-card:hover {{ border-color: #ff4500; }}
-  .reddit-count {{ background: #ff4500; }}
-  .reddit-score {{ color: #ff6b35; font-weight: 700; }}
-  .ratio {{ background: #1a2a1a; color: #3fb950; border-radius: 4px;
-            padding: 1px 5px; font-size: 0.7rem; margin-left: 6px; }}
+  .reddit-section { background: linear-gradient(135deg, #1a0f0f 0%, #0d1117 100%);
+                     border: 1px solid #ff4500; border-radius: 14px; padding: 28px; margin-bottom: 36px; }
+  .reddit-section h2 { border-bottom-color: #ff4500; color: #e6edf3; margin-top: 0; }
+  .reddit-badge { background: #ff450022; color: #ff6b35; border: 1px solid #ff450044; }
+  .reddit-card { border-color: #ff450033; }
+  .reddit-card:hover { border-color: #ff4500; }
+  .reddit-count { background: #ff4500; }
+  .reddit-score { color: #ff6b35; font-weight: 700; }
+  .ratio { background: #1a2a1a; color: #3fb950; border-radius: 4px;
+            padding: 1px 5px; font-size: 0.7rem; margin-left: 6px; }
 
   /* ── Reddit config panel ── */
-  .reddit-config {{ background: #12080a; border: 1px solid #ff450055; border-radius: 10px;
-                    padding: 16px 20px; margin-bottom: 20px; }}
-  .reddit-config-title {{ font-size: 0.78rem; font-weight: 700; color: #ff6b35;
-                           text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 12px; }}
-  .sub-checkboxes {{ display: flex; flex-wrap: wrap; gap: 8px; margin-bottom: 14px; }}
-  .sub-check-label {{ display: flex; align-items: center; gap: 5px; font-size: 0.78rem;
+  .reddit-config { background: #12080a; border: 1px solid #ff450055; border-radius: 10px;
+                    padding: 16px 20px; margin-bottom: 20px; }
+  .reddit-config-title { font-size: 0.78rem; font-weight: 700; color: #ff6b35;
+                           text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 12px; }
+  .sub-checkboxes { display: flex; flex-wrap: wrap; gap: 8px; margin-bottom: 14px; }
+  .sub-check-label { display: flex; align-items: center; gap: 5px; font-size: 0.78rem;
                       color: #c9d1d9; background: #1a1010; border: 1px solid #ff450033;
                       border-radius: 16px; padding: 3px 10px; cursor: pointer;
-                      transition: border-color .15s, background .15s; user-select: none; }}
-  .sub-check-label:hover {{ border-color: #ff4500; background: #220d0d; }}
-  .sub-check-label input {{ accent-color: #ff4500; cursor: pointer; }}
-  .reddit-controls {{ display: flex; flex-wrap: wrap; align-items: center; gap: 10px; }}
-  .reddit-controls input[type=text] {{ background: #1a1010; border: 1px solid #ff450044;
+                      transition: border-color .15s, background .15s; user-select: none; }
+  .sub-check-label:hover { border-color: #ff4500; background: #220d0d; }
+  .sub-check-label input { accent-color: #ff4500; cursor: pointer; }
+  .reddit-controls { display: flex; flex-wrap: wrap; align-items: center; gap: 10px; }
+  .reddit-controls input[type=text] { background: #1a1010; border: 1px solid #ff450044;
                                         border-radius: 6px; color: #c9d1d9; font-size: 0.83rem;
-                                        padding: 6px 10px; outline: none; width: 220px; }}
-  .reddit-controls input[type=text]:focus {{ border-color: #ff6b35; }}
-  .reddit-controls select {{ background: #1a1010; border: 1px solid #ff450044; border-radius: 6px;
-                              color: #c9d1d9; font-size: 0.83rem; padding: 6px 10px; outline: none; cursor: pointer; }}
-  .reddit-controls select:focus {{ border-color: #ff6b35; }}
-  .fetch-btn {{ background: #ff4500; color: #fff; border: none; border-radius: 6px;
+                                        padding: 6px 10px; outline: none; width: 220px; }
+  .reddit-controls input[type=text]:focus { border-color: #ff6b35; }
+  .reddit-controls select { background: #1a1010; border: 1px solid #ff450044; border-radius: 6px;
+                              color: #c9d1d9; font-size: 0.83rem; padding: 6px 10px; outline: none; cursor: pointer; }
+  .reddit-controls select:focus { border-color: #ff6b35; }
+  .fetch-btn { background: #ff4500; color: #fff; border: none; border-radius: 6px;
                 font-size: 0.85rem; font-weight: 700; padding: 7px 18px; cursor: pointer;
-                transition: background .15s, transform .1s; }}
-  .fetch-btn:hover {{ background: #ff6b35; }}
-  .fetch-btn:active {{ transform: scale(0.97); }}
-  .fetch-btn:disabled {{ background: #7a3020; cursor: not-allowed; opacity: 0.7; }}
-  .fetch-status {{ font-size: 0.8rem; color: #8b949e; font-style: italic; }}
-  .loading-spinner {{ display: inline-block; width: 12px; height: 12px; border: 2px solid #ff450044;
+                transition: background .15s, transform .1s; }
+  .fetch-btn:hover { background: #ff6b35; }
+  .fetch-btn:active { transform: scale(0.97); }
+  .fetch-btn:disabled { background: #7a3020; cursor: not-allowed; opacity: 0.7; }
+  .fetch-status { font-size: 0.8rem; color: #8b949e; font-style: italic; }
+  .loading-spinner { display: inline-block; width: 12px; height: 12px; border: 2px solid #ff450044;
                       border-top-color: #ff4500; border-radius: 50%; animation: spin .7s linear infinite;
-                      margin-right: 6px; vertical-align: middle; }}
-  @keyframes spin {{ to {{ transform: rotate(360deg); }} }}
+                      margin-right: 6px; vertical-align: middle; }
+  @keyframes spin { to { transform: rotate(360deg); } }
 
-  footer {{ text-align: center; padding: 24px; color: #484f58; font-size: 0.78rem;
-            border-top: 1px solid #21262d; margin-top: 20px; }}
-</style>
-</head>
-<body>
+  footer { text-align: center; padding: 24px; color: #484f58; font-size: 0.78rem;
+            border-top: 1px solid #21262d; margin-top: 20px; }
+"""
 
-<header>
-  <h1>🚀 Eng Brand Machine</h1>
-  <p class="subtitle">Real-time engineering trends from {len(sources)} sources · {total} articles · {generated_at}</p>
-  <span class="miro-badge">✦ Miro Developer Brand Intelligence</span>
-</header>
+PAGE_SCRIPT = """
+function classifyTopic(title, body) {
+  const text = (title + " " + (body || "")).toLowerCase();
+  for (const [topic, keywords] of Object.entries(TOPIC_KEYWORDS)) {
+    for (const kw of keywords) {
+      if (text.includes(kw)) return topic;
+    }
+  }
+  return "🔧 Engineering";
+}
 
-<div class="stats-bar">
-  <div class="stat"><div class="num">{total}</div><div class="label">Articles Analyzed</div></div>
-  <div class="stat"><div class="num">{len(sources)}</div><div class="label">Live Sources</div></div>
-  <div class="stat"><div class="num">{len(topic_counts)}</div><div class="label">Topics Tracked</div></div>
-  <div class="stat"><div class="num">{topic_counts[0][0] if topic_counts else "—"}</div><div class="label">Hottest Topic</div></div>
-  <div class="stat"><div class="num">{topic_counts[0][1] if topic_counts else 0}</div><div class="label">Articles on #1 Topic</div></div>
-</div>
+// ── Helpers ───────────────────────────────────────────────────────────────
+function setStatus(msg, loading) {
+  const el = document.getElementById("fetch-status");
+  el.innerHTML = loading
+    ? `<span class="loading-spinner"></span>${msg}`
+    : msg;
+}
 
-<main>
+function escHtml(s) {
+  return String(s)
+    .replace(/&/g, "&amp;").replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;").replace(/"/g, "&quot;");
+}
 
-  <div class="recs-section">
-    <h2>✦ Top 5 Content Recommendations for Miro&apos;s Developer Brand</h2>
-    <p class="recs-intro">Generated from {total} articles across {len(sources)} sources — each recommendation is anchored to what engineers are actually reading today.</p>
-    <div class="recs-grid">
-      {rec_cards}
-    </div>
-  </div>
-
-  <div class="reddit-section">
-    <h2>🔴 Reddit — Interactive Subreddit Feed</h2>
-    <p class="recs-intro">Select subreddits, set a time filter, and click Fetch to pull live data directly from Reddit's public API.</p>
-
-    <div class="reddit-config">
-      <div class="reddit-config-title">⚙ Subreddits to fetch</div>
-      <div class="sub-checkboxes" id="sub-checkboxes">
-        {sub_checkboxes_html}
-      </div>
-      <div class="reddit-controls">
-        <input type="text" id="custom-sub" placeholder="Add custom: vim, cpp, ..." />
-        <select id="time-filter">
-          <option value="day">Today</option>
-          <option value="week" selected>This Week</option>
-          <option value="month">This Month</option>
-          <option value="year">This Year</option>
-          <option value="all">All Time</option>
-        </select>
-        <button class="fetch-btn" id="fetch-btn" onclick="fetchReddit()">🔴 Fetch Reddit</button>
-        <span class="fetch-status" id="fetch-status"></span>
-      </div>
-    </div>
-
-    <div id="reddit-results">
-      <!-- JS will render results here on load -->
-      <div style="text-align:center;padding:40px;color:#484f58;">
-        <div class="loading-spinner"></div> Loading Reddit data...
-      </div>
-    </div>
-  </div>
-
-  <h2>🔥 Trending Topics Across Engineering</h2>
-  <div class="topics-grid">
-    {topic_cards}
-  </div>
-
-  <h2>📊 Top Stories Right Now</h2>
-  <table>
-    <thead>
-      <tr><th>#</th><th>Title</th><th>Source</th><th>Score</th><th>Topic</th><th>Date</th></tr>
-    </thead>
-    <tbody>{hot_rows}</tbody>
-  </table>
-
-  <h2>📡 Source Coverage ({len(sources)} sources)</h2>
-  <div class="sources-section">{source_bars}</div>
-
-</main>
-<footer>Built with ❤️ at the hackathon · Eng Brand Machine · {generated_at}</footer>
-
-<script>
-// ── Topic classifier (mirrors Python TOPIC_KEYWORDS) ──────────────────────
-const TOPIC_KEYWORDS = {{
-  "🤖 AI / ML":        ["ai", "machine learning", "llm", "gpt", "neural", "ml", "deep learning",
-                         "openai", "claude", "gemini", "model", "transformer", "rag", "vector",
-                         "embedding", "agent", "copilot", "diffusion", "inference", "fine-tun"],
-  "☁️ Cloud / Infra":  ["cloud", "aws", "azure", "gcp", "kubernetes", "k8s", "serverless",
-                         "lambda", "container", "docker", "terraform", "infra", "platform"],
-  "🔐 Security":       ["security", "vulnerability", "exploit", "cve", "auth", "zero-day",
-                         "breach", "encryption", "firewall", "hack", "phishing", "malware", "zero trust"],
-  "⚡ Performance":    ["performance", "latency", "throughput", "optimization", "benchmark",
-                         "profiling", "cache", "fast", "speed", "scalab"],
-  "🦀 Languages":      ["rust", "go", "golang", "python", "javascript", "typescript", "java",
-                         "swift", "kotlin", "wasm", "webassembly", "zig", "elixir", "ruby"],
-  "🛠️ DevOps / SRE":  ["devops", "ci/cd", "cicd", "pipeline", "deployment", "gitops",
-                         "monitoring", "observability", "logging", "sre", "platform engineer"],
-  "🗄️ Databases":      ["database", "postgres", "mysql", "mongodb", "redis", "sql", "nosql",
-                         "vector db", "sqlite", "elasticsearch", "kafka", "streaming", "graph db"],
-  "🌐 Web / Frontend": ["react", "vue", "angular", "nextjs", "svelte", "css", "frontend",
-                         "browser", "web", "html", "graphql", "rest", "http", "wasm"],
-  "📱 Mobile":         ["ios", "android", "mobile", "swift", "flutter", "react native"],
-  "🏗️ Architecture":   ["architecture", "microservices", "design pattern", "ddd", "event",
-                         "distributed", "system design", "monolith", "refactor", "domain"],
-  "🧪 Testing / QA":   ["test", "testing", "qa", "unit test", "e2e", "coverage", "playwright",
-                         "cypress", "jest", "quality"],
-  "🎨 Dev Experience": ["dx", "developer experience", "tooling", "ide", "vscode", "editor",
-                         "productivity", "workflow", "developer tool"],
-}};
-
-function classifyTopic(title, body) {{
-  const text = (title + " " + (body || "")).toLowerCase();
-  for (const [topic, keywords] of Object.entries(TOPIC_KEYWORDS)) {{
-    for (const kw of keywords) {{
-      if (text.includes(kw)) return topic;
-    }}
-  }}
-  return "🔧 Engineering";
-}}
-
-// ── Helpers ───────────────────────────────────────────────────────────────
-function setStatus(msg, loading) {{
-  const el = document.getElementById("fetch-status");
-  el.innerHTML = loading
-    ? `<span class="loading-spinner"></span>${{msg}}`
-    : msg;
-}}
-
-function escHtml(s) {{
-  return String(s)
-    .replace(/&/g, "&amp;").replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;").replace(/"/g, "&quot;");
-}}
-
-function fmtDate(utc) {{
+function fmtDate(utc) {
   if (!utc) return "";
   const d = new Date(utc * 1000);
-  return d.toLocaleDateString("en-US", {{ month: "short", day: "numeric" }});
-}}
+  return d.toLocaleDateString("en-US", { month: "short", day: "numeric" });
+}
 
 // ── Post draft toggle / copy ──────────────────────────────────────────────
-function toggleDraft(btn) {{
+function toggleDraft(btn) {
   const draft = btn.nextElementSibling;
   draft.classList.toggle('open');
   btn.textContent = draft.classList.contains('open')
     ? '📝 Hide Post Draft ↑'
     : '📝 View Full Post Draft ↓';
-}}
+}
 
-function copyDraft(btn) {{
+function copyDraft(btn) {
   const body = btn.previousElementSibling.querySelector('.post-body');
   const text = body.innerText;
-  navigator.clipboard.writeText(text).then(() => {{
+  navigator.clipboard.writeText(text).then(() => {
     const orig = btn.textContent;
     btn.textContent = '✅ Copied!';
     setTimeout(() => btn.textContent = orig, 2000);
-  }}).catch(() => {{
+  }).catch(() => {
     btn.textContent = '⚠ Copy failed — select text manually';
-  }});
-}}
+  });
+}
 
-// ── Main fetch + render ───────────────────────────────────────────────────
-async function fetchReddit() {{
+// ── Reddit listings: bounded concurrency + IndexedDB cache ────────────────
+// Each subreddit/time-window listing is cached in IndexedDB. Fresh entries
+// (< REDDIT_TTL_MS) skip the network; older ones are painted immediately and
+// revalidated in the background (stale-while-revalidate) for up to
+// REDDIT_STALE_MS. Listings are fetched as multireddits (see fetchBatch); at
+// most REDDIT_MAX_IN_FLIGHT requests run at once.
+const REDDIT_MAX_IN_FLIGHT = 4;
+const REDDIT_TTL_MS = 15 * 60 * 1000;
+const REDDIT_STALE_MS = 24 * 60 * 60 * 1000;
+
+let redditDbPromise = null;
+function redditDb() {
+  if (!redditDbPromise) {
+    redditDbPromise = new Promise(resolve => {
+      if (!window.indexedDB) return resolve(null);
+      const req = indexedDB.open("ebm-reddit", 1);
+      req.onupgradeneeded = () => req.result.createObjectStore("listings", { keyPath: "key" });
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => resolve(null);   // private mode etc. — run uncached
+    });
+  }
+  return redditDbPromise;
+}
+
+async function cacheGet(key) {
+  const db = await redditDb();
+  if (!db) return undefined;
+  return new Promise(resolve => {
+    const req = db.transaction("listings").objectStore("listings").get(key);
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => resolve(undefined);
+  });
+}
+
+async function cachePut(key, posts) {
+  const db = await redditDb();
+  if (!db) return;
+  db.transaction("listings", "readwrite").objectStore("listings").put({ key, at: Date.now(), posts });
+}
+
+function limiter(max) {
+  let active = 0;
+  const queue = [];
+  const next = () => {
+    if (active >= max || !queue.length) return;
+    active++;
+    const { fn, resolve, reject } = queue.shift();
+    fn().then(resolve, reject).finally(() => { active--; next(); });
+  };
+  return fn => new Promise((resolve, reject) => { queue.push({ fn, resolve, reject }); next(); });
+}
+
+const redditLimit = limiter(REDDIT_MAX_IN_FLIGHT);
+
+// A 429 is retried after its Retry-After (else REDDIT_BACKOFF_SECONDS, doubling),
+// outside the in-flight limit; the status is the rejection once that runs out.
+function fetchListing(subs, filter, limit, after, attempt = 0) {
+  return redditLimit(() =>
+    fetch(`https://www.reddit.com/r/${subs}/top.json?t=${filter}&limit=${limit}${after ? `&after=${after}` : ""}`, {
+      headers: { "Accept": "application/json" }
+    }))
+    .then(r => {
+      if (r.ok) return r.json().then(d => ({ posts: d.data?.children || [], after: d.data?.after }));
+      const wait = Number(r.headers.get("Retry-After")) || REDDIT_BACKOFF_SECONDS * 2 ** attempt;
+      if (r.status !== 429 || attempt >= REDDIT_MAX_RETRIES || wait > REDDIT_MAX_BACKOFF_SECONDS) return Promise.reject(r.status);
+      return new Promise(resolve => setTimeout(resolve, wait * 1000))
+        .then(() => fetchListing(subs, filter, limit, after, attempt + 1));
+    });
+}
+
+// Subreddits that need the network are fetched REDDIT_BATCH_SIZE at a time as
+// one multireddit listing (/r/a+b+c/top.json), paged with `after` until each
+// has REDDIT_PER_SUB posts. Subs still short after REDDIT_MAX_PAGES pages are
+// backfilled with a request of their own — unless the listing stayed rate
+// limited, when more requests would only dig deeper. → [[sub, posts or null on error]]
+const REDDIT_PER_SUB = 25;
+
+async function fetchBatch(subs, filter) {
+  const bySub = new Map(subs.map(sub => [sub.toLowerCase(), []]));
+  let after = null, exhausted = false, limited = false;
+  try {
+    for (let page = 0; page < REDDIT_MAX_PAGES; page++) {
+      const listing = await fetchListing(subs.join("+"), filter, REDDIT_PAGE_SIZE, after);
+      for (const child of listing.posts) bySub.get((child.data?.subreddit || "").toLowerCase())?.push(child);
+      after = listing.after;
+      exhausted = !after;
+      if (exhausted || [...bySub.values()].every(posts => posts.length >= REDDIT_PER_SUB)) break;
+    }
+  }
+  catch (e) { limited = e === 429; /* otherwise the backfill covers whatever this left short */ }
+  return Promise.all(subs.map(async sub => {
+    const posts = bySub.get(sub.toLowerCase());
+    if (exhausted || posts.length >= REDDIT_PER_SUB) return [sub, posts.slice(0, REDDIT_PER_SUB)];
+    if (limited) return [sub, posts.length ? posts : null];
+    try { return [sub, (await fetchListing(sub, filter, REDDIT_PER_SUB)).posts]; }
+    catch (e) { return [sub, null]; }
+  }));
+}
+
+// Delivers cached posts first (if any), then live ones for subs whose cache
+// was missing or stale. onPosts(sub, children, origin) may fire twice per sub.
+async function loadSubreddits(subs, filter, onPosts) {
+  const key = sub => `${sub.toLowerCase()}|${filter}`;
+  const ages = new Map();   // sub → cache age, for the subs that need the network
+  await Promise.all(subs.map(async sub => {
+    const cached = await cacheGet(key(sub));
+    const age = cached ? Date.now() - cached.at : Infinity;
+    if (age < REDDIT_STALE_MS) onPosts(sub, cached.posts, age < REDDIT_TTL_MS ? "cached" : "stale");
+    if (age >= REDDIT_TTL_MS) ages.set(sub, age);
+  }));
+  const pending = [...ages.keys()], batches = [];
+  for (let i = 0; i < pending.length; i += REDDIT_BATCH_SIZE) batches.push(pending.slice(i, i + REDDIT_BATCH_SIZE));
+  await Promise.all(batches.map(async batch => {
+    for (const [sub, posts] of await fetchBatch(batch, filter)) {
+      if (posts) {
+        cachePut(key(sub), posts);
+        onPosts(sub, posts, "live");
+      }
+      else if (ages.get(sub) >= REDDIT_STALE_MS) onPosts(sub, [], "error");
+    }
+  }));
+}
+
+function toPost(sub, p) {
+  return {
+    id: p.id,
+    title: p.title,
+    url: p.url || `https://reddit.com${p.permalink}`,
+    comments_url: `https://reddit.com${p.permalink}`,
+    score: p.score || 0,
+    comments: p.num_comments || 0,
+    upvote_ratio: p.upvote_ratio || 0,
+    date: fmtDate(p.created_utc),
+    source: `r/${sub}`,
+    topic: classifyTopic(p.title, (p.selftext || "").slice(0, 300)),
+  };
+}
+
+// ── Main fetch + progressive render ───────────────────────────────────────
+let redditRun = 0;
+
+async function fetchReddit() {
   const btn = document.getElementById("fetch-btn");
   btn.disabled = true;
 
   const subs = [...document.querySelectorAll(".sub-check:checked")].map(el => el.value);
   const customRaw = document.getElementById("custom-sub").value.trim();
-  if (customRaw) {{
-    customRaw.split(",").forEach(s => {{ const t = s.trim(); if (t) subs.push(t); }});
-  }}
-  if (subs.length === 0) {{
+  if (customRaw) {
+    customRaw.split(",").forEach(s => { const t = s.trim(); if (t) subs.push(t); });
+  }
+  if (subs.length === 0) {
     setStatus("⚠ No subreddits selected.");
     btn.disabled = false;
     return;
-  }}
+  }
 
   const filter = document.getElementById("time-filter").value;
-  setStatus(`Fetching ${{subs.length}} subreddit${{subs.length > 1 ? "s" : ""}}...`, true);
-
-  const results = await Promise.all(subs.map(sub =>
-    fetch(`https://www.reddit.com/r/${{sub}}/top.json?t=${{filter}}&limit=25`, {{
-      headers: {{ "Accept": "application/json" }}
-    }})
-    .then(r => r.ok ? r.json() : Promise.reject(r.status))
-    .then(d => ({{ sub, posts: d.data?.children || [] }}))
-    .catch(() => ({{ sub, posts: [] }}))
-  ));
+  const filterLabel = document.getElementById("time-filter").selectedOptions[0].text;
+  const run = ++redditRun;   // a newer click supersedes this run's callbacks
+  const results = new Map(subs.map(sub => [sub, null]));
+  let settled = 0, frame = 0;
+
+  const paint = () => {
+    frame = 0;
+    if (run !== redditRun) return;
+    const shown = renderReddit(subs.map(sub => ({ sub, posts: results.get(sub) || [] })));
+    if (settled < subs.length) {
+      setStatus(`Loaded ${settled}/${subs.length} subreddits · ${shown.posts} posts so far...`, true);
+    } else {
+      setStatus(`✅ ${shown.posts} posts from ${shown.subs} subreddits · ${filterLabel}`);
+    }
+  };
+
+  setStatus(`Fetching ${subs.length} subreddit${subs.length > 1 ? "s" : ""}...`, true);
+  await loadSubreddits([...results.keys()], filter, (s, posts, origin) => {
+    if (run !== redditRun) return;
+    if (results.get(s) === null) settled++;
+    if (origin !== "error" || results.get(s) === null) results.set(s, posts);
+    if (!frame) frame = requestAnimationFrame(paint);
+  });
+
+  if (run === redditRun) {
+    btn.disabled = false;
+    paint();
+  }
+}
 
+function renderReddit(results) {
   // Flatten & deduplicate by post id
   const seen = new Set();
   const allPosts = [];
-  const bySubreddit = {{}};
+  const bySubreddit = {};
 
-  for (const {{ sub, posts }} of results) {{
+  for (const { sub, posts } of results) {
     bySubreddit[sub] = [];
-    for (const child of posts) {{
+    for (const child of posts) {
       const p = child.data;
       if (!p || !p.title || p.is_video || (p.score || 0) < 50) continue;
       if (seen.has(p.id)) continue;
       seen.add(p.id);
-      const post = {{
-        id: p.id,
-        title: p.title,
-        url: p.url || `https://reddit.com${{p.permalink}}`,
-        comments_url: `https://reddit.com${{p.permalink}}`,
-        score: p.score || 0,
-        comments: p.num_comments || 0,
-        upvote_ratio: p.upvote_ratio || 0,
-        date: fmtDate(p.created_utc),
-        source: `r/${{sub}}`,
-        topic: classifyTopic(p.title, (p.selftext || "").slice(0, 300)),
-      }};
+      const post = toPost(sub, p);
       allPosts.push(post);
       bySubreddit[sub].push(post);
-    }}
-  }}
+    }
+  }
 
   allPosts.sort((a, b) => b.score - a.score);
 
@@ -1343,27 +2704,27 @@ async function fetchReddit() {{
   const top15 = allPosts.slice(0, 15);
 
   let tableRows = "";
-  top15.forEach((p, i) => {{
+  top15.forEach((p, i) => {
     const ratio = p.upvote_ratio
-      ? `<span class="ratio">${{Math.round(p.upvote_ratio * 100)}}% up</span>`
+      ? `<span class="ratio">${Math.round(p.upvote_ratio * 100)}% up</span>`
       : "";
     tableRows += `
     <tr>
-      <td class="rank">${{i + 1}}</td>
+      <td class="rank">${i + 1}</td>
       <td>
-        <a href="${{escHtml(p.url)}}" target="_blank">${{escHtml(p.title)}}</a>
+        <a href="${escHtml(p.url)}" target="_blank">${escHtml(p.title)}</a>
         <div class="meta">
-          <a href="${{escHtml(p.comments_url)}}" target="_blank" style="color:#ff6b6b">
-            💬 ${{p.comments}} comments
+          <a href="${escHtml(p.comments_url)}" target="_blank" style="color:#ff6b6b">
+            💬 ${p.comments} comments
           </a>
         </div>
       </td>
-      <td><span class="source-badge reddit-badge">${{escHtml(p.source)}}</span></td>
-      <td class="score reddit-score">⬆ ${{p.score}} ${{ratio}}</td>
-      <td>${{escHtml(p.topic)}}</td>
-      <td>${{escHtml(p.date)}}</td>
+      <td><span class="source-badge reddit-badge">${escHtml(p.source)}</span></td>
+      <td class="score reddit-score">⬆ ${p.score} ${ratio}</td>
+      <td>${escHtml(p.topic)}</td>
+      <td>${escHtml(p.date)}</td>
     </tr>`;
-  }});
+  });
 
   // Per-subreddit cards (top 9 subs by total score)
   const subEntries = Object.entries(bySubreddit)
@@ -1372,70 +2733,2200 @@ async function fetchReddit() {{
     .slice(0, 9);
 
   let subCards = "";
-  for (const [sub, posts] of subEntries) {{
+  for (const [sub, posts] of subEntries) {
     const top3 = posts.slice(0, 3);
     let items = "";
-    for (const p of top3) {{
+    for (const p of top3) {
       items += `
       <div class="article-item">
-        <a href="${{escHtml(p.url)}}" target="_blank">${{escHtml(p.title)}}</a>
-        <div class="meta">⬆ ${{p.score}} · 💬 ${{p.comments}} · ${{escHtml(p.date)}}</div>
+        <a href="${escHtml(p.url)}" target="_blank">${escHtml(p.title)}</a>
+        <div class="meta">⬆ ${p.score} · 💬 ${p.comments} · ${escHtml(p.date)}</div>
       </div>`;
-    }}
+    }
     subCards += `
     <div class="topic-card reddit-card">
-      <div class="topic-header">r/${{escHtml(sub)}} <span class="count reddit-count">${{posts.length}}</span></div>
-      ${{items}}
+      <div class="topic-header">r/${escHtml(sub)} <span class="count reddit-count">${posts.length}</span></div>
+      ${items}
     </div>`;
-  }}
+  }
 
   const totalSubs = subEntries.length;
   const html = `
     <h3 style="color:#ff6b35;font-size:0.95rem;margin:16px 0 10px">
-      Top Posts Across All Subreddits (${{allPosts.length}} posts · ${{totalSubs}} subs)
+      Top Posts Across All Subreddits (${allPosts.length} posts · ${totalSubs} subs)
     </h3>
     <table>
       <thead>
         <tr><th>#</th><th>Title</th><th>Subreddit</th><th>Score</th><th>Topic</th><th>Date</th></tr>
       </thead>
-      <tbody>${{tableRows}}</tbody>
+      <tbody>${tableRows}</tbody>
     </table>
     <h3 style="color:#ff6b35;font-size:0.95rem;margin:20px 0 10px">By Subreddit</h3>
-    <div class="topics-grid">${{subCards}}</div>
+    <div class="topics-grid">${subCards}</div>
   `;
 
   document.getElementById("reddit-results").innerHTML = html;
-
-  const filterLabel = document.getElementById("time-filter").selectedOptions[0].text;
-  setStatus(`✅ ${{allPosts.length}} posts from ${{totalSubs}} subreddits · ${{filterLabel}}`);
-  btn.disabled = false;
-}}
+  return { posts: allPosts.length, subs: totalSubs };
+}
 
 document.addEventListener("DOMContentLoaded", fetchReddit);
-</script>
+"""
+
+# Split output mode (--split): the article set ships as a columnar JSON payload
+# and the topic cards / stories table are rendered client-side through a
+# virtualized list, so only the rows in view ever exist in the DOM.
+
+SPLIT_STYLE = """
+  .vtable { background: #161b22; border-radius: 10px; overflow: hidden; margin-bottom: 30px; }
+  .vhead, .vrow.hot { display: grid; grid-template-columns: 56px minmax(0, 1fr) 190px 80px 170px 100px;
+                      align-items: center; }
+  .vhead { background: #21262d; font-size: 0.78rem; color: #8b949e; }
+  .vhead div { padding: 11px 14px; cursor: pointer; user-select: none; white-space: nowrap; }
+  .vhead div:hover, .vhead div.sorted { color: #e6edf3; }
+  .vviewport { position: relative; overflow-y: auto; }
+  .vtable .vviewport { height: 760px; }
+  .vspacer { position: relative; }
+  .vrow { position: absolute; left: 0; right: 0; overflow: hidden; }
+  .vrow.hot { height: 38px; border-top: 1px solid #21262d; font-size: 0.84rem; }
+  .vrow.hot:hover { background: #1c2128; }
+  .vrow.hot > div { padding: 0 14px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+  .vrow a { color: #58a6ff; text-decoration: none; }
+  .vrow a:hover { text-decoration: underline; }
+  .vcard-list { max-height: 250px; }
+  .vrow.card { height: 50px; border-bottom: 1px solid #21262d; padding-top: 6px; }
+  .vrow.card a, .vrow.card .meta { display: block; white-space: nowrap; overflow: hidden;
+                                   text-overflow: ellipsis; font-size: 0.87rem; }
+  .pager { display: flex; align-items: center; gap: 10px; margin-bottom: 10px; font-size: 0.8rem; color: #8b949e; }
+  .pager button, .pager select { background: #21262d; color: #c9d1d9; border: 1px solid #30363d;
+                                 border-radius: 6px; padding: 4px 10px; cursor: pointer; }
+  .pager button:disabled { opacity: 0.4; cursor: default; }
+"""
+
+SPLIT_SCRIPT = """
+// ── Split mode: columnar article payload + virtualized lists ──────────────
+const OVERSCAN = 8;
+
+class VirtualList {
+  constructor(viewport, rowHeight, renderRow) {
+    this.viewport = viewport;
+    this.rowHeight = rowHeight;
+    this.renderRow = renderRow;
+    this.rows = [];
+    this.frame = 0;
+    this.spacer = document.createElement("div");
+    this.spacer.className = "vspacer";
+    viewport.appendChild(this.spacer);
+    viewport.addEventListener("scroll", () => {
+      if (!this.frame) this.frame = requestAnimationFrame(() => { this.frame = 0; this.draw(); });
+    }, { passive: true });
+  }
+  setRows(rows) {
+    this.rows = rows;
+    this.spacer.style.height = `${rows.length * this.rowHeight}px`;
+    this.viewport.scrollTop = 0;
+    this.draw();
+  }
+  draw() {
+    const top = this.viewport.scrollTop;
+    const height = this.viewport.clientHeight || 400;
+    const first = Math.max(0, Math.floor(top / this.rowHeight) - OVERSCAN);
+    const last = Math.min(this.rows.length, Math.ceil((top + height) / this.rowHeight) + OVERSCAN);
+    let html = "";
+    for (let i = first; i < last; i++) html += this.renderRow(this.rows[i], i, i * this.rowHeight);
+    this.spacer.innerHTML = html;
+  }
+}
+
+function loadArticles(p) {
+  const str = i => p.strings[i];
+  return {
+    n: p.n,
+    title: p.title, url: p.url,
+    commentsUrl: p.comments_url.map((u, i) => u || p.url[i]),
+    score: Int32Array.from(p.score), comments: Int32Array.from(p.comments),
+    source: Int32Array.from(p.source), topic: Int32Array.from(p.topic),
+    date: Int32Array.from(p.date), icon: Int32Array.from(p.icon),
+    change: Int32Array.from(p.change || []),
+    strings: p.strings, str,
+  };
+}
+
+// String-table columns sort by the rank of their string, computed once.
+function stringRanks(strings) {
+  const order = strings.map((_, i) => i).sort((a, b) => strings[a] < strings[b] ? -1 : strings[a] > strings[b] ? 1 : 0);
+  const rank = new Int32Array(strings.length);
+  order.forEach((id, r) => { rank[id] = r; });
+  return rank;
+}
+
+function changeBadge(D, i) {
+  const kind = D.change.length ? D.str(D.change[i]) : "";
+  return kind ? `<span class="change change-${kind}">${CHANGE_LABELS[kind]}</span>` : "";
+}
+
+function renderSplitDashboard(D) {
+  const rank = stringRanks(D.strings);
+  const keyOf = {
+    score: i => D.score[i], comments: i => D.comments[i],
+    source: i => rank[D.source[i]], topic: i => rank[D.topic[i]], date: i => rank[D.date[i]],
+  };
+  const all = Array.from({ length: D.n }, (_, i) => i);
+
+  // ── Topic cards: one virtualized list per topic, best-scored first ──
+  const byTopic = new Map();
+  for (const i of all) {
+    const t = D.topic[i];
+    if (!byTopic.has(t)) byTopic.set(t, []);
+    byTopic.get(t).push(i);
+  }
+  const grid = document.getElementById("topic-cards");
+  grid.innerHTML = "";
+  [...byTopic.entries()].sort((a, b) => b[1].length - a[1].length).forEach(([t, rows]) => {
+    const card = document.createElement("div");
+    card.className = "topic-card";
+    card.innerHTML = `<div class="topic-header">${escHtml(D.str(t))} <span class="count">${rows.length}</span></div>`;
+    const viewport = document.createElement("div");
+    viewport.className = "vviewport vcard-list";
+    card.appendChild(viewport);
+    grid.appendChild(card);
+    new VirtualList(viewport, 50, (i, _pos, y) => `
+      <div class="vrow card" style="top:${y}px">
+        <a href="${escHtml(D.url[i])}" target="_blank">${escHtml(D.title[i])}</a>
+        <div class="meta">${D.str(D.icon[i])} ${escHtml(D.str(D.source[i]))}
+          ${D.score[i] > 0 ? `<span class="badge">⬆ ${D.score[i]}</span>` : ""} ${changeBadge(D, i)} ${escHtml(D.str(D.date[i]))}</div>
+      </div>`).setRows(rows);
+  });
+
+  // ── Stories table: sortable, paged, virtualized ──
+  const state = { key: "score", dir: -1, page: 0, size: 1000, order: all };
+  const table = new VirtualList(document.getElementById("hot-viewport"), 38, (i, pos, y) => `
+    <div class="vrow hot" style="top:${y}px">
+      <div class="rank">${state.page * state.size + pos + 1}</div>
+      <div><a href="${escHtml(D.url[i])}" target="_blank" title="${escHtml(D.title[i])}">${escHtml(D.title[i])}</a> ${changeBadge(D, i)}</div>
+      <div><span class="source-badge">${D.str(D.icon[i])} ${escHtml(D.str(D.source[i]))}</span></div>
+      <div class="score">${D.score[i]}</div>
+      <div>${escHtml(D.str(D.topic[i]))}</div>
+      <div>${escHtml(D.str(D.date[i]))}</div>
+    </div>`);
+
+  function showPage() {
+    const pages = Math.max(1, Math.ceil(state.order.length / state.size));
+    state.page = Math.min(Math.max(state.page, 0), pages - 1);
+    const start = state.page * state.size;
+    table.setRows(state.order.slice(start, start + state.size));
+    document.getElementById("page-label").textContent =
+      `Page ${state.page + 1} of ${pages} · ${state.order.length} stories`;
+    document.getElementById("page-prev").disabled = state.page === 0;
+    document.getElementById("page-next").disabled = state.page >= pages - 1;
+  }
+
+  function sortBy(key) {
+    state.dir = state.key === key ? -state.dir : (key === "score" || key === "comments" ? -1 : 1);
+    state.key = key;
+    state.page = 0;
+    if (key === "rank") {
+      state.order = state.dir > 0 ? all : all.slice().reverse();
+    } else if (key === "title") {
+      state.order = all.slice().sort((a, b) => (D.title[a] < D.title[b] ? -1 : D.title[a] > D.title[b] ? 1 : 0) * state.dir);
+    } else {
+      const k = keyOf[key];
+      state.order = all.slice().sort((a, b) => (k(a) - k(b)) * state.dir);
+    }
+    document.querySelectorAll("#hot-head [data-key]").forEach(el =>
+      el.classList.toggle("sorted", el.dataset.key === key));
+    showPage();
+  }
+
+  document.querySelectorAll("#hot-head [data-key]").forEach(el =>
+    el.addEventListener("click", () => sortBy(el.dataset.key)));
+  document.getElementById("page-prev").onclick = () => { state.page--; showPage(); };
+  document.getElementById("page-next").onclick = () => { state.page++; showPage(); };
+  document.getElementById("page-size").onchange = e => {
+    state.size = Number(e.target.value) || state.order.length || 1;
+    state.page = 0;
+    showPage();
+  };
+  showPage();
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+  fetch(ARTICLES_URL)
+    .then(r => r.ok ? r.json() : Promise.reject(r.status))
+    .then(p => renderSplitDashboard(loadArticles(p)))
+    .catch(err => {
+      document.getElementById("topic-cards").innerHTML =
+        `<p class="recs-intro">⚠ Could not load ${escHtml(ARTICLES_URL)} (${escHtml(err)}). ` +
+        `Serve this folder over HTTP, e.g. <code>python3 -m http.server</code>.</p>`;
+    });
+});
+"""
+
+# Search (always on): the build writes an inverted index next to the page and
+# the page fetches it on the first keystroke in the search box.
+
+SEARCH_STYLE = """
+  .search-bar { position: relative; margin: 24px 0 8px; }
+  .search-bar input { width: 100%; background: #161b22; border: 1px solid #30363d; border-radius: 10px;
+                      color: #e6edf3; font-size: 0.95rem; padding: 12px 16px; outline: none; }
+  .search-bar input:focus { border-color: #58a6ff; }
+  .search-results { background: #161b22; border: 1px solid #30363d; border-radius: 10px;
+                    margin-top: 6px; max-height: 480px; overflow-y: auto; }
+  .search-results:empty { display: none; }
+  .search-results .article-item { padding: 8px 16px; }
+  .search-summary { font-size: 0.75rem; color: #8b949e; padding: 8px 16px; border-bottom: 1px solid #21262d; }
+"""
+
+SEARCH_SCRIPT = """
+// ── Search: lazily loaded inverted index ──────────────────────────────────
+// Postings are sorted doc ids, delta-encoded; they are decoded once per term
+// and intersected smallest-first, so a query never scans article strings.
+const SEARCH_MAX_PREFIX_TERMS = 64;
+const SEARCH_MAX_RESULTS = 50;
+let searchIndexPromise = null;
+
+function loadSearchIndex() {
+  if (!searchIndexPromise) {
+    searchIndexPromise = fetch(SEARCH_INDEX_URL)
+      .then(r => r.ok ? r.json() : Promise.reject(r.status))
+      .then(ix => ({
+        ...ix,
+        lookup: new Map(ix.terms.map((t, i) => [t, i])),
+        stop: new Set(ix.stop),
+        decoded: new Array(ix.terms.length),
+      }));
+  }
+  return searchIndexPromise;
+}
+
+function searchTokens(text, stop) {
+  return (text.toLowerCase().match(/[a-z0-9][a-z0-9+#]*/g) || []).filter(t => !stop.has(t));
+}
+
+function postingList(ix, term) {
+  let list = ix.decoded[term];
+  if (!list) {
+    const deltas = ix.postings[term];
+    list = new Int32Array(deltas.length);
+    let id = 0;
+    for (let i = 0; i < deltas.length; i++) { id += deltas[i]; list[i] = id; }
+    ix.decoded[term] = list;
+  }
+  return list;
+}
+
+function intersect(a, b) {
+  const out = new Int32Array(Math.min(a.length, b.length));
+  let i = 0, j = 0, n = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) { out[n++] = a[i]; i++; j++; }
+    else if (a[i] < b[j]) i++;
+    else j++;
+  }
+  return out.subarray(0, n);
+}
+
+function union(lists) {
+  if (lists.length === 1) return lists[0];
+  const seen = new Set();
+  for (const list of lists) for (const id of list) seen.add(id);
+  return Int32Array.from(seen).sort();
+}
+
+// Terms are sorted, so every term starting with prefix sits in one range.
+function prefixTerms(terms, prefix) {
+  let lo = 0, hi = terms.length;
+  while (lo < hi) { const mid = (lo + hi) >> 1; if (terms[mid] < prefix) lo = mid + 1; else hi = mid; }
+  const out = [];
+  for (let i = lo; i < terms.length && terms[i].startsWith(prefix) && out.length < SEARCH_MAX_PREFIX_TERMS; i++) out.push(i);
+  return out;
+}
+
+function searchDocs(ix, query) {
+  const tokens = searchTokens(query, ix.stop);
+  if (!tokens.length) return null;
+  const lists = [];
+  for (let i = 0; i < tokens.length; i++) {
+    // The word being typed matches as a prefix; finished words match exactly.
+    const typing = i === tokens.length - 1 && !/\\s$/.test(query);
+    const ids = typing ? prefixTerms(ix.terms, tokens[i]) : [ix.lookup.get(tokens[i])].filter(t => t !== undefined);
+    if (!ids.length) return new Int32Array(0);
+    lists.push(union(ids.map(t => postingList(ix, t))));
+  }
+  lists.sort((a, b) => a.length - b.length);
+  return lists.reduce(intersect);
+}
+
+function renderSearch(ix, query) {
+  const out = document.getElementById("search-results");
+  const t0 = performance.now();
+  const hits = searchDocs(ix, query);
+  const ms = (performance.now() - t0).toFixed(1);
+  if (!hits) { out.innerHTML = ""; return; }
+  const D = ix.docs, str = i => D.strings[i];
+  let html = `<div class="search-summary">${hits.length} matching stories · ${ms} ms</div>`;
+  // Doc ids are assigned best-scored first, so the first hits are the top ones.
+  for (const i of hits.subarray(0, SEARCH_MAX_RESULTS)) {
+    html += `
+      <div class="article-item">
+        <a href="${escHtml(D.url[i])}" target="_blank">${escHtml(D.title[i])}</a>
+        <div class="meta">${str(D.icon[i])} ${escHtml(str(D.source[i]))} · ${escHtml(str(D.topic[i]))}
+          ${D.score[i] > 0 ? `<span class="badge">⬆ ${D.score[i]}</span>` : ""} ${escHtml(str(D.date[i]))}</div>
+      </div>`;
+  }
+  out.innerHTML = html;
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+  const box = document.getElementById("search-box");
+  let frame = 0;
+  box.addEventListener("input", () => {
+    loadSearchIndex().then(ix => {
+      if (!frame) frame = requestAnimationFrame(() => { frame = 0; renderSearch(ix, box.value); });
+    }).catch(err => {
+      document.getElementById("search-results").innerHTML =
+        `<div class="search-summary">⚠ Could not load the search index (${escHtml(err)}). ` +
+        `Serve this folder over HTTP, e.g. <code>python3 -m http.server</code>.</div>`;
+    });
+  });
+});
+"""
+
+# Live updates (only in pages built by `serve`): new and changed stories are
+# pushed over server-sent events and prepended to a feed at the top.
+
+LIVE_STYLE = """
+  .live-feed { background: #0f1a14; border: 1px solid #3fb95055; border-radius: 10px;
+               margin: 16px 0; max-height: 320px; overflow-y: auto; }
+  .live-feed:empty { display: none; }
+  .live-title { font-size: 0.78rem; font-weight: 700; color: #3fb950; padding: 10px 16px;
+                border-bottom: 1px solid #21262d; text-transform: uppercase; letter-spacing: 0.5px; }
+  .live-feed .article-item { padding: 8px 16px; }
+  .live-badge { background: #3fb95022; color: #3fb950; border-radius: 4px; padding: 1px 5px;
+                font-size: 0.68rem; font-weight: 700; margin-right: 4px; }
+"""
+
+LIVE_SCRIPT = """
+// ── Live updates over SSE ─────────────────────────────────────────────────
+const LIVE_MAX_ITEMS = 50;
+
+document.addEventListener("DOMContentLoaded", () => {
+  if (!window.EventSource) return;
+  const feed = document.getElementById("live-feed");
+  const stream = new EventSource(STREAM_URL);
+  stream.addEventListener("articles", e => {
+    const update = JSON.parse(e.data);
+    const items = [...update.new.map(a => [a, "NEW"]), ...update.changed.map(a => [a, "UPDATED"])];
+    if (!items.length) return;
+    let html = "";
+    for (const [a, label] of items.slice(0, LIVE_MAX_ITEMS)) {
+      html += `
+        <div class="article-item">
+          <span class="live-badge">${label}</span>
+          <a href="${escHtml(a.url)}" target="_blank">${escHtml(a.title)}</a>
+          <div class="meta">${a.source_icon} ${escHtml(a.source)} · ${escHtml(a.topic)}
+            ${a.score > 0 ? `<span class="badge">⬆ ${a.score}</span>` : ""}</div>
+        </div>`;
+    }
+    if (!feed.children.length) feed.innerHTML = '<div class="live-title">🟢 Live updates</div>';
+    feed.firstElementChild.insertAdjacentHTML("afterend", html);
+    while (feed.children.length > LIVE_MAX_ITEMS + 1) feed.lastElementChild.remove();
+  });
+});
+"""
+
+
+# ─── HTML SECTIONS ─────────────────────────────────────────────────────────────
+
+def render_sub_checkboxes(subreddits):
+    # ── Reddit config checkboxes (for the JS-driven interactive panel) ─────────
+    sub_checkboxes_html = ""
+    for display_name, sub in subreddits:
+        sub_checkboxes_html += f'''<label class="sub-check-label">
+          <input type="checkbox" class="sub-check" value="{html_lib.escape(sub)}" checked>
+          {html_lib.escape(display_name)}
+        </label>'''
+    return sub_checkboxes_html
+
+
+def render_rec_cards(miro_recs):
+    # ── Miro Recommendations Cards ─────────────────────────────────────────────
+    rec_cards = ""
+    for i, rec in enumerate(miro_recs, 1):
+        inspired_html = ""
+        if rec.get("inspired_by"):
+            items = "".join(f"<li>{html_lib.escape(t)}</li>" for t in rec["inspired_by"][:2])
+            inspired_html = f'<div class="inspired"><strong>Inspired by trending:</strong><ul>{items}</ul></div>'
+
+        tags_html = "".join(
+            f'<span class="post-tag">#{html_lib.escape(t)}</span>'
+            for t in rec.get("tags", [])
+        )
+        hero_prompt_esc = html_lib.escape(rec.get("hero_prompt", ""))
+        seo_desc_esc = html_lib.escape(rec.get("seo_description", ""))
+        read_time_esc = html_lib.escape(rec.get("read_time", ""))
+        body_html = rec.get("body", "")  # raw HTML, no escaping
+
+        rec_cards += f'''
+        <div class="rec-card">
+          <div class="rec-num">#{i}</div>
+          <div class="rec-topic">{html_lib.escape(rec["topic"])}</div>
+          <div class="rec-title">{html_lib.escape(rec["title"])}</div>
+          <div class="rec-desc">{html_lib.escape(rec["description"])}</div>
+          <div class="rec-demo"><strong>🎬 Demo:</strong> {html_lib.escape(rec["demo"])}</div>
+          <div class="rec-meta">
+            <span class="rec-format">📄 {html_lib.escape(rec["format"])}</span>
+            <span class="rec-cta">{html_lib.escape(rec["cta"])}</span>
+          </div>
+          {inspired_html}
+          <button class="view-draft-btn" onclick="toggleDraft(this)">📝 View Full Post Draft ↓</button>
+          <div class="post-draft">
+            <div class="post-hero">
+              <div class="post-hero-label">🎨 Hero Image Prompt (Midjourney / DALL-E)</div>
+              <div class="post-hero-prompt">{hero_prompt_esc}</div>
+            </div>
+            <div class="post-tags">{tags_html}</div>
+            <div class="post-meta-bar">⏱ {read_time_esc} &nbsp;·&nbsp; 🔍 {seo_desc_esc}</div>
+            <div class="post-body">{body_html}</div>
+            <button class="copy-draft-btn" onclick="copyDraft(this)">📋 Copy Draft to Clipboard</button>
+          </div>
+        </div>'''
+    return rec_cards
+
+
+def change_badge(article):
+    kind = article.get("change")
+    if not kind:
+        return ""
+    since = f' title="was {article["prev_score"]}"' if "prev_score" in article else ""
+    return f'<span class="change change-{kind}"{since}>{CHANGE_LABELS[kind]}</span>'
+
+
+def render_topic_cards(topic_sections):
+    # ── Topic Cards ────────────────────────────────────────────────────────────
+    topic_cards = ""
+    for topic, count, topic_arts in topic_sections:
+        items_html = ""
+        for art in topic_arts:
+            safe_title = html_lib.escape(art["title"])
+            safe_url = html_lib.escape(art["url"])
+            score_badge = f'<span class="badge">⬆ {art["score"]}</span>' if art["score"] > 0 else ""
+            items_html += f'''
+            <div class="article-item">
+              <a href="{safe_url}" target="_blank">{safe_title}</a>
+              <div class="meta">{art["source_icon"]} {html_lib.escape(art["source"])} {score_badge} {change_badge(art)} {html_lib.escape(art.get("date",""))}</div>
+            </div>'''
+        topic_cards += f'''
+        <div class="topic-card">
+          <div class="topic-header">{html_lib.escape(topic)} <span class="count">{count}</span></div>
+          {items_html}
+        </div>'''
+    return topic_cards
+
+
+def render_emerging_terms(emerging):
+    # ── Emerging Terms ─────────────────────────────────────────────────────────
+    if not emerging:
+        return '<p class="recs-intro">Nothing is spiking above its usual level right now (the first run only records a baseline).</p>'
+    items = ""
+    for e in emerging:
+        items += f'''
+        <div class="emerging-item">
+          <div class="emerging-term">{html_lib.escape(e["term"])} <span class="badge">{e["count"]} vs ~{e["expected"]:g}</span></div>
+          <a href="{html_lib.escape(e["url"])}" target="_blank">{html_lib.escape(e["title"])}</a>
+        </div>'''
+    return f'<div class="emerging-list">{items}\n  </div>'
+
+
+def render_hot_rows(hot_articles):
+    # ── Hot Stories Table ──────────────────────────────────────────────────────
+    hot_rows = ""
+    for i, art in enumerate(hot_articles, 1):
+        hot_rows += f'''
+        <tr>
+          <td class="rank">{i}</td>
+          <td><a href="{html_lib.escape(art["url"])}" target="_blank">{html_lib.escape(art["title"])}</a> {change_badge(art)}</td>
+          <td><span class="source-badge">{art["source_icon"]} {html_lib.escape(art["source"])}</span></td>
+          <td class="score">{art["score"]}</td>
+          <td>{html_lib.escape(art["topic"])}</td>
+          <td>{html_lib.escape(art.get("date",""))}</td>
+        </tr>'''
+    return hot_rows
+
+
+def render_source_bars(source_counts):
+    # ── Source Bars ────────────────────────────────────────────────────────────
+    max_count = max((cnt for _src, cnt in source_counts), default=1)
+    source_bars = ""
+    for src, cnt in source_counts:
+        pct = int(cnt / max_count * 100)
+        source_bars += f'''
+        <div class="source-row">
+          <div class="source-label">{html_lib.escape(src)}</div>
+          <div class="bar-wrap"><div class="bar" style="width:{pct}%">{cnt}</div></div>
+        </div>'''
+    return source_bars
+
+
+def render_script(topic_keywords):
+    # The JS classifier mirrors TOPIC_KEYWORDS, so it is rendered from the dict.
+    return ("\n// ── Topic classifier (mirrors Python TOPIC_KEYWORDS) ──────────────────────\n"
+            f"const TOPIC_KEYWORDS = {json_for_script(topic_keywords)};\n"
+            f"const REDDIT_BATCH_SIZE = {REDDIT_BATCH_SIZE}, REDDIT_PAGE_SIZE = {REDDIT_PAGE_SIZE}, "
+            f"REDDIT_MAX_PAGES = {REDDIT_MAX_PAGES}, REDDIT_MAX_RETRIES = {REDDIT_MAX_RETRIES}, "
+            f"REDDIT_BACKOFF_SECONDS = {REDDIT_BACKOFF_SECONDS}, REDDIT_MAX_BACKOFF_SECONDS = {REDDIT_MAX_BACKOFF_SECONDS};\n"
+            + PAGE_SCRIPT)
+
+
+def render_split_tables():
+    # ── Client-rendered topic cards + stories table (--split) ──────────────────
+    topics_html = '<div class="topics-grid" id="topic-cards"></div>'
+    head = "".join(
+        f'<div data-key="{key}" class="{"sorted" if key == "score" else ""}">{label}</div>'
+        for key, label in [("rank", "#"), ("title", "Title"), ("source", "Source"),
+                           ("score", "Score"), ("topic", "Topic"), ("date", "Date")]
+    )
+    hot_html = f'''<div class="pager">
+    <button id="page-prev">← Prev</button>
+    <button id="page-next">Next →</button>
+    <select id="page-size">
+      <option value="100">100 / page</option>
+      <option value="1000" selected>1,000 / page</option>
+      <option value="10000">10,000 / page</option>
+      <option value="0">All</option>
+    </select>
+    <span id="page-label">Loading stories…</span>
+  </div>
+  <div class="vtable">
+    <div class="vhead" id="hot-head">{head}</div>
+    <div class="vviewport" id="hot-viewport"></div>
+  </div>'''
+    return topics_html, hot_html
+
+
+def build_article_payload(articles):
+    """Columnar, string-table encoded article set for --split mode, best-scored first."""
+    strings, ids = [], {}
+
+    def sid(value):
+        if value not in ids:
+            ids[value] = len(strings)
+            strings.append(value)
+        return ids[value]
+
+    cols = {name: [] for name in ("title", "url", "comments_url", "score", "comments",
+                                  "source", "icon", "topic", "date", "change")}
+    for a in sorted(articles, key=lambda x: -x["score"]):
+        cols["title"].append(a["title"])
+        cols["url"].append(a["url"])
+        # Most sources reuse the article URL for comments; store "" for those.
+        cols["comments_url"].append("" if a.get("comments_url") == a["url"] else a.get("comments_url", ""))
+        cols["score"].append(a["score"])
+        cols["comments"].append(a.get("comments", 0))
+        cols["source"].append(sid(a["source"]))
+        cols["icon"].append(sid(a["source_icon"]))
+        cols["topic"].append(sid(a["topic"]))
+        cols["date"].append(sid(a.get("date", "")))
+        cols["change"].append(sid(a.get("change", "")))
+    return {"v": 1, "n": len(articles), "strings": strings, **cols}
+
+
+def search_tokens(text):
+    """Lower-cased word tokens minus stopwords — mirrored by searchTokens() in SEARCH_SCRIPT."""
+    return [t for t in re.findall(r"[a-z0-9][a-z0-9+#]*", text.lower()) if t not in SEARCH_STOPWORDS]
+
+
+def build_search_index(articles):
+    """Inverted index over titles, topics and sources with delta-encoded postings.
+
+    Doc ids follow build_article_payload() order (best-scored first), and the
+    payload itself rides along as the doc store for rendering hits."""
+    docs = build_article_payload(articles)
+    strings = docs["strings"]
+    index = defaultdict(list)
+    for doc_id, title in enumerate(docs["title"]):
+        text = f'{title} {strings[docs["topic"][doc_id]]} {strings[docs["source"][doc_id]]}'
+        for token in set(search_tokens(text)):
+            index[token].append(doc_id)  # doc ids arrive in order, so lists stay sorted
+    terms = sorted(index)
+    postings = [[ids[0]] + [b - a for a, b in zip(ids, ids[1:])] for ids in (index[t] for t in terms)]
+    return {"v": 1, "stop": sorted(SEARCH_STOPWORDS), "terms": terms, "postings": postings, "docs": docs}
+
+
+def json_for_script(value):
+    """Serialize value as JSON that is safe to inline inside a <script> block."""
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+
+
+def generate_html(agg, topic_counts, miro_recs, generated_at=None, payload_url=None, search_url=None,
+                  stream_url=None, changes=None):
+    """Render the dashboard from an Aggregate. With payload_url, topic cards and
+    the stories table are left to the client, which loads the article set from
+    that URL. With search_url, a search box lazily loads the index from that URL.
+    With stream_url, the page subscribes to live updates from `serve`. changes
+    is the RunDiff summary shown in the stats bar. agg may also be a plain
+    article list, as in the original generate_html(articles, topic_counts, miro_recs)."""
+    agg = _as_aggregate(agg)
+    total = agg.total
+    source_counts = agg.source_counts()
+
+    # Each section is content-addressed: unchanged inputs reuse the fragment
+    # rendered by an earlier build instead of being escaped again.
+    style = PAGE_STYLE
+    sub_checkboxes_html = cached_stage("html:subreddits", SUBREDDITS,
+                                       lambda: render_sub_checkboxes(SUBREDDITS))
+    rec_cards = cached_stage("html:recs", miro_recs, lambda: render_rec_cards(miro_recs))
+    source_bars = cached_stage("html:sources", source_counts,
+                               lambda: render_source_bars(source_counts))
+    script = cached_stage("html:script", TOPIC_KEYWORDS, lambda: render_script(TOPIC_KEYWORDS))
+    emerging = agg.bursts.emerging() if agg.bursts else []
+    emerging_html = cached_stage("html:emerging", emerging, lambda: render_emerging_terms(emerging))
+
+    if payload_url:
+        style += SPLIT_STYLE
+        script += (f"\nconst ARTICLES_URL = {json_for_script(payload_url)};\n"
+                   f"const CHANGE_LABELS = {json_for_script(CHANGE_LABELS)};\n" + SPLIT_SCRIPT)
+        topics_html, hot_html = render_split_tables()
+    else:
+        top_articles = agg.hottest()
+        topic_sections = [(topic, count, agg.top(topic)) for topic, count in topic_counts[:8]]
+        topic_cards = cached_stage("html:topics", topic_sections,
+                                   lambda: render_topic_cards(topic_sections))
+        hot_rows = cached_stage("html:hot", top_articles, lambda: render_hot_rows(top_articles))
+        topics_html = f'''<div class="topics-grid">
+    {topic_cards}
+  </div>'''
+        hot_html = f'''<table>
+    <thead>
+      <tr><th>#</th><th>Title</th><th>Source</th><th>Score</th><th>Topic</th><th>Date</th></tr>
+    </thead>
+    <tbody>{hot_rows}</tbody>
+  </table>'''
+
+    search_html = ""
+    if search_url:
+        style += SEARCH_STYLE
+        script += f"\nconst SEARCH_INDEX_URL = {json_for_script(search_url)};\n" + SEARCH_SCRIPT
+        search_html = '''<div class="search-bar">
+    <input type="search" id="search-box" autocomplete="off"
+           placeholder="🔍 Search every story — try “postgres”, “rust async” or “devops”">
+    <div class="search-results" id="search-results"></div>
+  </div>'''
+
+    live_html = ""
+    if stream_url:
+        style += LIVE_STYLE
+        script += f"\nconst STREAM_URL = {json_for_script(stream_url)};\n" + LIVE_SCRIPT
+        live_html = '<div class="live-feed" id="live-feed"></div>'
+
+    changes_html = ""
+    if changes:
+        changes_html = (f'<div class="stat"><div class="num">{changes["new"]}</div><div class="label">New Since Last Run</div></div>\n'
+                        f'  <div class="stat"><div class="num">{changes["rising"]}</div><div class="label">Rising</div></div>')
+
+    generated_at = generated_at or datetime.now().strftime("%B %d, %Y at %H:%M")
+
+    body = f'''<body>
+
+<!--section:header-->
+<header>
+  <h1>🚀 Eng Brand Machine</h1>
+  <p class="subtitle">Real-time engineering trends from {len(source_counts)} sources · {total} articles · {generated_at}</p>
+  <span class="miro-badge">✦ Miro Developer Brand Intelligence</span>
+</header>
+
+<div class="stats-bar">
+  <div class="stat"><div class="num">{total}</div><div class="label">Articles Analyzed</div></div>
+  <div class="stat"><div class="num">{len(source_counts)}</div><div class="label">Live Sources</div></div>
+  <div class="stat"><div class="num">{len(topic_counts)}</div><div class="label">Topics Tracked</div></div>
+  <div class="stat"><div class="num">{topic_counts[0][0] if topic_counts else "—"}</div><div class="label">Hottest Topic</div></div>
+  <div class="stat"><div class="num">{topic_counts[0][1] if topic_counts else 0}</div><div class="label">Articles on #1 Topic</div></div>
+  {changes_html}
+</div>
+
+<main>
+
+  <!--section:search-->
+  {search_html}
+  {live_html}
+
+  <!--section:recs-->
+  <div class="recs-section">
+    <h2>✦ Top 5 Content Recommendations for Miro&apos;s Developer Brand</h2>
+    <p class="recs-intro">Generated from {total} articles across {len(source_counts)} sources — each recommendation is anchored to what engineers are actually reading today.</p>
+    <div class="recs-grid">
+      {rec_cards}
+    </div>
+  </div>
+
+  <!--section:reddit-->
+  <div class="reddit-section">
+    <h2>🔴 Reddit — Interactive Subreddit Feed</h2>
+    <p class="recs-intro">Select subreddits, set a time filter, and click Fetch to pull live data directly from Reddit's public API.</p>
+
+    <div class="reddit-config">
+      <div class="reddit-config-title">⚙ Subreddits to fetch</div>
+      <div class="sub-checkboxes" id="sub-checkboxes">
+        {sub_checkboxes_html}
+      </div>
+      <div class="reddit-controls">
+        <input type="text" id="custom-sub" placeholder="Add custom: vim, cpp, ..." />
+        <select id="time-filter">
+          <option value="day">Today</option>
+          <option value="week" selected>This Week</option>
+          <option value="month">This Month</option>
+          <option value="year">This Year</option>
+          <option value="all">All Time</option>
+        </select>
+        <button class="fetch-btn" id="fetch-btn" onclick="fetchReddit()">🔴 Fetch Reddit</button>
+        <span class="fetch-status" id="fetch-status"></span>
+      </div>
+    </div>
+
+    <div id="reddit-results">
+      <!-- JS will render results here on load -->
+      <div style="text-align:center;padding:40px;color:#484f58;">
+        <div class="loading-spinner"></div> Loading Reddit data...
+      </div>
+    </div>
+  </div>
+
+  <!--section:emerging-->
+  <h2>🌱 Emerging Terms</h2>
+  {emerging_html}
+
+  <!--section:topics-->
+  <h2>🔥 Trending Topics Across Engineering</h2>
+  {topics_html}
+
+  <!--section:stories-->
+  <h2>📊 Top Stories Right Now</h2>
+  {hot_html}
+
+  <!--section:sources-->
+  <h2>📡 Source Coverage ({len(source_counts)} sources)</h2>
+  <div class="sources-section">{source_bars}</div>
+
+<!--section:footer-->
+</main>
+<footer>Built with ❤️ at the hackathon · Eng Brand Machine · {generated_at}</footer>'''
+
+    # The fingerprint ignores the build timestamp so an otherwise identical
+    # page is recognised as unchanged by write_if_changed().
+    fingerprint = content_hash([style, body.replace(generated_at, ""), script])
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<meta name="ebm-fingerprint" content="{fingerprint}">
+<title>🚀 Eng Brand Machine — Miro Developer Brand</title>
+<style>{style}</style>
+</head>
+{body}
+
+<script>{script}</script>
 </body>
 </html>'''
 
 
-def main():
-    print("\n🚀 Eng Brand Machine — Aggregating Engineering Trends\n" + "=" * 58)
 
-    all_articles = []
-    all_articles.extend(fetch_hn_top(30))
-    all_articles.extend(fetch_hn_ask_show(20))
-    all_articles.extend(fetch_devto(20))
-    all_articles.extend(fetch_rss_feeds())
-    all_articles.extend(fetch_github_trending(25))
-    reddit_articles = fetch_reddit()
-    all_articles.extend(reddit_articles)
+# ─── POST-RENDER ───────────────────────────────────────────────────────────────
+# Minification, per-section size reporting, the page-weight budget and the
+# precompressed .gz/.br siblings for static hosts that serve them directly.
+
+_RAW_BLOCK_RE = re.compile(r"(<(script|style|pre|textarea)\b.*?</\2>)", re.S | re.I)
+_SECTION_MARK_RE = re.compile(r"<!--section:([a-z]+)-->")
+
+
+def _minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^") | {""}
+_JS_REGEX_KEYWORDS = {"return", "typeof", "case", "of", "in", "void", "delete", "throw"}
+
+
+def _js_lines(js):
+    """Split js into lines → (line, starts in code, ends in code), where "in
+    code" means outside any string, template literal, regex or comment. Just
+    enough of a tokenizer to know where whitespace and // are safe to drop."""
+    mode, templates, prev, word = None, [], "", ""  # templates: brace depth of each open ${…}
+    escaped = in_class = dollar = False
+    start = 0
+    starts_in_code = True
+    for i, c in enumerate(js):
+        if c == "\n":
+            if mode == "//":
+                mode = None
+            yield js[start:i], starts_in_code, mode is None
+            start, starts_in_code = i + 1, mode is None
+            continue
+        if mode in ("'", '"', "`", "re"):
+            after_dollar, dollar = dollar, False
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == "$":
+                dollar = True
+            elif mode == "re" and c in "[]":
+                in_class = c == "["
+            elif mode == "`" and c == "{" and after_dollar:
+                templates.append(0)
+                mode = None
+            elif c == mode or (mode == "re" and c == "/" and not in_class):
+                mode, prev, word = None, ")", ""  # a finished literal is a value, like ")"
+            continue
+        if mode == "/*":
+            if c == "/" and js[i - 1] == "*":
+                mode = None
+            continue
+        if mode == "//" or c.isspace():
+            continue
+        if c in "'\"`":
+            mode = c
+        elif c == "/" and js[i + 1:i + 2] in ("/", "*"):
+            mode = "/" + js[i + 1]
+        elif c == "/" and (prev in _JS_REGEX_AFTER or word in _JS_REGEX_KEYWORDS):
+            mode, in_class = "re", False
+        elif templates and c == "{":
+            templates[-1] += 1
+        elif templates and c == "}":
+            if templates[-1]:
+                templates[-1] -= 1
+            else:
+                templates.pop()
+                mode = "`"  # back inside the template literal
+                continue
+        if mode is None:
+            word = word + c if c.isalnum() or c in "_$" else ""
+            prev = c
+    yield js[start:], starts_in_code, mode is None
+
+
+def _minify_js(js):
+    # Line-based and deliberately conservative: drop indentation, blank lines
+    # and whole-line comments, but only where a line starts or ends in code —
+    # text inside a template literal or string is kept byte for byte.
+    out = []
+    for line, starts, ends in _js_lines(js):
+        line = line.lstrip() if starts else line
+        line = line.rstrip() if ends else line
+        if not (starts and ends and (not line or line.startswith("//"))):
+            out.append(line)
+    return "\n".join(out)
+
+
+def _minify_markup(markup):
+    markup = re.sub(r"<!--(?!section:).*?-->", "", markup, flags=re.S)
+    return re.sub(r"\s+", " ", markup)
+
+
+def minify_html(html):
+    """Minify inline CSS/JS and collapse markup whitespace; <pre>/<textarea> are left alone."""
+    parts = _RAW_BLOCK_RE.split(html)
+    out = []
+    # re.split with two groups yields [markup, block, tag, markup, block, tag, ...]
+    for i in range(0, len(parts), 3):
+        out.append(_minify_markup(parts[i]))
+        if i + 1 < len(parts):
+            block, tag = parts[i + 1], parts[i + 2].lower()
+            open_end = block.index(">") + 1
+            close_start = block.rindex("</")
+            inner = block[open_end:close_start]
+            if tag == "style":
+                inner = _minify_css(inner)
+            elif tag == "script":
+                inner = _minify_js(inner)
+            out.append(block[:open_end] + inner + block[close_start:])
+    minified = "".join(out)
+    # Fold the minifier's version into the fingerprint so write_if_changed()
+    # never keeps a page that was minified differently.
+    return re.sub(
+        r'(<meta name="ebm-fingerprint" content=")([0-9a-f]+)(">)',
+        lambda m: m.group(1) + content_hash([m.group(2), "min", code_version()]) + m.group(3),
+        minified, count=1,
+    )
+
+
+def section_sizes(html):
+    """[(section, raw bytes, gzip bytes)] for <style>, <script> and each marked body section."""
+    sections = []
+    for tag in ("style", "script"):
+        m = re.search(rf"<{tag}\b.*?</{tag}>", html, re.S | re.I)
+        if m:
+            sections.append((tag, m.group(0)))
+            html = html.replace(m.group(0), "", 1)
+    pieces = _SECTION_MARK_RE.split(html)
+    sections.append(("head", pieces[0]))
+    sections.extend(zip(pieces[1::2], pieces[2::2]))
+    return [(name, len(text.encode("utf-8")), len(gzip.compress(text.encode("utf-8"), 9, mtime=0)))
+            for name, text in sections]
+
+
+def strip_section_markers(html):
+    return _SECTION_MARK_RE.sub("", html)
+
+
+def print_size_report(sizes, total_raw, total_gz):
+    print("\n📦 Page weight:")
+    for name, raw, gz in sorted(sizes, key=lambda x: -x[1]):
+        print(f"   {name:<10} {raw / 1024:7.1f} KB  ({gz / 1024:5.1f} KB gz)")
+    print(f"   {'total':<10} {total_raw / 1024:7.1f} KB  ({total_gz / 1024:5.1f} KB gz)")
+
+
+def check_budget(total_gz, budget, fail):
+    """Warn — or, with fail=True, stop the build — when the gzipped page exceeds budget bytes."""
+    if not budget or total_gz <= budget:
+        return
+    msg = f"page is {total_gz / 1024:.1f} KB gzipped, over the {budget / 1024:.1f} KB budget"
+    if fail:
+        raise SystemExit(f"❌ Budget exceeded: {msg}")
+    print(f"  ⚠️  Budget exceeded: {msg}")
+
+
+def write_precompressed(path, data):
+    """Write path.gz and path.br."""
+    import brotli  # only --precompress needs it
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, 9, mtime=0))
+    with open(path + ".br", "wb") as f:
+        f.write(brotli.compress(data, quality=11))
+
+
+def write_outputs(output_path, html, sidecars, precompress=False):
+    """Write the page and its sidecar files. Returns False, writing nothing,
+    when the page is unchanged and every sidecar is already on disk."""
+    folder = os.path.dirname(output_path)
+    paths = {os.path.join(folder, name): body for name, body in sidecars.items()}
+    if not write_if_changed(output_path, html) and all(os.path.exists(p) for p in paths):
+        return False
+    for path, body in paths.items():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+        if precompress:
+            write_precompressed(path, body.encode("utf-8"))
+    if precompress:
+        write_precompressed(output_path, html.encode("utf-8"))
+    return True
+
+
+# ─── EXPORTS ───────────────────────────────────────────────────────────────────
+# Machine-readable siblings of the dashboard for downstream tools (--export DIR).
+# Every writer streams: records go to a temp file as they come and the file is
+# swapped in on close(), so exporting a long history never builds the document
+# in memory and readers never see a half-written file.
+
+class _AtomicFile:
+    def __init__(self, path, mode="w"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._f = open(_tmp_path(path), mode, **({} if "b" in mode else {"encoding": "utf-8"}))
+
+    def close(self):
+        self._f.close()
+        os.replace(self._f.name, self.path)
+
+
+class JsonLinesWriter(_AtomicFile):
+    """One JSON object per article per line."""
+
+    def write(self, article):
+        self._f.write(json.dumps(article, ensure_ascii=False) + "\n")
+
+
+class ColumnarWriter(_AtomicFile):
+    """Compact column-oriented article file for analytics. Layout (little-endian):
+
+        b"EBMC" u16 version, u16 column count, then per column:
+            u8 name length, name (utf-8), u8 array typecode
+        row groups of up to COLUMNAR_GROUP_ROWS rows, each:
+            u32 rows, then per column its typed array (numbers as-is; strings
+            as u32 indexes into the group's string table), then the string
+            table: u32 count, u32 byte lengths[count], utf-8 bytes
+        u32 0 (end marker)
+
+    Only one row group is buffered at a time, and repeated strings (source,
+    topic) are stored once per group. read_columnar() is the reference reader."""
+
+    def __init__(self, path):
+        super().__init__(path, "wb")
+        self._f.write(b"EBMC" + struct.pack("<HH", COLUMNAR_VERSION, len(COLUMNAR_SCHEMA)))
+        for name, typecode in COLUMNAR_SCHEMA:
+            self._f.write(struct.pack("<B", len(name)) + name.encode("utf-8") + typecode.encode("ascii"))
+        self._new_group()
+
+    def _new_group(self):
+        self._columns = [array.array(typecode) for _, typecode in COLUMNAR_SCHEMA]
+        self._strings = {}
+
+    def write(self, article):
+        for (name, typecode), column in zip(COLUMNAR_SCHEMA, self._columns):
+            value = article.get(name)
+            if typecode == "I":
+                value = self._strings.setdefault(value or "", len(self._strings))
+            column.append(int(value or 0))
+        if len(self._columns[0]) >= COLUMNAR_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self):
+        rows = len(self._columns[0])
+        if not rows:
+            return
+        self._f.write(struct.pack("<I", rows))
+        for column in self._columns:
+            if sys.byteorder == "big":
+                column.byteswap()
+            column.tofile(self._f)
+        encoded = [text.encode("utf-8") for text in self._strings]  # dicts keep index order
+        lengths = array.array("I", map(len, encoded))
+        if sys.byteorder == "big":
+            lengths.byteswap()
+        self._f.write(struct.pack("<I", len(encoded)))
+        lengths.tofile(self._f)
+        self._f.write(b"".join(encoded))
+        self._new_group()
+
+    def close(self):
+        self._flush()
+        self._f.write(struct.pack("<I", 0))
+        super().close()
+
+
+def read_columnar(path):
+    """Yield each row of a ColumnarWriter file as a dict, one row group at a time."""
+    with open(path, "rb") as f:
+        if f.read(4) != b"EBMC":
+            raise ValueError(f"{path}: not an EBMC file")
+        _version, ncols = struct.unpack("<HH", f.read(4))
+        schema = []
+        for _ in range(ncols):
+            name = f.read(f.read(1)[0]).decode("utf-8")
+            schema.append((name, f.read(1).decode("ascii")))
+        while (rows := struct.unpack("<I", f.read(4))[0]):
+            columns = []
+            for _, typecode in schema:
+                column = array.array(typecode)
+                column.fromfile(f, rows)
+                if sys.byteorder == "big":
+                    column.byteswap()
+                columns.append(column)
+            count = struct.unpack("<I", f.read(4))[0]
+            lengths = array.array("I")
+            lengths.fromfile(f, count)
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            blob, strings, offset = f.read(sum(lengths)), [], 0
+            for n in lengths:
+                strings.append(blob[offset:offset + n].decode("utf-8"))
+                offset += n
+            for i in range(rows):
+                yield {name: strings[col[i]] if typecode == "I" else col[i]
+                       for (name, typecode), col in zip(schema, columns)}
+
+
+def write_atom_feed(path, miro_recs, updated):
+    """Atom feed of the recommendations, emitted element by element with XMLGenerator."""
+    from xml.sax.saxutils import XMLGenerator
+    out = _AtomicFile(path)
+    xml = XMLGenerator(out._f, encoding="utf-8", short_empty_elements=True)
+    stamp = updated.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def element(name, text, attrs=None):
+        xml.startElement(name, attrs or {})
+        xml.characters(text)
+        xml.endElement(name)
+
+    xml.startDocument()
+    xml.startElement("feed", {"xmlns": "http://www.w3.org/2005/Atom"})
+    element("title", "Eng Brand Machine — Miro content recommendations")
+    element("id", ATOM_FEED_ID)
+    element("updated", stamp)
+    xml.startElement("author", {})
+    element("name", "Eng Brand Machine")
+    xml.endElement("author")
+    for rec in miro_recs:
+        xml.startElement("entry", {})
+        element("title", rec["title"])
+        # Stable per recommendation, so feed readers only flag genuinely new ones.
+        element("id", f"{ATOM_FEED_ID}:{content_hash([rec['topic'], rec['title']])[:16]}")
+        element("updated", stamp)
+        element("summary", rec.get("description", ""))
+        element("content", rec.get("body", ""), {"type": "html"})  # the body is markup; XMLGenerator escapes it
+        xml.startElement("category", {"term": rec["topic"]})
+        xml.endElement("category")
+        for tag in rec.get("tags", []):
+            xml.startElement("category", {"term": tag})
+            xml.endElement("category")
+        xml.endElement("entry")
+    xml.endElement("feed")
+    xml.endDocument()
+    out.close()
+
+
+def write_exports(export_dir, articles, miro_recs, updated=None):
+    """articles.jsonl, articles.ebmc and recommendations.atom in export_dir."""
+    jsonl = JsonLinesWriter(os.path.join(export_dir, "articles.jsonl"))
+    columnar = ColumnarWriter(os.path.join(export_dir, "articles.ebmc"))
+    for a in articles:
+        jsonl.write(a)
+        columnar.write(a)
+    for writer in (jsonl, columnar):
+        writer.close()
+        print(f"✅ Exported → {writer.path}")
+    feed = os.path.join(export_dir, "recommendations.atom")
+    write_atom_feed(feed, miro_recs, updated or datetime.now(timezone.utc))
+    print(f"✅ Exported → {feed}")
+
+
+# ─── NOTIFICATIONS ─────────────────────────────────────────────────────────────
+# Slack/Discord-style webhooks for recommendations and top stories that are new
+# since the previous run. Events are coalesced into one message per channel and
+# kept in a persistent queue under STATE_DIR; a background thread delivers due
+# messages concurrently over a pooled session and retries failures with
+# exponential backoff, so a slow endpoint never holds up the dashboard.
+
+def _notify_dir():
+    return os.path.join(STATE_DIR, "notify")
+
+
+def webhook_payload(url, events):
+    """One batched chat message for a list of events; Discord wants "content"
+    (max 2000 chars), Slack and most other incoming webhooks take "text"."""
+    recs = [e for e in events if e["kind"] == "rec"]
+    stories = [e for e in events if e["kind"] == "story"]
+    discord = "discord.com/api/webhooks" in url or "discordapp.com/api/webhooks" in url
+    link = (lambda e: f"[{e['title']}]({e['url']})") if discord else (lambda e: f"<{e['url']}|{e['title']}>")
+    lines = [f"🚀 Eng Brand Machine — {len(recs)} new recommendation(s), {len(stories)} new top story(ies)"]
+    lines += [f"✦ [{e['topic']}] {e['title']}" for e in recs]
+    lines += [f"🔥 {link(e)} — {e['source']}, {e['score']} pts" for e in stories]
+    text = "\n".join(lines)
+    return {"content": text[:2000]} if discord else {"text": text}
+
+
+def _channel_id(url):
+    """What the queue stores instead of a webhook URL, whose path is a secret:
+    STATE_DIR may be cached or shared (CI caches it), the URLs live only in
+    --webhook / $EBM_WEBHOOKS."""
+    return content_hash(url)[:16]
+
+
+class Notifier:
+    """Works out what's new per build, queues one batched message per channel
+    and delivers the queue in the background. The queue survives restarts:
+    whatever a build process couldn't deliver before exiting is retried by
+    the next run, provided the channel's URL is still configured."""
+
+    def __init__(self, urls):
+        self.channels = {_channel_id(url): url for url in urls}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._queue_path = os.path.join(_notify_dir(), "queue.json")
+        self._seen_path = os.path.join(_notify_dir(), "seen.json")
+        try:
+            with open(self._queue_path, encoding="utf-8") as f:
+                self._queue = json.load(f)
+        except (OSError, ValueError):
+            self._queue = []
+        for e in self._queue:  # queues written before channel ids held the URL itself
+            if "url" in e:
+                e["channel"] = _channel_id(e.pop("url"))
+        self._queue = [e for e in self._queue if e["channel"] in self.channels]
+        self._inflight = 0
+        self._thread = None
+
+    def notify(self, miro_recs, hottest):
+        """Queue the recommendations and top stories not seen in the last NOTIFY_SEEN_DAYS."""
+        recs = [{"kind": "rec", "id": content_hash([r["topic"], r["title"]])[:16], "title": r["title"],
+                 "topic": r["topic"], "url": "", "source": "", "score": 0} for r in miro_recs]
+        stories = [{"kind": "story", "id": content_hash(a["url"])[:16], "title": a["title"], "topic": a["topic"],
+                    "url": a["url"], "source": a["source"], "score": a["score"]} for a in hottest[:NOTIFY_TOP_STORIES]]
+        # id → when it was last among a run's events, so a story that drops out
+        # of the top for a run or two isn't announced again when it comes back.
+        now = time.time()
+        try:
+            with open(self._seen_path, encoding="utf-8") as f:
+                seen = json.load(f)
+            if isinstance(seen, list):  # the previous run's ids, from before timestamps
+                seen = dict.fromkeys(seen, now)
+        except (OSError, ValueError):
+            seen = None
+        cutoff = now - NOTIFY_SEEN_DAYS * 86400
+        history = {key: t for key, t in (seen or {}).items() if t >= cutoff}
+        events = [e for e in recs + stories if e["id"] not in history]
+        history.update(dict.fromkeys((e["id"] for e in recs + stories), now))
+        _write_json_atomic(self._seen_path, history)
+        if seen is None:
+            print("🔔 Notifications: first run — recorded a baseline, nothing sent")
+            return
+        if events:
+            with self._lock:
+                for channel in self.channels:
+                    # Coalesce with a message still waiting for this channel.
+                    pending = next((e for e in self._queue if e["channel"] == channel and not e.get("sending")), None)
+                    if pending:
+                        known = {ev["id"] for ev in pending["events"]}
+                        pending["events"] += [ev for ev in events if ev["id"] not in known]
+                    else:
+                        self._queue.append({"channel": channel, "events": list(events), "attempts": 0, "due": 0})
+                self._save()
+            print(f"🔔 Notifications: {len(events)} new event(s) queued for {len(self.channels)} channel(s)")
+        self.start()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ebm-notify", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def wait(self, timeout):
+        """Block until the queue is drained, or until what's left can't be retried
+        within timeout seconds. True when everything was delivered."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if not self._queue:
+                    return True
+                if not self._inflight and min(e["due"] for e in self._queue) > deadline:
+                    return False
+            time.sleep(0.05)
+        return False
+
+    def _save(self):
+        _write_json_atomic(self._queue_path, [{k: v for k, v in e.items() if k != "sending"} for e in self._queue])
+
+    def _run(self):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=len(self.channels), pool_maxsize=NOTIFY_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix="notify") as pool:
+            while True:
+                with self._lock:
+                    due = [e for e in self._queue if e["due"] <= time.time() and not e.get("sending")]
+                    for e in due:
+                        e["sending"] = True
+                    self._inflight += len(due)
+                futures = {pool.submit(self._send, session, e): e for e in due}
+                for future in as_completed(futures):
+                    entry, retry_after = futures[future], future.result()
+                    with self._lock:
+                        entry.pop("sending")
+                        self._inflight -= 1
+                        entry["attempts"] += 1
+                        if retry_after is None or entry["attempts"] >= NOTIFY_MAX_ATTEMPTS:
+                            self._queue.remove(entry)
+                            if retry_after is not None:
+                                print(f"  ⚠️  webhook {self._host(entry)}: "
+                                      f"giving up after {entry['attempts']} attempts")
+                        else:
+                            entry["due"] = time.time() + retry_after
+                        self._save()
+                with self._lock:
+                    next_due = min((e["due"] for e in self._queue), default=None)
+                self._wake.wait(None if next_due is None else max(0.0, next_due - time.time()))
+                self._wake.clear()
+
+    def _send(self, session, entry):
+        """POST one batched message → None when done (delivered or permanently
+        rejected), else the number of seconds to wait before retrying."""
+        url, host = self.channels[entry["channel"]], self._host(entry)
+        backoff = min(NOTIFY_BACKOFF_SECONDS * 2 ** entry["attempts"], NOTIFY_BACKOFF_MAX_SECONDS)
+        try:
+            with span(host, "http", method="POST", events=len(entry["events"])) as s:
+                resp = session.post(url, json=webhook_payload(url, entry["events"]), timeout=NOTIFY_TIMEOUT)
+                s.set(status=resp.status_code, bytes=len(resp.content))
+        except Exception as e:
+            print(f"  ⚠️  webhook {host}: {type(e).__name__}, retrying in {backoff:.0f}s")
+            return backoff
+        if resp.status_code == 429 or resp.status_code >= 500:
+            try:
+                backoff = max(backoff, float(resp.headers.get("Retry-After", 0)))
+            except ValueError:
+                pass
+            print(f"  ⚠️  webhook {host}: HTTP {resp.status_code}, retrying in {backoff:.0f}s")
+            return backoff
+        if resp.status_code >= 400:
+            print(f"  ⚠️  webhook {host}: HTTP {resp.status_code}, dropping message")
+        else:
+            print(f"  🔔 webhook {host}: delivered {len(entry['events'])} event(s)")
+        return None
+
+    def _host(self, entry):
+        return urllib.parse.urlsplit(self.channels[entry["channel"]]).netloc  # never log the secret path
+
+
+def make_notifier(args):
+    """A Notifier for --webhook URLs plus $EBM_WEBHOOKS with its queue under the
+    current STATE_DIR, or None when there are none. One per build target: a
+    daemon keeps its notifier across refreshes, every --dashboards entry gets
+    its own."""
+    urls = list(dict.fromkeys(args.webhook + os.environ.get("EBM_WEBHOOKS", "").split()))
+    return Notifier(urls) if urls else None
+
+
+def flush_notifications(notifier):
+    """Give a one-shot build's deliveries up to NOTIFY_FLUSH_SECONDS before exit."""
+    if notifier and not notifier.wait(NOTIFY_FLUSH_SECONDS):
+        print("🔔 Some notifications are still pending — they stay queued for the next run")
+
+
+# ─── HTTP SERVER ───────────────────────────────────────────────────────────────
+# `serve` runs the daemon's refresh loop in the background and serves the
+# dashboard plus a small JSON API from an in-memory index of the last build.
+
+class ArticleIndex:
+    """The latest build's articles, topic counts and recommendations, with
+    per-version response caching and first-seen times for ?since= queries."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 0
+        self.articles = []
+        self.topic_counts = []
+        self.miro_recs = []
+        self.first_seen = {}  # url → epoch seconds the server first saw it
+        self.state = {}       # url → (score, comments, topic) for change detection
+        self.responses = {}   # (path, query) → encoded body, cleared on update
+
+    def update(self, articles, topic_counts, miro_recs):
+        """Swap in a new build; returns (new, changed) articles versus the previous one."""
+        now = time.time()
+        new, changed, state = [], [], {}
+        for a in articles:
+            key = a["url"]
+            state[key] = (a["score"], a.get("comments", 0), a["topic"])
+            if key not in self.state:
+                new.append(a)
+            elif self.state[key] != state[key]:
+                changed.append(a)
+        with self.lock:
+            for a in new:
+                self.first_seen.setdefault(a["url"], now)
+            self.first_seen = {k: v for k, v in self.first_seen.items() if k in state}
+            self.articles, self.topic_counts, self.miro_recs = articles, topic_counts, miro_recs
+            self.state = state
+            self.version += 1
+            self.responses = {}
+        return new, changed
+
+    def query(self, path, params):
+        """JSON body for an /api/ path, computed once per (version, query)."""
+        key = (path, tuple(sorted((k, v[0]) for k, v in params.items())))
+        with self.lock:
+            if key in self.responses:
+                return self.responses[key]
+            if path == "/api/topics":
+                data = [{"topic": t, "count": c} for t, c in self.topic_counts]
+            elif path == "/api/recommendations":
+                data = self.miro_recs
+            elif path == "/api/articles":
+                data = self._filter(params)
+            else:
+                return None
+            body = json.dumps({"version": self.version, "data": data}, ensure_ascii=False).encode("utf-8")
+            self.responses[key] = body
+            return body
+
+    def _filter(self, params):
+        topic = params.get("topic", [""])[0]
+        source = params.get("source", [""])[0]
+        since = _parse_since(params.get("since", [""])[0])
+        return [
+            {**a, "first_seen": self.first_seen.get(a["url"])}
+            for a in self.articles
+            if (not topic or a["topic"] == topic)
+            and (not source or a["source"] == source)
+            and (since is None or self.first_seen.get(a["url"], 0) >= since)
+        ]
+
+
+def _parse_since(value):
+    """?since= accepts epoch seconds or an ISO-8601 timestamp."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+class EventBroadcaster:
+    """Fan-out of server-sent events to every connected /api/stream client."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = []
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=100)
+        with self.lock:
+            self.clients.append(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock:
+            if q in self.clients:
+                self.clients.remove(q)
+
+    def publish(self, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+        with self.lock:
+            for q in self.clients:
+                try:
+                    q.put_nowait(message)
+                except queue.Full:  # a stalled client misses updates rather than blocking the rest
+                    pass
+
+
+def _live_article(a):
+    return {k: a.get(k) for k in ("title", "url", "source", "source_icon", "topic", "score", "comments")}
+
+
+def dashboard_handler(index, events, output_dir, static_files):
+    """Request handler class bound to one server's index and event stream."""
+    import http.server  # deferred: only `serve` needs it
+
+    class DashboardHandler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            if url.path == "/api/stream":
+                return self._stream()
+            if url.path.startswith("/api/"):
+                body = index.query(url.path, urllib.parse.parse_qs(url.query))
+                if body is None:
+                    return self.send_error(404)
+                return self._send(body, "application/json; charset=utf-8")
+            name = url.path.lstrip("/") or static_files[0]
+            if name not in static_files:
+                return self.send_error(404)
+            try:
+                with open(os.path.join(output_dir, name), "rb") as f:
+                    body = f.read()
+            except OSError:
+                return self.send_error(503, "dashboard not built yet")
+            ctype = "text/html; charset=utf-8" if name.endswith(".html") else "application/json; charset=utf-8"
+            self._send(body, ctype)
+
+        def _send(self, body, ctype):
+            etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "") and len(body) > 512
+            if gzipped:
+                body = gzip.compress(body, 6)
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            q = events.subscribe()
+            try:
+                self.wfile.write(f"event: hello\ndata: {index.version}\n\n".encode())
+                self.wfile.flush()
+                while True:
+                    try:
+                        message = q.get(timeout=15)
+                    except queue.Empty:
+                        message = b": keepalive\n\n"
+                    self.wfile.write(message)
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                events.unsubscribe(q)
+
+    return DashboardHandler
+
+
+def run_server(args):
+    """Serve the dashboard and /api/* on args.host:args.port while the refresh
+    loop keeps the index current and pushes new/changed articles over SSE."""
+    index, events = ArticleIndex(), EventBroadcaster()
+
+    def on_build(articles, topic_counts, miro_recs):
+        first_build = index.version == 0
+        new, changed = index.update(articles, topic_counts, miro_recs)
+        if (new or changed) and not first_build:
+            events.publish("articles", {
+                "version": index.version,
+                "new": [_live_article(a) for a in new[:200]],
+                "changed": [_live_article(a) for a in changed[:200]],
+            })
+            print(f"📣 pushed {len(new)} new / {len(changed)} changed articles")
+
+    import http.server
+    handler = dashboard_handler(index, events, os.path.dirname(os.path.abspath(args.output)),
+                                (os.path.basename(args.output), SEARCH_INDEX, ARTICLES_PAYLOAD))
+    server = http.server.ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"\n🌐 Serving on http://{args.host}:{args.port}/  (API under /api/, live updates on /api/stream)")
+    try:
+        run_daemon(args, on_build=on_build, stream_url="api/stream")
+    finally:
+        server.shutdown()
+
+
+# ─── MIRO BOARDS ───────────────────────────────────────────────────────────────
+# `miro` turns accepted recommendations into Miro boards through the REST API
+# (v2). Every board item is content-hashed and the hash → item id map is kept
+# in STATE_DIR, so a re-run creates only the items that are new and deletes
+# the ones that went away. Items are created in bulk calls of up to
+# MIRO_BULK_LIMIT over one pooled session, pacing itself on the X-RateLimit-*
+# headers. `miro-mock` serves a local stand-in of the API for trying it out.
+
+def _recs_path():
+    return os.path.join(STATE_DIR, "recommendations.json")
+
+
+def _html_text(markup, limit=600):
+    text = html_lib.unescape(re.sub(r"<[^>]+>", " ", markup))
+    text = re.sub(r"\s+", " ", text).strip()
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def board_layout(rec):
+    """Miro bulk-create items for one recommendation: a title, the brief
+    (description, demo, format, CTA), one sticky per body section, the
+    headlines that inspired it and its tags — laid out left to right."""
+    def sticky(content, x, y, color, width=MIRO_STICKY_WIDTH):
+        return {"type": "sticky_note", "data": {"content": html_lib.escape(content), "shape": "rectangle"},
+                "style": {"fillColor": color}, "position": {"x": x, "y": y}, "geometry": {"width": width}}
+
+    step = MIRO_STICKY_WIDTH + 60
+    items = [{"type": "text", "data": {"content": f"<strong>{html_lib.escape(rec['title'])}</strong>"},
+              "style": {"fontSize": "48"}, "position": {"x": 2 * step, "y": -500}, "geometry": {"width": 5 * step}}]
+    brief = [("description", "Brief"), ("demo", "Demo"), ("format", "Format"), ("cta", "CTA")]
+    for i, (key, label) in enumerate(k for k in brief if rec.get(k[0])):
+        items.append(sticky(f"{label}: {rec[key]}", i * step, -200, "light_yellow"))
+    sections = re.split(r"<h2>(.*?)</h2>", rec.get("body", ""))
+    body = [("Intro", sections[0])] + list(zip(sections[1::2], sections[2::2]))
+    for i, (heading, markup) in enumerate((h, m) for h, m in body if _html_text(m)):
+        items.append(sticky(f"{_html_text(heading, 120)} — {_html_text(markup)}",
+                            (i % 5) * step, 200 + (i // 5) * step, "light_blue"))
+    for i, headline in enumerate(rec.get("inspired_by", [])):
+        items.append(sticky(f"Inspired by: {headline}", i * step, -200 - step, "light_green"))
+    for i, tag in enumerate(rec.get("tags", [])):
+        items.append({"type": "shape", "data": {"content": f"#{html_lib.escape(tag)}", "shape": "round_rectangle"},
+                      "position": {"x": 5 * step + 200, "y": -200 + i * 120},
+                      "geometry": {"width": 260, "height": 80}})
+    return items
+
+
+class MiroClient:
+    """Minimal Miro REST client: bearer auth, one pooled session shared by the
+    bulk-create workers, and a shared view of the rate limit — when the
+    remaining budget hits zero (or a 429 arrives) every worker waits for the
+    reset instead of hammering the API."""
+
+    def __init__(self, token, base_url=MIRO_API_URL):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MIRO_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {token}", "Accept": "application/json"})
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.calls = 0
+
+    def request(self, method, path, **kwargs):
+        for attempt in range(MIRO_MAX_ATTEMPTS):
+            with self._lock:
+                pause = self._paused_until - time.time()
+            if pause > 0:
+                time.sleep(pause)
+            with span(urllib.parse.urlsplit(self.base_url).netloc, "http", method=method, path=path) as s:
+                resp = self.session.request(method, self.base_url + path, timeout=20, **kwargs)
+                s.set(status=resp.status_code, bytes=len(resp.content))
+            with self._lock:
+                self.calls += 1
+                if resp.headers.get("X-RateLimit-Remaining") == "0":
+                    self._paused_until = max(self._paused_until, float(resp.headers.get("X-RateLimit-Reset", 0)))
+                if resp.status_code == 429:
+                    wait = float(resp.headers.get("Retry-After") or 0) or 2 ** attempt
+                    self._paused_until = max(self._paused_until, time.time() + wait)
+            if resp.status_code == 429 or resp.status_code >= 500:
+                time.sleep(0 if resp.status_code == 429 else 2 ** attempt)
+                continue
+            resp.raise_for_status()
+            return resp.json() if resp.content else None
+        resp.raise_for_status()
+
+    def create_board(self, name, description):
+        return self.request("POST", "/boards", json={"name": name[:60], "description": description[:300]})["id"]
+
+    def bulk_create(self, board_id, items):
+        """Create items MIRO_BULK_LIMIT at a time, concurrently; yields (chunk, ids) as each batch lands.
+        A failed batch doesn't hide the others: every batch that did land is
+        yielded first, then the first failure is raised."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        chunks = [items[i:i + MIRO_BULK_LIMIT] for i in range(0, len(items), MIRO_BULK_LIMIT)]
+        error = None
+        with ThreadPoolExecutor(max_workers=MIRO_WORKERS, thread_name_prefix="miro") as pool:
+            futures = {pool.submit(self.request, "POST", f"/boards/{board_id}/items/bulk", json=chunk): chunk
+                       for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    ids = [item["id"] for item in future.result()["data"]]
+                except Exception as e:
+                    error = error or e
+                    continue
+                yield futures[future], ids
+        if error:
+            raise error
 
+    def board_exists(self, board_id):
+        try:
+            self.request("GET", f"/boards/{board_id}")
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return False
+            raise
+        return True
+
+    def delete_item(self, board_id, item_id):
+        """Delete one item; an item that is already gone (someone removed it on
+        the board) counts as deleted."""
+        try:
+            self.request("DELETE", f"/boards/{board_id}/items/{item_id}")
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+
+
+def sync_board(client, rec, boards, save):
+    """Create or update the board for one recommendation. boards maps a
+    recommendation key to {"board_id", "items": {item hash: item id}}; only
+    items whose hash is new get created and only vanished ones get deleted.
+    The board is recreated only when a create fails with 404 and the board
+    itself then reads back as missing."""
+    key = content_hash([rec["topic"], rec["title"]])[:16]
+    desired = {content_hash(item)[:16]: item for item in board_layout(rec)}
+    for attempt in (1, 2):
+        entry = boards.get(key)
+        if entry is None:
+            entry = boards[key] = {"board_id": client.create_board(rec["title"], rec.get("description", "")),
+                                   "title": rec["title"], "items": {}}
+            save()
+        new = [h for h in desired if h not in entry["items"]]
+        try:
+            for chunk, ids in client.bulk_create(entry["board_id"], [desired[h] for h in new]):
+                for item, item_id in zip(chunk, ids):
+                    entry["items"][content_hash(item)[:16]] = item_id
+                save()  # after every batch, so an interrupted run never duplicates items
+            stale = [h for h in entry["items"] if h not in desired]
+            for h in stale:
+                client.delete_item(entry["board_id"], entry["items"].pop(h))
+            save()
+            return entry, len(new), len(stale)
+        except requests.HTTPError as e:
+            if (e.response is None or e.response.status_code != 404 or attempt == 2
+                    or client.board_exists(entry["board_id"])):
+                raise
+            print(f"  ⚠️  board for “{rec['title'][:40]}” is gone — recreating it")
+            del boards[key]
+
+
+def run_miro_export(args):
+    """Push the recommendations picked by number (default: all) from the last build to Miro."""
+    token = os.environ.get("MIRO_ACCESS_TOKEN")
+    if not token:
+        raise SystemExit("❌ set MIRO_ACCESS_TOKEN (a Miro REST API token with boards:write)")
+    try:
+        with open(_recs_path(), encoding="utf-8") as f:
+            recs = json.load(f)
+    except (OSError, ValueError):
+        raise SystemExit("❌ no recommendations yet — run a build first")
+    try:
+        picked = [recs[int(n) - 1] for n in args.text] if args.text else recs
+    except (ValueError, IndexError):
+        raise SystemExit(f"❌ pick recommendations by number, 1–{len(recs)}")
+    state_path = os.path.join(STATE_DIR, "miro", "boards.json")
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            boards = json.load(f)
+    except (OSError, ValueError):
+        boards = {}
+    client = MiroClient(token, args.miro_api)
+    print(f"\n🟨 Syncing {len(picked)} recommendation(s) to {client.base_url}")
+    for rec in picked:
+        entry, created, deleted = sync_board(client, rec, boards, lambda: _write_json_atomic(state_path, boards))
+        print(f"  ✅ {rec['title'][:60]} → board {entry['board_id']} (+{created} / -{deleted} items)")
+    print(f"   {client.calls} API calls")
+    return boards
+
+
+def miro_mock_handler(rate_per_minute):
+    """Request handler for `miro-mock`: an in-memory stand-in for the Miro v2
+    boards/items endpoints, including bearer auth, the 20-item bulk limit and
+    X-RateLimit-* headers with 429s once a minute's budget is spent."""
+    import http.server  # deferred: only `miro-mock` needs it
+    boards, lock = {}, threading.RLock()
+    window = {"start": time.time(), "used": 0}
+    next_id = iter(range(3458764500000000001, 1 << 63))
+    next_board = iter(range(1, 1 << 63))
+
+    class MiroMockHandler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def _reply(self, status, body=None):
+            data = json.dumps(body).encode("utf-8") if body is not None else b""
+            self.send_response(status)
+            with lock:
+                self.send_header("X-RateLimit-Limit", str(rate_per_minute))
+                self.send_header("X-RateLimit-Remaining", str(max(0, rate_per_minute - window["used"])))
+                self.send_header("X-RateLimit-Reset", str(int(window["start"] + 60)))
+            if status == 429:
+                self.send_header("Retry-After", str(max(1, int(window["start"] + 60 - time.time()))))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _admit(self):
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                self._reply(401, {"message": "missing bearer token"})
+                return False
+            with lock:
+                if time.time() - window["start"] >= 60:
+                    window.update(start=time.time(), used=0)
+                window["used"] += 1
+                over = window["used"] > rate_per_minute
+            if over:
+                self._reply(429, {"message": "rate limit exceeded"})
+            return not over
+
+        def _parts(self):
+            return urllib.parse.urlsplit(self.path).path.strip("/").split("/")
+
+        def do_POST(self):
+            if not self._admit():
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+            parts = self._parts()
+            with lock:
+                if parts == ["v2", "boards"]:
+                    board_id = f"mock{next(next_board)}"
+                    boards[board_id] = {"name": body.get("name", ""), "items": {}}
+                    return self._reply(201, {"id": board_id, "name": boards[board_id]["name"]})
+                if len(parts) == 5 and parts[:2] == ["v2", "boards"] and parts[3:] == ["items", "bulk"]:
+                    board = boards.get(parts[2])
+                    if board is None:
+                        return self._reply(404, {"message": "board not found"})
+                    if not isinstance(body, list) or not 1 <= len(body) <= 20:
+                        return self._reply(400, {"message": "bulk create takes 1-20 items"})
+                    created = []
+                    for item in body:
+                        item_id = str(next(next_id))
+                        board["items"][item_id] = item
+                        created.append({"id": item_id, "type": item.get("type")})
+                    return self._reply(201, {"data": created, "type": "bulk-list"})
+            self._reply(404, {"message": "not found"})
+
+        def do_DELETE(self):
+            if not self._admit():
+                return
+            parts = self._parts()
+            with lock:
+                if len(parts) == 3 and parts[:2] == ["v2", "boards"] and boards.pop(parts[2], None) is not None:
+                    return self._reply(204)
+                if len(parts) == 5 and parts[:2] == ["v2", "boards"] and parts[3] == "items":
+                    if boards.get(parts[2], {}).get("items", {}).pop(parts[4], None) is not None:
+                        return self._reply(204)
+            self._reply(404, {"message": "not found"})
+
+        def do_GET(self):
+            if not self._admit():
+                return
+            parts = self._parts()
+            with lock:
+                if len(parts) == 3 and parts[:2] == ["v2", "boards"] and parts[2] in boards:
+                    return self._reply(200, {"id": parts[2], "name": boards[parts[2]]["name"]})
+                if len(parts) == 4 and parts[:2] == ["v2", "boards"] and parts[3] == "items" and parts[2] in boards:
+                    items = [{"id": i, **item} for i, item in boards[parts[2]]["items"].items()]
+                    return self._reply(200, {"data": items, "total": len(items)})
+            self._reply(404, {"message": "not found"})
+
+    return MiroMockHandler
+
+
+def run_miro_mock(args):
+    import http.server
+    server = http.server.ThreadingHTTPServer((args.host, args.port), miro_mock_handler(MIRO_MOCK_RATE_PER_MINUTE))
+    print(f"🟨 Mock Miro API on http://{args.host}:{args.port}/v2 — point `miro --miro-api` at it (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+# ─── UPSTREAM SIMULATOR ────────────────────────────────────────────────────────
+# `simulate` serves synthetic HN, dev.to, GitHub search, Reddit and RSS
+# responses at any scale, with injected latency, 429s, 5xx bursts, truncated
+# bodies and hung connections, so concurrency, timeout and rate-limit handling
+# can be load-tested without the internet. Requests arrive as /<host>/<path>
+# (the --upstream rewrite); /link/<id>/… paths redirect like a newsletter
+# click-tracker, article paths get an HTML page, and any other path on a host
+# it doesn't recognise gets an RSS feed.
+
+def _fault_spec(value):
+    """--faults "latency=200,429=0.1,hang=0" → SIM_FAULTS with those keys replaced."""
+    faults = dict(SIM_FAULTS)
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        key, _, number = item.partition("=")
+        if key.strip() not in SIM_FAULTS:
+            raise argparse.ArgumentTypeError(f"unknown fault {key!r} (known: {', '.join(SIM_FAULTS)})")
+        try:
+            faults[key.strip()] = float(number)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{key}: expected a number, got {number!r}")
+    return faults
+
+
+def simulator_handler(faults):
+    """Request handler for `simulate`; faults is a SIM_FAULTS-shaped dict."""
+    import http.server  # deferred: only `simulate` needs it
+    import random
+    rng, lock = random.Random(faults["seed"]), threading.Lock()
+    bursts, stats = defaultdict(int), defaultdict(int)
+    words = sorted({kw for kws in TOPIC_KEYWORDS.values() for kw in kws} | {
+        "release", "deep dive", "postmortem", "benchmark", "migration", "internals", "at scale",
+        "lessons learned", "open source", "rewrite", "outage", "tooling"})
+
+    def title(r):
+        return " ".join(r.choice(words) for _ in range(r.randint(3, 6))).capitalize() + f" #{r.randint(1, 99999)}"
+
+    def seeded(*key):
+        return random.Random(content_hash([faults["seed"], *key]))
+
+    def hn_ids(kind):
+        start = {"top": 40_000_000, "ask": 41_000_000, "show": 42_000_000}[kind]
+        return list(range(start, start + 500))
+
+    def hn_item(item_id):
+        r = seeded("hn", item_id)
+        return {"id": item_id, "type": "story", "by": f"user{r.randint(1, 9999)}", "title": title(r),
+                "url": f"https://example.com/hn/{item_id}", "score": r.randint(1, 1500),
+                "descendants": r.randint(0, 400), "time": int(time.time()) - r.randint(0, 86400)}
+
+    def devto(query):
+        r = seeded("devto", query.get("tag"), query.get("top"))
+        return [{"id": r.randint(1, 10 ** 7), "title": title(r), "description": title(r),
+                 "url": f"https://dev.to/sim/{i}-{r.randint(1, 10 ** 6)}", "comments_count": r.randint(0, 60),
+                 "positive_reactions_count": r.randint(0, 900), "reading_time_minutes": r.randint(1, 20),
+                 "published_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}
+                for i in range(int(query.get("per_page", 20)))]
+
+    def github(query):
+        r = seeded("github", query.get("q"))
+        items = []
+        for i in range(int(query.get("per_page", 25))):
+            name = f"sim-{r.choice(words).replace(' ', '-')}-{i}"
+            items.append({"name": name, "full_name": f"simorg/{name}", "description": title(r),
+                          "html_url": f"https://github.com/simorg/{name}", "topics": r.sample(words, 3),
+                          "stargazers_count": r.randint(50, 20000), "open_issues_count": r.randint(0, 200),
+                          "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")})
+        return {"total_count": len(items), "items": items}
+
+    def reddit(subs, query):
+        # Each sub has 100 top posts, scaled by its popularity; a multireddit
+        # ("a+b+c") merges them by score and pages with `after`, like Reddit.
+        posts = []
+        for sub in subs.split("+"):
+            r = seeded("reddit", sub.lower(), query.get("t"))
+            popularity = r.choice([1, 1, 0.3, 0.05])
+            for i in range(100):
+                post_id = f"{sub[:3].lower()}{i}{r.randint(1000, 9999)}"
+                posts.append({"kind": "t3", "data": {
+                    "id": post_id, "name": f"t3_{post_id}", "subreddit": sub, "title": title(r), "selftext": title(r),
+                    "url": f"https://example.com/r/{post_id}", "permalink": f"/r/{sub}/comments/{post_id}/",
+                    "score": int(r.randint(10, 5000) * popularity), "is_video": False,
+                    "num_comments": r.randint(0, 500), "created_utc": time.time() - r.randint(0, 7 * 86400),
+                    "upvote_ratio": round(r.uniform(0.6, 1), 2)}})
+        posts.sort(key=lambda post: -post["data"]["score"])
+        start = next((i + 1 for i, post in enumerate(posts) if post["data"]["name"] == query.get("after")), 0)
+        limit = min(int(query.get("limit", 25)), 100)
+        after = posts[start + limit - 1]["data"]["name"] if start + limit < len(posts) else None
+        return {"kind": "Listing", "data": {"children": posts[start:start + limit], "after": after}}
+
+    def rss(host, path):
+        r = seeded("rss", host, path)
+        # Every third item goes through a newsletter click-tracker shared by all feeds.
+        links = [f"https://javascriptweekly.com/link/{r.randint(1, 500)}/rss" if i % 3 == 2 else f"https://{host}/post/{i}"
+                 for i in range(10)]
+        items = "".join(
+            f"<item><title>{html_lib.escape(title(r))}</title><link>{links[i]}</link>"
+            f"<description>{html_lib.escape(title(r))}</description>"
+            f"<pubDate>{(datetime.now(timezone.utc) - timedelta(hours=r.randint(0, 240))).strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate></item>"
+            for i in range(10))
+        return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{html_lib.escape(host)}</title>'
+                f"<link>https://{host}/</link><description>Simulated feed</description>{items}</channel></rss>")
+
+    def page(host, path):
+        r = seeded("page", host, path)
+        paragraphs = "".join(f"<p>{html_lib.escape(title(r))}. {html_lib.escape(title(r))}.</p>" for _ in range(r.randint(3, 12)))
+        return (f"<!doctype html><html><head><title>{html_lib.escape(host)}</title>"
+                f'<meta name="description" content="{html_lib.escape(title(r))}"></head><body>'
+                f"<nav><ul><li>Home</li><li>Archive</li></ul></nav><article>{paragraphs}</article>"
+                f"<footer><p>© {html_lib.escape(host)}</p></footer></body></html>")
+
+    def opml(count):
+        outlines = "".join(f'<outline type="rss" text="Sim feed {i}" xmlUrl="https://feed-{i}.sim.invalid/rss"/>'
+                           for i in range(count))
+        return f'<?xml version="1.0"?><opml version="2.0"><head><title>Simulated feeds</title></head><body>{outlines}</body></opml>'
+
+    class SimulatorHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, status, body, content_type="application/json", headers=(), truncate=False):
+            data = (json.dumps(body) if content_type == "application/json" else body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            if self.command == "HEAD":
+                return
+            if truncate:
+                self.wfile.write(data[:len(data) // 2])
+                self.close_connection = True
+            else:
+                self.wfile.write(data)
+
+        def _fault(self, host):
+            """Sleep the sampled latency, then → None or the fault to inject."""
+            with lock:
+                delay = rng.lognormvariate(math.log(max(faults["latency"], 0.1) / 1000), faults["jitter"])
+                roll = rng.random()
+                if bursts[host] > 0:
+                    bursts[host] -= 1
+                    fault = "5xx"
+                else:
+                    fault = None
+                    for name in ("429", "5xx", "truncate", "hang"):
+                        if roll < faults[name]:
+                            fault = name
+                            break
+                        roll -= faults[name]
+                    if fault == "5xx":
+                        bursts[host] = int(faults["burst"]) - 1
+                stats[fault or "ok"] += 1
+            time.sleep(delay)
+            return fault
+
+        def do_GET(self):
+            parts = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(parts.query))
+            if parts.path == "/opml.xml":
+                return self._send(200, opml(int(query.get("feeds", SIM_FEEDS))), "text/x-opml")
+            host, _, path = parts.path.lstrip("/").partition("/")
+            path = "/" + path
+            fault = self._fault(host)
+            if fault == "hang":
+                time.sleep(SIM_HANG_SECONDS)
+                self.close_connection = True
+                return
+            if fault == "429":
+                return self._send(429, {"message": "rate limited (simulated)"},
+                                  headers=[("Retry-After", str(rng.randint(1, 30)))])
+            if fault == "5xx":
+                return self._send(503, {"message": "service unavailable (simulated)"})
+            truncate = fault == "truncate"
+            if host == "hacker-news.firebaseio.com":
+                if match := re.fullmatch(r"/v0/(top|ask|show)stories\.json", path):
+                    return self._send(200, hn_ids(match[1]), truncate=truncate)
+                if match := re.fullmatch(r"/v0/item/(\d+)\.json", path):
+                    return self._send(200, hn_item(int(match[1])), truncate=truncate)
+            elif host == "dev.to" and path == "/api/articles":
+                return self._send(200, devto(query), truncate=truncate)
+            elif host == "api.github.com" and path == "/search/repositories":
+                return self._send(200, github(query), truncate=truncate)
+            elif host.endswith("reddit.com"):
+                if match := re.fullmatch(r"/r/([^/]+)/top\.json", path):
+                    return self._send(200, reddit(match[1], query), truncate=truncate)
+            elif match := re.fullmatch(r"/link/(\d+)/\w+", path):
+                return self._send(301, "", "text/plain",
+                                  headers=[("Location", f"https://example.com/story/{match[1]}?utm_source=weekly")])
+            elif re.fullmatch(r"/(post|story|hn|r|sim)/[^/]+", path):
+                return self._send(200, page(host, path), "text/html; charset=utf-8", truncate=truncate)
+            else:
+                return self._send(200, rss(host, path), "application/rss+xml", truncate=truncate)
+            self._send(404, {"message": "not simulated"})
+
+        do_HEAD = do_GET
+
+    SimulatorHandler.stats = stats
+    return SimulatorHandler
+
+
+def run_simulator(args):
+    import http.server
+    handler = simulator_handler(args.faults)
+    server = http.server.ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True  # hung connections must not block shutdown
+    base = f"http://{args.host}:{args.port}"
+    print(f"🧪 Upstream simulator on {base} (Ctrl+C to stop)\n"
+          f"   faults: {', '.join(f'{k}={v:g}' for k, v in args.faults.items())}\n"
+          f"   build against it:  python3 eng_brand_machine.py --upstream {base}\n"
+          f"   at scale:          … --upstream {base} --opml {base}/opml.xml?feeds={SIM_FEEDS}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print("   requests: " + ", ".join(f"{k} {v}" for k, v in sorted(handler.stats.items())))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate engineering trends into a self-contained dashboard.")
+    parser.add_argument("command", nargs="?", default="build",
+                        choices=["build", "daemon", "serve", "classify", "merge", "miro", "miro-mock", "simulate"],
+                        help="build: fetch everything once and write the dashboard (default); "
+                             "daemon: stay resident and refresh each source on its own cadence; "
+                             "serve: daemon plus an HTTP server with a JSON API and live updates; "
+                             "classify TEXT: print the topic a title would be filed under; "
+                             "merge [FILES]: build the dashboard from --shard partial files; "
+                             "miro [N ...]: create/update Miro boards for the last build's recommendations; "
+                             "miro-mock: run a local mock of the Miro API on --host/--port; "
+                             "simulate: serve simulated upstreams with fault injection on --host/--port")
+    parser.add_argument("text", nargs="*", help=argparse.SUPPRESS)
+    parser.add_argument("--output", default="index.html", help="dashboard path (default: index.html)")
+    parser.add_argument("--split", action="store_true",
+                        help="write the article set to articles.json next to a thin HTML shell; "
+                             "tables render client-side (needs to be served over HTTP)")
+    parser.add_argument("--no-minify", action="store_true", help="keep the rendered HTML unminified")
+    parser.add_argument("--precompress", action="store_true",
+                        help="also write .gz and .br siblings for static hosts that serve them")
+    parser.add_argument("--budget", type=int, default=PAGE_BUDGET_BYTES,
+                        help=f"gzipped page-weight budget in bytes, 0 to disable (default: {PAGE_BUDGET_BYTES})")
+    parser.add_argument("--budget-fail", action="store_true",
+                        help="fail the build instead of warning when the budget is exceeded")
+    parser.add_argument("--only", type=_source_list, metavar="SOURCES",
+                        help=f"refetch only these comma-separated sources ({', '.join(SOURCES)}) "
+                             "and reuse the last run's snapshot for the rest")
+    parser.add_argument("--export", metavar="DIR",
+                        help="also write articles.jsonl, articles.ebmc (columnar) and "
+                             "recommendations.atom to DIR")
+    parser.add_argument("--webhook", action="append", default=[], metavar="URL",
+                        help="post new recommendations/top stories to this Slack- or Discord-style "
+                             "webhook (repeatable; also read from $EBM_WEBHOOKS)")
+    parser.add_argument("--opml", action="append", default=[], metavar="PATH",
+                        help="also crawl every feed in this OPML export (repeatable)")
+    parser.add_argument("--shard", type=_shard_spec, metavar="I/N",
+                        help="build: crawl only slice I of N (1-based) and write a partial file "
+                             f"to {PARTIALS_DIR}/ for `merge` instead of the dashboard")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write a Chrome trace-event timeline of the run (HTTP requests, fetchers, "
+                             "pipeline stages, build steps) for Perfetto / chrome://tracing")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="run single-threaded with per-stage CPU profiles and memory attribution; "
+                             "writes DIR/report.txt and DIR/<stage>.pstats")
+    parser.add_argument("--replay", action="store_true",
+                        help="build: rebuild from the last run's snapshots instead of fetching "
+                             "(articles are classified again; run-to-run state is left alone)")
+    parser.add_argument("--dashboards", metavar="FILE",
+                        help="build: crawl once, then build every dashboard listed in this JSON file "
+                             "(own outputs, TOPIC_KEYWORDS, templates and topic filter) in parallel")
+    parser.add_argument("--enrich", action="store_true",
+                        help="fetch each article's page and classify it by its text, not just the title "
+                             "(pages are cached, so only new articles cost a request)")
+    parser.add_argument("--upstream", metavar="URL",
+                        help="send every fetcher request to this server instead, e.g. a `simulate` instance")
+    parser.add_argument("--faults", type=_fault_spec, default=dict(SIM_FAULTS), metavar="SPEC",
+                        help="simulate: comma-separated overrides such as latency=200,429=0.1,hang=0 "
+                             f"(keys: {', '.join(SIM_FAULTS)})")
+    parser.add_argument("--miro-api", default=MIRO_API_URL, metavar="URL",
+                        help=f"miro: API base URL, e.g. a miro-mock server (default: {MIRO_API_URL})")
+    parser.add_argument("--host", default="127.0.0.1", help="serve/miro-mock/simulate: interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="serve/miro-mock/simulate: port to listen on (default: 8000)")
+    args = parser.parse_args(argv)
+    if args.shard and args.command != "build":
+        parser.error("--shard only applies to build")
+    if args.replay and (args.command != "build" or args.shard or args.only):
+        parser.error("--replay only applies to a plain build (no --shard or --only)")
+    if args.dashboards and (args.command != "build" or args.shard):
+        parser.error("--dashboards only applies to build (no --shard)")
+    return args
+
+
+def fetch_sources(names, sources=None, failed=None):
+    """Run the named fetchers through the pipeline → {name: articles} in SOURCES order."""
+    results = {name: [] for name in SOURCES if name in names}
+    run_pipeline(names, lambda name, position, article: results[name].append(article),
+                 sources=sources, failed=failed)
+    return results
+
+
+def _shard_spec(value):
+    match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected I/N with 1 <= I <= N, got {value!r}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def _source_list(value):
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SOURCES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown source(s) {', '.join(unknown)}; choose from {', '.join(SOURCES)}")
+    return names
+
+
+def build_dashboard(all_articles, args, stream_url=None, agg=None, notifier=None):
+    """Aggregate, render and write the dashboard for an already-fetched article
+    set. Pass agg when the articles were already folded into an Aggregate, and
+    notifier (see make_notifier) to announce what's new."""
     print(f"\n📊 Total articles: {len(all_articles)}")
-    topic_counts = count_topics(all_articles)
+    with span("aggregate", articles=len(all_articles)):
+        agg = agg or Aggregate(all_articles, bursts=BurstDetector())
+        topic_counts, miro_recs = aggregate(agg)
     print("\n🏷️  Topics:")
     for t, c in topic_counts:
         print(f"   {t}: {c}")
 
-    miro_recs = generate_miro_recommendations(all_articles, topic_counts)
+    with span("diff"):
+        diff = RunDiff()
+        changes = diff.classify(all_articles, topic_counts)
+    print_change_summary(changes)
+
+    if agg.bursts:
+        print("\n🌱 Emerging terms:" if agg.bursts.baseline else "\n🌱 Emerging terms: recording a first baseline")
+        for e in agg.bursts.emerging():
+            print(f"   {e['term']}: {e['count']} articles (usually ~{e['expected']:g})")
+
     print("\n✦ Miro Content Recommendations:")
     for i, r in enumerate(miro_recs, 1):
         print(f"   {i}. [{r['topic']}] {r['title']}")
@@ -1444,14 +4935,373 @@ def main():
     print(f"\n🔴 Reddit posts in dataset: {reddit_count}")
 
     print("\n🎨 Generating HTML...")
-    html = generate_html(all_articles, topic_counts, miro_recs)
+    output_path = args.output
+    sidecars = {}  # files written next to the page: name → content
+    with span("sidecars"):
+        if args.split:
+            sidecars[ARTICLES_PAYLOAD] = json.dumps(build_article_payload(all_articles), ensure_ascii=False, separators=(",", ":"))
+        sidecars[SEARCH_INDEX] = json.dumps(build_search_index(all_articles), ensure_ascii=False, separators=(",", ":"))
+    # The version query busts browser caches and ties the page's fingerprint to each sidecar.
+    urls = {name: f"{name}?v={content_hash(body)[:12]}" for name, body in sidecars.items()}
+    with span("generate_html"), profiled("generate_html", generate_html):
+        html = generate_html(agg, topic_counts, miro_recs,
+                             payload_url=urls.get(ARTICLES_PAYLOAD), search_url=urls[SEARCH_INDEX],
+                             stream_url=stream_url, changes=changes)
+    if not args.no_minify:
+        with span("minify_html"):
+            html = minify_html(html)
+    sizes = section_sizes(html)
+    html = strip_section_markers(html)
+    page_bytes = html.encode("utf-8")
+    page_gz = len(gzip.compress(page_bytes, 9, mtime=0))
+    print_size_report(sizes, len(page_bytes), page_gz)
+    check_budget(page_gz, args.budget, args.budget_fail)
+
+    save_topic_memo()
+    save_lookup_caches()
+    print(f"♻️  Stage cache: {CACHE_STATS['hits']} reused, {CACHE_STATS['misses']} rebuilt")
+    with span("write_outputs"):
+        written = write_outputs(output_path, html, sidecars, args.precompress)
+    if written:
+        for name, body in sidecars.items():
+            print(f"✅ Saved → {name} ({len(body.encode('utf-8')) // 1024} KB)")
+        print(f"✅ Saved → {output_path}")
+    else:
+        print(f"✅ {output_path} unchanged — write skipped")
+    _write_json_atomic(_recs_path(), miro_recs)  # what `miro` exports
+    if not args.replay:  # replayed data must not advance the run-to-run state
+        if agg.bursts:
+            agg.bursts.save()  # this run becomes part of the emerging-terms baseline
+        diff.save()
+    if args.export:
+        write_exports(args.export, all_articles, miro_recs)
+    if notifier and not args.replay:
+        notifier.notify(miro_recs, agg.hottest())
+    return topic_counts, miro_recs
+
+
+def run_daemon(args, on_build=None, stream_url=None):
+    """Stay resident: refetch each source when its SOURCE_REFRESH_MINUTES cadence
+    comes due and rebuild only when some source actually returned new data.
+    The classifier memo and stage cache stay warm between refreshes.
+    on_build(articles, topic_counts, miro_recs) is called after each rebuild."""
+    print("\n🚀 Eng Brand Machine — daemon mode (Ctrl+C to stop)\n" + "=" * 58)
+    for name in SOURCES:
+        print(f"   {name:<12} every {SOURCE_REFRESH_MINUTES[name]} min")
+    sources, _ = plan_sources(args)
+    results, digests, next_due = {}, {}, {}
+    last_prune = time.monotonic()
+    notifier = make_notifier(args)
+    try:
+        while True:
+            now = time.monotonic()
+            due = [name for name in SOURCES if next_due.get(name, 0) <= now]
+            changed = []
+            if due:
+                print(f"\n🔄 [{datetime.now():%H:%M:%S}] refreshing {', '.join(due)}")
+                failed = set()
+                fresh = fetch_sources(due, sources, failed)
+                save_snapshot(fresh, failed)
+                for name, articles in fresh.items():  # a failed source keeps its last articles
+                    if name not in results or (articles and name not in failed):
+                        results[name] = articles
+            for name in due:
+                next_due[name] = time.monotonic() + SOURCE_REFRESH_MINUTES[name] * 60
+                digest = content_hash(results[name])
+                if digests.get(name) != digest:
+                    digests[name] = digest
+                    changed.append(name)
+            if changed:
+                articles = [a for name in SOURCES for a in results.get(name, [])]
+                try:
+                    topic_counts, miro_recs = build_dashboard(articles, args, stream_url=stream_url, notifier=notifier)
+                except SystemExit as e:  # --budget-fail must not kill the daemon
+                    print(f"  ⚠️  {e}")
+                else:
+                    if on_build:
+                        on_build(articles, topic_counts, miro_recs)
+            elif due:
+                print("   no new data — outputs left as they are")
+            if time.monotonic() - last_prune > 86400:
+                prune_cache()
+                last_prune = time.monotonic()
+            time.sleep(max(1.0, min(next_due.values()) - time.monotonic()))
+    except KeyboardInterrupt:
+        save_topic_memo()
+        save_lookup_caches()
+        print("\n👋 daemon stopped")
+
+
+def _partial_path(shard):
+    return os.path.join(PARTIALS_DIR, f"shard-{shard[0]}-of-{shard[1]}.jsonl")
+
+
+def crawl_shard(args, sources, names):
+    """Crawl this shard's slice and write it as a partial file: a header line,
+    then one [source, index, article] line per article as it is classified."""
+    path = _partial_path(args.shard)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = _tmp_path(path)
+    count = 0
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"shard": list(args.shard), "sources": names, "created": time.time()}) + "\n")
+
+        def write(name, position, article):
+            nonlocal count
+            f.write(json.dumps([name, position[1], article], ensure_ascii=False) + "\n")
+            count += 1
+
+        run_pipeline(names, write, sources=sources)
+    os.replace(tmp, path)
+    save_topic_memo()
+    save_lookup_caches()
+    print(f"\n✅ Shard {args.shard[0]}/{args.shard[1]}: {count} articles → {path}")
+    return path
+
+
+def merge_partials(paths):
+    """Combine shard files → ({name: articles}, Aggregate). Articles are deduped
+    across shards the way the pipeline dedupes within one run, and ordered by
+    (source, shard, index) so the merge is deterministic."""
+    ranks = {name: rank for rank, name in enumerate(SOURCES)}
+    shards = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            shards.append((json.loads(f.readline())["shard"], path))
+    shards.sort()
+    counts = {n for (_, n), _ in shards}
+    if len(counts) > 1:
+        raise SystemExit(f"❌ partials come from different shard counts: {sorted(counts)}")
+    if shards:
+        missing = sorted(set(range(1, shards[0][0][1] + 1)) - {i for (i, _), _ in shards})
+        if missing:
+            print(f"  ⚠️  missing shard(s) {', '.join(map(str, missing))} of {shards[0][0][1]} — merging what's there")
+
+    results = {name: [] for name in SOURCES}
+    agg = Aggregate(bursts=BurstDetector())
+    seen = set()
+    for (i, _), path in shards:
+        with open(path, encoding="utf-8") as f:
+            f.readline()
+            for line in f:
+                name, index, article = json.loads(line)
+                key = (name, dedupe_key(article))
+                if name not in results or key in seen:
+                    continue
+                seen.add(key)
+                results[name].append(article)
+                agg.add(name, (ranks[name], i, index), article)
+        print(f"  ✅ {path}")
+    return results, agg
 
-    output_path = "index.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"✅ Saved → {output_path}")
-    print(f"   Run: open {output_path}")
-    return output_path, len(all_articles), topic_counts, miro_recs
+
+# ─── MULTI-DASHBOARD BUILDS ────────────────────────────────────────────────────
+# `build --dashboards FILE` crawls once, then classifies and renders every
+# dashboard the file lists from the same normalized articles, one worker
+# process each. A dashboard swaps in its own TOPIC_KEYWORDS, template library
+# and STATE_DIR (run-to-run diff, emerging terms, recommendations, webhook
+# queue) for the duration of its build.
+
+DASHBOARD_KEYS = {"name", "output", "topic_keywords", "templates", "topics", "webhooks", "export"}
+
+
+def load_dashboards(path):
+    """The --dashboards config: a JSON list of {"name", "output"} objects, each
+    optionally with "topic_keywords", "templates" (a library shaped like
+    miro_templates.json, relative to the config), "topics" (only keep articles
+    in these), "webhooks" and "export"."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            dashboards = json.load(f)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"❌ {path}: {e}")
+    if not isinstance(dashboards, list) or not dashboards:
+        raise SystemExit(f"❌ {path}: expected a non-empty JSON list of dashboards")
+    names, folders = set(), set()
+    for i, d in enumerate(dashboards, 1):
+        if not isinstance(d, dict) or not re.fullmatch(r"[\w.-]+", str(d.get("name", ""))) or not d.get("output"):
+            raise SystemExit(f'❌ {path}: dashboard {i} needs a "name" (letters, digits, ".", "-", "_") and an "output"')
+        if unknown := set(d) - DASHBOARD_KEYS:
+            raise SystemExit(f"❌ {path}: {d['name']}: unknown key(s) {', '.join(sorted(unknown))}")
+        # Sidecars (search index, --split payload) are written next to the page.
+        folder = os.path.dirname(os.path.abspath(d["output"]))
+        if d["name"] in names or folder in folders:
+            raise SystemExit(f"❌ {path}: {d['name']}: every dashboard needs its own name and output directory")
+        names.add(d["name"])
+        folders.add(folder)
+        if "templates" in d:
+            d["templates"] = os.path.join(os.path.dirname(os.path.abspath(path)), d["templates"])
+    return dashboards
+
+
+def _dashboard_pool(count):
+    if PROFILER or count == 1:
+        return _InlineExecutor()
+    try:
+        return _process_pool(min(count, RSS_PARSE_WORKERS))
+    except (OSError, NotImplementedError) as e:
+        print(f"  ⚠️  process pool unavailable ({e}), building dashboards one at a time")
+        return _InlineExecutor()
+
+
+def build_variant(dashboard, articles, texts, args):
+    """Classify (from texts, the articles' classification inputs) and render
+    one --dashboards entry → (its console output, build result). Module
+    settings are restored afterwards, since under --profile or without a
+    process pool every dashboard is built in this process."""
+    global TOPIC_KEYWORDS, TEMPLATES_PATH, STATE_DIR, _topic_memo, _topic_memo_used
+    saved = TOPIC_KEYWORDS, TEMPLATES_PATH, STATE_DIR, _topic_memo, _topic_memo_used
+    TOPIC_KEYWORDS = dashboard.get("topic_keywords", TOPIC_KEYWORDS)
+    TEMPLATES_PATH = dashboard.get("templates", TEMPLATES_PATH)
+    STATE_DIR = os.path.join(STATE_DIR, "dashboards", dashboard["name"])
+    _topic_memo, _topic_memo_used = None, set()
+    load_templates.cache_clear()
+    template_index.cache_clear()
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            keep = set(dashboard.get("topics", ()))
+            variant_args = argparse.Namespace(**{**vars(args), "output": dashboard["output"],
+                                                 "webhook": dashboard.get("webhooks", []),
+                                                 "export": dashboard.get("export")})
+            os.makedirs(os.path.dirname(dashboard["output"]) or ".", exist_ok=True)
+            agg, selected = Aggregate(bursts=BurstDetector()), []
+            for i, (article, text) in enumerate(zip(articles, texts)):
+                article = dict(article, topic=classify_topic(*text))  # a copy: dashboards share the crawl
+                if not keep or article["topic"] in keep:
+                    agg.add(None, (0, i), article)
+                    selected.append(article)
+            notifier = make_notifier(variant_args)  # queued under this dashboard's STATE_DIR
+            topic_counts, miro_recs = build_dashboard(selected, variant_args, agg=agg, notifier=notifier)
+            flush_notifications(notifier)
+        return log.getvalue(), (dashboard["output"], len(selected), topic_counts, miro_recs)
+    finally:
+        TOPIC_KEYWORDS, TEMPLATES_PATH, STATE_DIR, _topic_memo, _topic_memo_used = saved
+        load_templates.cache_clear()
+        template_index.cache_clear()
+
+
+def build_dashboards(args, sources, names):
+    """Crawl once (snapshots are written as for a plain build, classified with
+    the default TOPIC_KEYWORDS), then build every --dashboards entry in parallel."""
+    dashboards = load_dashboards(args.dashboards)
+    results = {name: [] for name in SOURCES}
+    texts = {name: [] for name in SOURCES}
+
+    def collect(name, position, article):
+        text = classify_input(article)
+        article.setdefault("topic", classify_topic(*text))
+        results[name].append(article)
+        texts[name].append(text)
+
+    sinks, failed = [collect], set()
+    if not args.replay:
+        sinks.append(SnapshotWriter(names))
+    run_pipeline(names, *sinks, sources=sources, classify=False, failed=failed)
+    if not args.replay:
+        sinks[-1].close(failed)
+    for name in SOURCES:
+        if name not in names:
+            results[name] = load_snapshot(name)
+            texts[name] = [classify_input(a) for a in results[name]]
+    save_topic_memo()
+    save_lookup_caches()
+    articles = [a for name in SOURCES for a in results[name]]
+    texts = [t for name in SOURCES for t in texts[name]]
+    print(f"\n📊 Total articles: {len(articles)}, building {len(dashboards)} dashboards")
+
+    built = []
+    with _dashboard_pool(len(dashboards)) as pool:
+        futures = [(d["name"], pool.submit(build_variant, d, articles, texts, args)) for d in dashboards]
+        for name, future in futures:  # config order keeps output stable run to run
+            with span(f"dashboard {name}", "dashboard"):
+                try:
+                    log, result = future.result()
+                except Exception as e:
+                    print(f"\n⚠️  dashboard {name} failed: {e}")
+                    continue
+            print(f"\n━━ {name} " + "━" * max(3, 54 - len(name)) + log.rstrip("\n"))
+            built.append(result)
+    prune_cache()
+    for output, count, _, _ in built:
+        print(f"   {count} articles → {output}")
+    return built
+
+
+def main(argv=None):
+    global TRACER, PROFILER, UPSTREAM, ENRICH
+    args = parse_args(argv)
+    UPSTREAM, ENRICH = args.upstream, args.enrich
+    if args.trace:
+        TRACER = Tracer()
+    if args.profile:
+        PROFILER = Profiler(args.profile)
+    try:
+        with span(args.command, "run"):
+            return run_command(args)
+    finally:
+        # also on Ctrl+C, so a stopped daemon still leaves its timeline / profile
+        if args.trace:
+            TRACER.write(args.trace)
+            TRACER = None
+        if args.profile:
+            PROFILER.write()
+            PROFILER = None
+
+
+def run_command(args):
+    if args.command == "classify":
+        topic = _classify_text(" ".join(args.text).lower())
+        print(topic)
+        return topic
+    if args.command == "daemon":
+        return run_daemon(args)
+    if args.command == "serve":
+        return run_server(args)
+    if args.command == "miro":
+        return run_miro_export(args)
+    if args.command == "miro-mock":
+        return run_miro_mock(args)
+    if args.command == "simulate":
+        return run_simulator(args)
+
+    if args.command == "merge":
+        print("\n🚀 Eng Brand Machine — Merging shard partials\n" + "=" * 58)
+        paths = args.text or sorted(glob.glob(os.path.join(PARTIALS_DIR, "shard-*.jsonl")))
+        if not paths:
+            raise SystemExit(f"❌ no partial files given or found in {PARTIALS_DIR}/")
+        results, agg = merge_partials(paths)
+        save_snapshot(results)
+    else:
+        print("\n🚀 Eng Brand Machine — Aggregating Engineering Trends\n" + "=" * 58)
+        sources, names = plan_sources(args)
+        if args.shard:
+            return crawl_shard(args, sources, names)
+        if args.replay:
+            sources = {name: functools.partial(replay_snapshot, name) for name in SOURCES}
+        if args.dashboards:
+            return build_dashboards(args, sources, names)
+        results = {name: [] for name in SOURCES}
+        agg = Aggregate(bursts=BurstDetector())
+        sinks = [lambda name, position, article: results[name].append(article), agg]
+        failed = set()
+        if not args.replay:
+            sinks.append(SnapshotWriter(names))
+        run_pipeline(names, *sinks, sources=sources, failed=failed)
+        if not args.replay:
+            sinks[-1].close(failed)
+        for rank, name in enumerate(SOURCES):
+            if name not in names:
+                results[name] = load_snapshot(name)
+                for i, a in enumerate(results[name]):
+                    agg.add(name, (rank, i), a)
+    all_articles = [a for name in SOURCES for a in results[name]]
+    notifier = make_notifier(args)
+    topic_counts, miro_recs = build_dashboard(all_articles, args, agg=agg, notifier=notifier)
+    prune_cache()
+    flush_notifications(notifier)
+    print(f"   Run: open {args.output}")
+    return args.output, len(all_articles), topic_counts, miro_recs
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,42 @@
+import contextlib
+import http.server
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import eng_brand_machine as ebm  # noqa: E402
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory with fresh module state, so caches and run
+    state (.ebm-cache, .ebm-state) start out empty and stay per test."""
+    monkeypatch.chdir(tmp_path)
+    for name, value in {"_topic_memo": None, "_topic_memo_used": set(), "_link_resolver": None,
+                        "_enricher": None, "TRACER": None, "PROFILER": None, "UPSTREAM": None,
+                        "ENRICH": False}.items():
+        monkeypatch.setattr(ebm, name, value)
+    return tmp_path
+
+
+@contextlib.contextmanager
+def serve(handler):
+    """Run a request handler class on a free local port → its base URL."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def article(i, **fields):
+    return {"title": f"Story {i}", "url": f"https://example.com/{i}", "score": i,
+            "source": "Test", "source_icon": "🧪", **fields}
@@ -0,0 +1,61 @@
+import os
+
+from conftest import article, ebm
+
+
+def run(titles, now):
+    detector = ebm.BurstDetector()
+    for i, title in enumerate(titles):
+        detector.add(article(i, title=title))
+    detector.save(now=now)
+    return detector
+
+
+BASELINE = ["Kubernetes operator patterns", "Postgres query planner internals", "Rust async runtimes compared",
+            "Kubernetes cost tuning", "Postgres vacuum explained"]
+
+
+def test_sketch_never_undercounts():
+    sketch = ebm.CountMinSketch(width=64, depth=3)
+    counts = {f"term {i}": i % 7 + 1 for i in range(200)}
+    for term, n in counts.items():
+        for _ in range(n):
+            sketch.add(sketch.cells(term))
+    assert all(sketch.estimate(sketch.cells(term)) >= n for term, n in counts.items())
+    assert sketch.estimate(sketch.cells("term 3")) >= 4
+
+
+def test_first_run_records_a_baseline_only(workdir):
+    detector = run(BASELINE * 3, now=1_000_000)
+    assert detector.baseline is None and detector.emerging() == []
+    assert os.path.getsize(workdir / ".ebm-state" / "terms.sketch") == 20 + 4 * ebm.BURST_SKETCH_WIDTH * ebm.BURST_SKETCH_DEPTH
+
+
+def test_terms_above_their_baseline_emerge_as_one_phrase(workdir):
+    run(BASELINE * 3, now=1_000_000)
+    burst = [f"Zephyr JS ships {v}" for v in ("today", "a compiler", "types", "everywhere", "fast")]
+    detector = run(BASELINE * 3 + burst, now=1_000_000 + 6 * 3600)
+    terms = [e["term"] for e in detector.emerging()]
+    assert terms[0] == "zephyr js ships"
+    assert not any("kubernetes" in t or "postgres" in t for t in terms)  # as common as usual
+    top = detector.emerging()[0]
+    assert top["count"] == 5 and top["expected"] == 0 and top["title"].startswith("Zephyr JS ships")
+
+
+def test_baseline_decays_with_elapsed_time(workdir):
+    run(["Zephyr JS ships"] * 8, now=0)
+    half_life = ebm.BURST_HALF_LIFE_HOURS * 3600
+    detector = run([], now=half_life)
+    cells = detector.current.cells("zephyr")
+    assert ebm.BurstDetector().baseline.estimate(cells) == 4.0
+
+
+def test_list_helpers_do_not_touch_run_state(workdir):
+    articles = [article(i, topic="🦀 Languages", title="Zephyr JS ships") for i in range(5)]
+    ebm.template_index.cache_clear()
+    assert ebm.count_topics(articles) == [("🦀 Languages", 5)]
+    assert ebm.template_index.cache_info().currsize == 0
+    ebm.generate_miro_recommendations(articles)
+    ebm.generate_html(articles, ebm.count_topics(articles), ebm.generate_miro_recommendations(articles))
+    assert not (workdir / ".ebm-state").exists()
+    assert ebm.Aggregate(articles).bursts is None
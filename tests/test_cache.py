@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from conftest import article, ebm
+
+
+@pytest.fixture
+def stats(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "CACHE_STATS", {"hits": 0, "misses": 0})
+    return ebm.CACHE_STATS
+
+
+def templates(tmp_path, name, title):
+    """A copy of the template library with the AI / ML recommendation retitled."""
+    with open(ebm.TEMPLATES_PATH, encoding="utf-8") as f:
+        library = json.load(f)
+    library["MIRO_CONTENT_TEMPLATES"]["🤖 AI / ML"][0]["title"] = title
+    path = tmp_path / name
+    path.write_text(json.dumps(library), encoding="utf-8")
+    return str(path)
+
+
+def test_stage_reuses_results_for_identical_inputs(stats):
+    calls = []
+    compute = lambda: calls.append(1) or {"n": len(calls)}  # noqa: E731
+    assert ebm.cached_stage("stage", [1, 2], compute) == {"n": 1}
+    assert ebm.cached_stage("stage", [1, 2], compute) == {"n": 1}
+    assert ebm.cached_stage("stage", [1, 3], compute) == {"n": 2}
+    assert ebm.cached_stage("other", [1, 2], compute) == {"n": 3}
+    assert stats == {"hits": 1, "misses": 3}
+
+
+def test_stage_key_follows_the_template_library(stats, workdir, monkeypatch):
+    a, b = templates(workdir, "a.json", "Title A"), templates(workdir, "b.json", "Title B")
+    same_as_a = templates(workdir, "a-copy.json", "Title A")
+    versions = {}
+    for path in (a, b, same_as_a, a):
+        monkeypatch.setattr(ebm, "TEMPLATES_PATH", path)
+        versions[path] = ebm.code_version()
+        ebm.cached_stage("recommendations", ["same inputs"], lambda: path)
+    assert versions[a] != versions[b] and versions[a] == versions[same_as_a]
+    assert stats == {"hits": 2, "misses": 2}
+
+
+def test_dashboards_with_their_own_templates_get_their_own_recommendations(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "_dashboard_pool", lambda count: ebm._InlineExecutor())
+    writer = ebm.SnapshotWriter(list(ebm.SOURCES))
+    for i in range(40):
+        writer("hn", None, article(i, title=f"New LLM agent framework {i}", topic="🤖 AI / ML"))
+    writer.close()
+    (workdir / "dashboards.json").write_text(json.dumps([
+        {"name": "main", "output": "main/index.html"},
+        {"name": "custom", "output": "custom/index.html", "templates": templates(workdir, "t.json", "Custom AI board")},
+    ]), encoding="utf-8")
+    for _ in range(2):  # the second build is served from the stage cache
+        built = ebm.main(["--replay", "--dashboards", "dashboards.json"])
+        titles = {output: [r["title"] for r in recs] for output, _, _, recs in built}
+        assert "Custom AI board" in titles["custom/index.html"]
+        assert "Custom AI board" not in titles["main/index.html"]
+
+
+
+def test_a_new_code_version_misses_every_stage(stats, monkeypatch):
+    ebm.cached_stage("stage", ["inputs"], lambda: "old")
+    monkeypatch.setattr(ebm, "code_version", lambda: "an-edited-file")
+    assert ebm.cached_stage("stage", ["inputs"], lambda: "new") == "new"
+    assert stats == {"hits": 0, "misses": 2}
+
+
+def test_prune_cache_drops_only_entries_no_build_touched(stats, workdir):
+    ebm.cached_stage("old", [1], lambda: 1)
+    ebm.cached_stage("recent", [1], lambda: 2)
+    (old,) = (workdir / ebm.CACHE_DIR / "old").rglob("*.json")
+    month_ago = ebm.time.time() - 30 * 86400
+    ebm.os.utime(old, (month_ago, month_ago))
+    assert ebm.prune_cache(max_age_days=7) == 1
+    assert not old.exists() and list((workdir / ebm.CACHE_DIR / "recent").rglob("*.json"))
+
+
+def test_an_unchanged_rebuild_hits_the_cache_and_skips_the_write(stats, workdir, capsys):
+    writer = ebm.SnapshotWriter(list(ebm.SOURCES))
+    for i in range(12):
+        writer("hn", None, article(i, topic="🦀 Languages"))
+    writer.close()
+    ebm.main(["--replay", "--output", "index.html"])
+    first = (workdir / "index.html").stat().st_mtime_ns
+    misses = stats["misses"]
+    capsys.readouterr()
+    ebm.main(["--replay", "--output", "index.html"])
+    assert "index.html unchanged — write skipped" in capsys.readouterr().out
+    assert (workdir / "index.html").stat().st_mtime_ns == first
+    assert stats["misses"] == misses and stats["hits"] >= misses
@@ -0,0 +1,73 @@
+import time
+
+from conftest import article, ebm
+
+
+class Clock:
+    """Stands in for the time module inside run_daemon: sleep() advances a
+    fake monotonic clock, and interrupts the daemon once minutes have passed."""
+
+    def __init__(self, minutes):
+        self.now, self.limit = 0.0, minutes * 60
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if self.now + seconds > self.limit:
+            raise KeyboardInterrupt
+        self.now += seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+def test_sources_refresh_on_their_own_cadence_and_only_new_data_rebuilds(workdir, monkeypatch, capsys):
+    fetches = {name: [] for name in ebm.SOURCES}
+    clock = Clock(minutes=61)
+
+    def fetcher(name):
+        def fetch():
+            fetches[name].append(clock.now / 60)
+            # Only Reddit ever has something new to say.
+            stamp = f" at {clock.now:.0f}" if name == "reddit" else ""
+            return [article(len(name), title=f"{name} story{stamp}", url=f"https://{name}.example.com/1")]
+        return fetch
+
+    builds = []
+    monkeypatch.setattr(ebm, "time", clock)
+    monkeypatch.setattr(ebm, "plan_sources", lambda args: ({n: fetcher(n) for n in ebm.SOURCES}, list(ebm.SOURCES)))
+    monkeypatch.setattr(ebm, "build_dashboard", lambda articles, args, **kw: builds.append(
+        (clock.now / 60, sorted(a["title"] for a in articles))) or ({}, []))
+    monkeypatch.delenv("EBM_WEBHOOKS", raising=False)
+    ebm.run_daemon(ebm.argparse.Namespace(webhook=[]))
+
+    for name, minutes in ebm.SOURCE_REFRESH_MINUTES.items():
+        assert fetches[name] == [float(m) for m in range(0, 61, minutes)], name
+    assert [at for at, _ in builds] == [0, 30, 60]
+    assert all(len(titles) == len(ebm.SOURCES) for _, titles in builds)
+    out = capsys.readouterr().out
+    assert out.count("no new data — outputs left as they are") == 13 - len(builds)  # hn is due every 5 minutes
+    assert "daemon stopped" in out
+
+
+def test_a_failed_refresh_keeps_the_last_articles_and_skips_the_rebuild(workdir, monkeypatch):
+    clock = Clock(minutes=6)
+    calls = []
+
+    def hn():
+        calls.append(clock.now)
+        if len(calls) > 1:
+            raise ConnectionError("reset")
+        yield article(1, title="Still here")
+
+    builds = []
+    monkeypatch.setattr(ebm, "time", clock)
+    monkeypatch.setattr(ebm, "plan_sources", lambda args: (dict.fromkeys(ebm.SOURCES, lambda: []) | {"hn": hn},
+                                                           list(ebm.SOURCES)))
+    monkeypatch.setattr(ebm, "build_dashboard", lambda articles, args, **kw: builds.append(
+        [a["title"] for a in articles]) or ({}, []))
+    monkeypatch.delenv("EBM_WEBHOOKS", raising=False)
+    ebm.run_daemon(ebm.argparse.Namespace(webhook=[]))
+    assert calls == [0, 300] and builds == [["Still here"]]
+    assert [a["title"] for a in ebm.load_snapshot("hn")] == ["Still here"]
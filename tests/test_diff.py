@@ -0,0 +1,50 @@
+from conftest import article, ebm
+
+
+def run(articles, topics=()):
+    diff = ebm.RunDiff()
+    summary = diff.classify(articles, list(topics))
+    diff.save()
+    return summary, {a["title"]: (a.get("change"), a.get("prev_score")) for a in articles}
+
+
+def test_runs_tag_new_rising_falling_and_returning_stories(workdir):
+    summary, tags = run([article(1, score=100), article(2, score=100), article(3, score=100), article(4, score=10)],
+                        [("🦀 Languages", 4)])
+    assert summary is None and set(tags.values()) == {(None, None)}  # the first run only records state
+
+    summary, tags = run([article(1, score=130),                 # +30 ≥ max(5, 25): rising
+                         article(2, score=80),                  # −20 < 25: steady
+                         article(4, score=14),                  # +4 < 5: steady, however large in ratio
+                         article(5, score=50),                  # never seen: new
+                         article(5, score=50, source="Other", url="http://www.example.com/5/?utm_source=x")],
+                        [("🦀 Languages", 3), ("🤖 AI / ML", 2)])
+    assert tags == {"Story 1": ("rising", 100), "Story 2": (None, None), "Story 4": (None, None),
+                    "Story 5": ("new", None)}
+    assert {k: summary[k] for k in ("new", "rising", "falling", "returning", "gone")} == \
+        {"new": 1, "rising": 1, "falling": 0, "returning": 0, "gone": 1}
+    assert summary["topics_new"] == ["🤖 AI / ML"] and summary["topic_moves"] == [("🦀 Languages", -1)]
+
+    summary, tags = run([article(1, score=90), article(3, score=100)], [("🦀 Languages", 2)])
+    assert tags == {"Story 1": ("falling", 130), "Story 3": ("returning", None)}
+    assert summary["gone"] == 3 and summary["topics_dropped"] == ["🤖 AI / ML"]
+
+
+def test_unreadable_state_counts_as_a_first_run(workdir):
+    items = workdir / ".ebm-state" / "diff" / "items.bin"
+    for damage in (lambda data: b"EBMD\xff\xff\xff\xff" + data[8:],  # a count no file could hold
+                   lambda data: data[:-3]):                           # cut short mid-write
+        run([article(1)])
+        items.write_bytes(damage(items.read_bytes()))
+        summary, tags = run([article(1, score=500), article(2)])
+        assert summary is None and set(tags.values()) == {(None, None)}
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = ebm.BloomFilter(bits=1 << 16, hashes=7)
+    members = [ebm.url_hash(f"https://example.com/{i}") for i in range(3_000)]
+    for h in members:
+        bloom.add(h)
+    assert all(h in bloom for h in members) and bloom.count == 3_000
+    others = [ebm.url_hash(f"https://other.example.com/{i}") for i in range(10_000)]
+    assert sum(h in bloom for h in others) / len(others) < 0.02
@@ -0,0 +1,49 @@
+import http.server
+
+from conftest import ebm, serve
+
+PAGE = ("<html><head><meta name='description' content='A  story about\n Rust'></head><body>"
+        "<nav><p>Home | About</p></nav><h1>Rust in production</h1>"
+        "<p>We rewrote the ingest service &amp; cut p99 latency.</p><script>var p = '<p>no</p>';</script>"
+        "<footer><p>© 2026</p></footer></body></html>")
+
+
+def test_text_extractor_ignores_page_furniture_and_chunk_boundaries():
+    for size in (len(PAGE), 7, 1):
+        extractor = ebm._text_extractor_class()()
+        for i in range(0, len(PAGE), size):
+            extractor.feed(PAGE[i:i + size])
+        assert extractor.text() == ("A story about Rust Rust in production "
+                                    "We rewrote the ingest service & cut p99 latency.")
+
+
+def test_enricher_fetches_each_page_once(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "ENRICH_HOST_INTERVAL", 0)
+    hits = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            status, body = {"/post": (200, PAGE), "/gone": (404, "")}.get(self.path, (503, ""))
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    with serve(Handler) as base:
+        enricher = ebm.Enricher()
+        assert enricher.text(f"{base}/post").startswith("A story about Rust")
+        assert enricher.text(f"{base}/post?utm_source=x").startswith("A story about Rust")
+        assert enricher.text(f"{base}/gone") == ""
+        assert enricher.text(f"{base}/flaky") == ""
+        enricher.save()
+        again = ebm.Enricher()
+        assert again.text(f"{base}/post").startswith("A story about Rust")
+        assert again.text(f"{base}/gone") == ""
+        again.text(f"{base}/flaky")  # failures worth retrying wait ENRICH_RETRY_HOURS
+    assert hits == ["/post", "/gone", "/flaky"]
@@ -0,0 +1,63 @@
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import article, ebm
+
+
+def columnar_round_trip(path, articles):
+    writer = ebm.ColumnarWriter(str(path))
+    for a in articles:
+        writer.write(a)
+    writer.close()
+    return list(ebm.read_columnar(str(path)))
+
+
+def test_columnar_round_trip_across_row_groups(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "COLUMNAR_GROUP_ROWS", 4)
+    articles = [article(i, topic=("🤖 AI / ML", "🦀 Languages")[i % 2], comments=i * 3,
+                        published=1_760_000_000 + i, title=f"Story {i} — ünïcode ✓")
+                for i in range(10)]
+    rows = columnar_round_trip(workdir / "a.ebmc", articles)
+    assert rows == [{name: a[name] for name, _ in ebm.COLUMNAR_SCHEMA} for a in articles]
+
+
+def test_columnar_missing_fields_read_back_as_empty(workdir):
+    rows = columnar_round_trip(workdir / "a.ebmc", [{"title": "Only a title"}])
+    assert rows == [{"title": "Only a title", "url": "", "source": "", "topic": "",
+                     "score": 0, "comments": 0, "published": 0}]
+
+
+def test_columnar_empty_file_and_bad_magic(workdir):
+    assert columnar_round_trip(workdir / "a.ebmc", []) == []
+    (workdir / "bad.ebmc").write_bytes(b"JUNK")
+    with pytest.raises(ValueError):
+        list(ebm.read_columnar(str(workdir / "bad.ebmc")))
+
+
+def test_write_exports(workdir, capsys):
+    articles = [article(1, topic="🦀 Languages"), article(2, topic="🦀 Languages")]
+    recs = [{"topic": "🦀 Languages", "title": "Rust board", "description": "d", "body": "b", "tags": ["rust"]}]
+    ebm.write_exports("out", articles, recs, datetime(2026, 1, 2, tzinfo=timezone.utc))
+    lines = (workdir / "out" / "articles.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == articles
+    assert [r["title"] for r in ebm.read_columnar("out/articles.ebmc")] == ["Story 1", "Story 2"]
+    atom = "{http://www.w3.org/2005/Atom}"
+    feed = ET.parse(workdir / "out" / "recommendations.atom").getroot()
+    (entry,) = feed.findall(f"{atom}entry")
+    assert entry.find(f"{atom}title").text == "Rust board"
+    assert [c.get("term") for c in entry.findall(f"{atom}category")] == ["🦀 Languages", "rust"]
+    assert not list((workdir / "out").glob("*.tmp"))
+
+
+def test_atom_entries_carry_the_body_as_escaped_html(workdir):
+    body = "<p>Map your <strong>RAG</strong> pipeline &amp; ship it</p><h2>Why</h2><p>a < b</p>"
+    ebm.write_atom_feed("feed.atom", [{"topic": "🤖 AI / ML", "title": "T", "body": body}],
+                        datetime(2026, 1, 2, tzinfo=timezone.utc))
+    raw = (workdir / "feed.atom").read_text(encoding="utf-8")
+    assert "<strong>" not in raw and "&lt;strong&gt;" in raw
+    atom = "{http://www.w3.org/2005/Atom}"
+    content = ET.parse(workdir / "feed.atom").getroot().find(f"{atom}entry/{atom}content")
+    assert content.get("type") == "html" and content.text == body
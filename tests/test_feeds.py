@@ -0,0 +1,48 @@
+import http.server
+
+from conftest import ebm, serve
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Eng blog</title>
+<item><title>Scaling Kubernetes at work</title><link>https://blog.example.com/k8s</link>
+<pubDate>Mon, 05 Jan 2026 10:00:00 GMT</pubDate><description>How we run 40 clusters</description></item>
+<item><title>Rust in the kernel</title><link>https://blog.example.com/rust</link></item>
+</channel></rss>"""
+
+
+class FeedHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = FEED if self.path == "/feed.xml" else b"not found"
+        self.send_response(200 if self.path == "/feed.xml" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_feeds_are_parsed_in_worker_processes_that_were_not_forked(workdir, monkeypatch):
+    pools = []
+
+    def process_pool(workers):
+        pools.append(real(workers))
+        return pools[-1]
+
+    real = ebm._process_pool
+    monkeypatch.setattr(ebm, "_process_pool", process_pool)
+    with serve(FeedHandler) as base:
+        articles = list(ebm.fetch_rss_feeds([("Blog", f"{base}/feed.xml"), ("Gone", f"{base}/missing.xml")]))
+    assert [(a["title"], a["source"], a["topic"]) for a in articles] == [
+        ("Scaling Kubernetes at work", "Blog", "☁️ Cloud / Infra"),
+        ("Rust in the kernel", "Blog", "🦀 Languages")]
+    assert articles[0]["published"] == 1767607200 and articles[1]["published"] == 0
+    (pool,) = pools
+    assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_worker_processes_inherit_the_upstream_setting(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "UPSTREAM", "http://127.0.0.1:9/")
+    with ebm._process_pool(1) as pool:
+        assert pool.submit(ebm.upstream_url, "https://hn.example.com/top?x=1").result(timeout=60) == \
+            "http://127.0.0.1:9/hn.example.com/top?x=1"
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from conftest import ebm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_defers_heavy_and_optional_modules():
+    code = ("import sys, eng_brand_machine; "
+            "print(' '.join(sorted(m for m in ('requests', 'feedparser', 'cProfile', 'pstats', 'tracemalloc', 'html.parser') "
+            "if m in sys.modules)))")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_profiler_loads_its_modules_on_demand(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "PROFILER", ebm.Profiler("prof"))
+
+    def stage():
+        with ebm.profiled("stage"):
+            return [str(i) * 10 for i in range(1000)]
+
+    kept = stage()
+    assert tracemalloc.is_tracing()
+    ebm.PROFILER.write()
+    assert not tracemalloc.is_tracing() and len(kept) == 1000
+    report = (workdir / "prof" / "report.txt").read_text(encoding="utf-8")
+    assert report.startswith("Stage") and "\nstage " in report
+    assert (workdir / "prof" / "stage.pstats").exists()
+
+
+def test_classify_runs_without_the_network_stack_or_the_template_library():
+    code = ("import sys, eng_brand_machine as ebm; "
+            "topic = ebm.main(['classify', 'borrow', 'checker', 'in', 'rust']); "
+            "print(topic, ebm.load_templates.cache_info().currsize, 'requests' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.splitlines()[-1] == "🦀 Languages 0 False"
+
+
+def test_template_data_is_parsed_once_on_first_use(monkeypatch):
+    ebm.load_templates.cache_clear()
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda path, *a, **kw: opened.append(path) or real_open(path, *a, **kw))
+    assert ebm.DEFAULT_RECS is ebm.load_templates()["DEFAULT_RECS"]
+    assert ebm.MIRO_CONTENT_TEMPLATES is ebm.load_templates()["MIRO_CONTENT_TEMPLATES"]
+    assert opened == [ebm.TEMPLATES_PATH]
+    with pytest.raises(AttributeError, match="NOT_A_SETTING"):
+        ebm.NOT_A_SETTING
+
+
+def test_lazy_module_imports_on_first_attribute():
+    lazy = ebm._LazyModule("colorsys")
+    sys.modules.pop("colorsys", None)
+    assert lazy._module is None and "colorsys" not in sys.modules
+    assert lazy.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+    assert lazy._module is sys.modules["colorsys"]
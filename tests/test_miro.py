@@ -0,0 +1,115 @@
+import json
+
+import pytest
+import requests
+
+from conftest import ebm, serve
+
+REC = {"topic": "🦀 Languages", "title": "Why Rust won the systems team over",
+       "description": "A migration story", "demo": "Live port of a C module", "format": "Blog + board",
+       "cta": "Try it", "body": "<p>Intro text</p><h2>Before</h2><p>C</p><h2>After</h2><p>Rust</p>",
+       "inspired_by": ["Rust 2.0 released"], "tags": ["rust", "systems"]}
+
+
+@pytest.fixture
+def miro(workdir):
+    with serve(ebm.miro_mock_handler(10_000)) as base:
+        yield ebm.MiroClient("test-token", f"{base}/v2")
+
+
+def board_items(client, board_id):
+    return {item["id"] for item in client.request("GET", f"/boards/{board_id}/items")["data"]}
+
+
+def sync(client, rec, boards):
+    return ebm.sync_board(client, rec, boards, lambda: None)
+
+
+def test_sync_creates_a_board_then_only_changes(miro):
+    boards = {}
+    entry, created, deleted = sync(miro, REC, boards)
+    assert (created, deleted) == (len(ebm.board_layout(REC)), 0)
+    assert board_items(miro, entry["board_id"]) == set(entry["items"].values())
+
+    calls = miro.calls
+    assert sync(miro, REC, boards)[1:] == (0, 0)
+    assert miro.calls == calls  # an unchanged board costs no API calls
+
+    entry, created, deleted = sync(miro, dict(REC, tags=["rust", "compilers"]), boards)
+    assert (created, deleted) == (1, 1)
+    assert board_items(miro, entry["board_id"]) == set(entry["items"].values())
+
+
+def test_items_deleted_on_the_board_do_not_recreate_it(miro, capsys):
+    boards = {}
+    entry, _, _ = sync(miro, REC, boards)
+    board_id, items = entry["board_id"], dict(entry["items"])
+    stale = [i for h, i in items.items() if h not in {ebm.content_hash(x)[:16] for x in
+                                                        ebm.board_layout(dict(REC, tags=[]))}]
+    miro.request("DELETE", f"/boards/{board_id}/items/{stale[0]}")  # a user tidied up by hand
+
+    entry, created, deleted = sync(miro, dict(REC, tags=[]), boards)
+    assert entry["board_id"] == board_id
+    assert (created, deleted) == (0, 2)
+    assert board_items(miro, board_id) == set(entry["items"].values())
+    assert "recreating" not in capsys.readouterr().out
+
+
+def test_a_deleted_board_is_recreated(miro, capsys):
+    boards = {}
+    old = sync(miro, REC, boards)[0]["board_id"]
+    miro.request("DELETE", f"/boards/{old}")
+    entry, created, _ = sync(miro, dict(REC, tags=["rust", "compilers"]), boards)
+    assert entry["board_id"] != old and created == len(ebm.board_layout(REC))
+    assert board_items(miro, entry["board_id"]) == set(entry["items"].values())
+    assert "is gone — recreating it" in capsys.readouterr().out
+
+
+def test_other_errors_are_not_mistaken_for_a_missing_board(miro):
+    with pytest.raises(requests.HTTPError):
+        sync(ebm.MiroClient("test-token", miro.base_url + "/nowhere"), REC, {})
+    boards = {}
+    sync(miro, REC, boards)
+    unauthorized = ebm.MiroClient("", miro.base_url)
+    unauthorized.session.headers.pop("Authorization")
+    with pytest.raises(requests.HTTPError) as e:
+        sync(unauthorized, dict(REC, tags=[]), boards)
+    assert e.value.response.status_code == 401
+
+
+def test_run_miro_export_keeps_board_state(miro, monkeypatch, workdir):
+    monkeypatch.setenv("MIRO_ACCESS_TOKEN", "test-token")
+    ebm._write_json_atomic(ebm._recs_path(), [REC, dict(REC, title="Second board")])
+    args = ebm.argparse.Namespace(text=["2"], miro_api=miro.base_url)
+    boards = ebm.run_miro_export(args)
+    saved = json.loads((workdir / ".ebm-state" / "miro" / "boards.json").read_text(encoding="utf-8"))
+    assert saved == boards and [b["title"] for b in saved.values()] == ["Second board"]
+
+
+def test_a_failed_batch_keeps_the_ids_of_the_batches_that_landed(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "MIRO_BULK_LIMIT", 3)
+    bulk_calls, failed = [], []
+
+    class Flaky(ebm.miro_mock_handler(10_000)):
+        def do_POST(self):
+            if self.path.endswith("/items/bulk"):
+                bulk_calls.append(self.path)
+                if len(bulk_calls) == 2:
+                    failed.extend(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                    return self._reply(400, {"message": "invalid item"})
+            super().do_POST()
+
+    with serve(Flaky) as base:
+        client, boards = ebm.MiroClient("test-token", f"{base}/v2"), {}
+        saved = []
+        with pytest.raises(requests.HTTPError):
+            ebm.sync_board(client, REC, boards, lambda: saved.append(json.dumps(boards)))
+        (entry,) = json.loads(saved[-1]).values()
+        layout = ebm.board_layout(REC)
+        landed = board_items(client, entry["board_id"])
+        assert set(entry["items"].values()) == landed and len(landed) == len(layout) - len(failed)
+
+        entry, created, _ = sync(client, REC, boards)
+        assert created == len(failed)
+        assert board_items(client, entry["board_id"]) == set(entry["items"].values())
+        assert len(entry["items"]) == len(layout)
@@ -0,0 +1,182 @@
+import http.server
+import json
+import os
+import subprocess
+import sys
+import time
+
+from conftest import article, ebm, serve
+
+
+def stub_webhook(statuses):
+    """A handler that records each POSTed JSON body and answers with the next
+    status in statuses (200 once they run out)."""
+    received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append((self.path, json.loads(self.rfile.read(int(self.headers["Content-Length"])))))
+            status = statuses.pop(0) if statuses else 200
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler, received
+
+
+def stories(*ids):
+    return [article(i, topic="🦀 Languages") for i in ids]
+
+
+def recs(*titles):
+    return [{"topic": "🦀 Languages", "title": t} for t in titles]
+
+
+def test_first_run_is_a_baseline_then_only_new_events_are_sent(workdir):
+    handler, received = stub_webhook([])
+    with serve(handler) as base:
+        url = f"{base}/hooks/secret-token"
+        first = ebm.Notifier([url])
+        first.notify(recs("A"), stories(1, 2))
+        assert first.wait(5) and received == []
+
+        second = ebm.Notifier([url])
+        second.notify(recs("A", "B"), stories(1, 2, 3))
+        assert second.wait(5)
+    ((path, body),) = received
+    assert path == "/hooks/secret-token"
+    assert "1 new recommendation(s), 1 new top story(ies)" in body["text"]
+    assert "[🦀 Languages] B" in body["text"] and "Story 3" in body["text"]
+    assert "Story 1" not in body["text"]
+
+
+def test_queue_and_history_never_hold_the_webhook_url(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "NOTIFY_BACKOFF_SECONDS", 3600)
+    handler, received = stub_webhook([503])
+    with serve(handler) as base:
+        url = f"{base}/hooks/secret-token"
+        ebm.Notifier([url]).notify([], stories(1))
+        notifier = ebm.Notifier([url])
+        notifier.notify([], stories(1, 2))
+        assert not notifier.wait(1)  # retry is an hour away
+    notify_dir = workdir / ".ebm-state" / "notify"
+    for name in ("queue.json", "seen.json"):
+        assert "secret-token" not in (notify_dir / name).read_text(encoding="utf-8")
+    (entry,) = json.loads((notify_dir / "queue.json").read_text(encoding="utf-8"))
+    assert entry["channel"] == ebm._channel_id(url) and entry["attempts"] == 1
+    assert len(received) == 1
+
+
+def test_a_queued_message_is_sent_by_the_next_run_from_configured_urls(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "NOTIFY_BACKOFF_SECONDS", 3600)
+    handler, received = stub_webhook([500])
+    with serve(handler) as base:
+        url = f"{base}/hook"
+        ebm.Notifier([url]).notify([], stories(1))
+        parked = ebm.Notifier([url])
+        parked.notify([], stories(1, 2))
+        assert not parked.wait(1)
+        # A channel that is no longer configured can't be sent to: its entries are dropped.
+        assert ebm.Notifier([f"{base}/other"])._queue == []
+
+        queue_path = workdir / ".ebm-state" / "notify" / "queue.json"
+        (entry,) = json.loads(queue_path.read_text(encoding="utf-8"))
+        queue_path.write_text(json.dumps([dict(entry, due=0)]), encoding="utf-8")  # the hour is up
+        notifier = ebm.Notifier([url])
+        notifier.start()
+        assert notifier.wait(5)
+    assert len(received) == 2 and all("Story 2" in body["text"] for _, body in received)
+    assert json.loads(queue_path.read_text(encoding="utf-8")) == []
+
+
+def test_429_and_5xx_are_retried_with_backoff(workdir, monkeypatch):
+    monkeypatch.setattr(ebm, "NOTIFY_BACKOFF_SECONDS", 0)
+    handler, received = stub_webhook([500, 429, 404])
+    with serve(handler) as base:
+        url = f"{base}/hook"
+        ebm.Notifier([url]).notify([], stories(1))
+        notifier = ebm.Notifier([url])
+        notifier.notify([], stories(1, 2))
+        assert notifier.wait(5)
+    assert len(received) == 3  # 404 is permanent: dropped, not retried
+
+
+def test_seen_history_is_time_bounded(workdir, monkeypatch):
+    handler, received = stub_webhook([])
+    with serve(handler) as base:
+        url = f"{base}/hook"
+        ebm.Notifier([url]).notify([], stories(1, 2))
+        # Story 2 drops out of the top stories for a run, then comes back: not new.
+        ebm.Notifier([url]).notify([], stories(1))
+        notifier = ebm.Notifier([url])
+        notifier.notify([], stories(1, 2))
+        assert notifier.wait(5) and received == []
+
+        seen_path = workdir / ".ebm-state" / "notify" / "seen.json"
+        seen = json.loads(seen_path.read_text(encoding="utf-8"))
+        story2 = ebm.content_hash(stories(2)[0]["url"])[:16]
+        seen[story2] = time.time() - (ebm.NOTIFY_SEEN_DAYS + 1) * 86400
+        seen_path.write_text(json.dumps(seen), encoding="utf-8")
+        notifier = ebm.Notifier([url])
+        notifier.notify([], stories(1, 2))
+        assert notifier.wait(5)
+    ((_, body),) = received
+    assert "Story 2" in body["text"] and "Story 1" not in body["text"]
+
+
+def test_make_notifier_reads_flags_and_environment(workdir, monkeypatch):
+    args = ebm.argparse.Namespace(webhook=["https://hooks.example.com/a"])
+    monkeypatch.delenv("EBM_WEBHOOKS", raising=False)
+    assert ebm.make_notifier(ebm.argparse.Namespace(webhook=[])) is None
+    monkeypatch.setenv("EBM_WEBHOOKS", "https://hooks.example.com/a https://discord.com/api/webhooks/b")
+    notifier = ebm.make_notifier(args)
+    assert sorted(notifier.channels.values()) == ["https://discord.com/api/webhooks/b", "https://hooks.example.com/a"]
+    assert ebm.make_notifier(args) is not notifier
+
+
+def test_a_message_in_flight_when_the_process_dies_is_sent_after_a_restart(workdir):
+    received = []
+
+    class SlowFirst(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"])))["text"])
+            if len(received) == 1:
+                time.sleep(2)  # the sender is gone before this answer arrives
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with serve(SlowFirst) as base:
+        url = f"{base}/hook"
+        ebm.Notifier([url]).notify([], stories(1))  # baseline
+        child = ("import os, time, eng_brand_machine as ebm\n"
+                 "from conftest import article\n"
+                 f"ebm.Notifier([{url!r}]).notify([], [article(i, topic='🦀 Languages') for i in (1, 2)])\n"
+                 "deadline = time.time() + 5\n"
+                 "while not os.path.exists('sent') and time.time() < deadline: time.sleep(0.02)\n"
+                 "os._exit(0)  # killed mid-delivery: no wait(), no clean shutdown\n")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.path.join(root, "tests")]))
+        proc = subprocess.Popen([sys.executable, "-c", child], cwd=workdir, env=env)
+        deadline = time.time() + 10
+        while not received and time.time() < deadline:
+            time.sleep(0.02)
+        (workdir / "sent").touch()
+        assert proc.wait(10) == 0 and len(received) == 1
+
+        queue_path = workdir / ".ebm-state" / "notify" / "queue.json"
+        (entry,) = json.loads(queue_path.read_text(encoding="utf-8"))
+        assert "sending" not in entry and [e["title"] for e in entry["events"]] == ["Story 2"]
+        notifier = ebm.Notifier([url])
+        notifier.start()
+        assert notifier.wait(10)
+    assert len(received) == 2 and all("Story 2" in text for text in received)
+    assert json.loads(queue_path.read_text(encoding="utf-8")) == []
@@ -0,0 +1,167 @@
+import threading
+import time
+
+import pytest
+
+from conftest import article, ebm
+
+
+def run(sources, timeout=20):
+    """stream_articles over sources → [(name, position, article)], failing
+    instead of hanging if the stream never ends."""
+    out = []
+    thread = threading.Thread(target=lambda: out.extend(ebm.stream_articles(list(sources), sources)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline did not finish"
+    return out
+
+
+def slow(articles, delay):
+    def fetch():
+        for a in articles:
+            time.sleep(delay)
+            yield a
+    return fetch
+
+
+def test_each_source_keeps_its_order_however_fetches_interleave(workdir):
+    out = run({"hn": slow([article(i) for i in range(30)], 0.002),
+               "devto": slow([article(100 + i) for i in range(30)], 0.001)})
+    for name, rank in (("hn", 0), ("devto", 2)):
+        got = [(position, a["title"]) for n, position, a in out if n == name]
+        assert [p for p, _ in got] == [(rank, i) for i in range(30)]
+        assert [t for _, t in got] == [f"Story {i + (100 if name == 'devto' else 0)}" for i in range(30)]
+
+
+def test_articles_are_normalized_and_classified(workdir):
+    (_, _, a), = run({"hn": lambda: [{"title": "  Rust 2.0 released  ", "url": "https://example.com/r",
+                                      "source": "HN", "source_icon": "🟠"}]})
+    assert a["title"] == "Rust 2.0 released"
+    assert (a["score"], a["comments"], a["comments_url"]) == (0, 0, "https://example.com/r")
+    assert a["topic"] == "🦀 Languages"
+
+
+def test_dedupe_uses_the_canonical_url_within_a_source(workdir):
+    hn = [article(1), article(1, url="http://www.example.com/1/?utm_source=x#top"), article(2), {"title": ""}]
+    out = run({"hn": lambda: hn, "devto": lambda: [article(1)]})
+    assert [(n, a["title"]) for n, _, a in sorted(out, key=lambda r: r[1])] == [
+        ("hn", "Story 1"), ("hn", "Story 2"), ("devto", "Story 1")]
+
+
+@pytest.mark.parametrize("url, canonical", [
+    ("http://www.Example.com:443/post/?utm_source=hn&utm_medium=rss#comments", "https://example.com/post"),
+    ("https://example.com/a?b=2&fbclid=x&a=1&gclid=y&msclkid=z", "https://example.com/a?a=1&b=2"),
+    ("https://twitter.com/x/status/1?ref_src=twsrc%5Etfw", "https://twitter.com/x/status/1"),
+    # "ref" alone is functional: a branch, a tag, a referral program's page
+    ("https://github.com/org/repo/blob/main/README.md?ref=v2.0", "https://github.com/org/repo/blob/main/README.md?ref=v2.0"),
+    ("https://example.com:8080/p?ref=docs&mc_cid=1&mc_eid=2", "https://example.com:8080/p?ref=docs"),
+])
+def test_canonical_url(url, canonical):
+    assert ebm.canonical_url(url) == canonical
+
+
+def test_strip_tracking_keeps_functional_parameters():
+    url = "https://github.com/org/repo/tree/feature?ref=feature"
+    assert ebm.strip_tracking(url) is url
+    assert ebm.strip_tracking("https://news.example.com/p?id=3&utm_campaign=w&ref_src=x") == \
+        "https://news.example.com/p?id=3"
+
+
+def test_a_failing_article_is_dropped_without_stalling_the_stream(workdir, capsys):
+    hn = [article(1), article(2, score="n/a"), article(3)]
+    out = run({"hn": lambda: hn, "devto": lambda: [article(4)]})
+    assert sorted(a["title"] for _, _, a in out) == ["Story 1", "Story 3", "Story 4"]
+    assert "dropped 'Story 2'" in capsys.readouterr().out
+
+
+def test_a_failing_network_stage_does_not_stall_the_stream(workdir, monkeypatch):
+    def resolve(position, a):
+        if a["title"] == "Story 2":
+            raise RuntimeError("boom")
+        return a
+
+    monkeypatch.setattr(ebm, "resolve_article", resolve)
+    out = run({"hn": lambda: [article(i) for i in range(5)]})
+    assert [a["title"] for _, _, a in out] == ["Story 0", "Story 1", "Story 3", "Story 4"]
+
+
+def test_a_failing_fetcher_keeps_what_it_yielded(workdir):
+    def broken():
+        yield article(1)
+        raise ConnectionError("reset")
+
+    out = run({"hn": broken, "devto": lambda: [article(2)]})
+    assert sorted(a["title"] for _, _, a in out) == ["Story 1", "Story 2"]
+
+
+def test_snapshots_keep_the_description_for_reclassification(workdir):
+    described = article(1, title="Weekly notes", _classify=("Weekly notes", "We moved to kubernetes"))
+    writer = ebm.SnapshotWriter(["devto"])
+    for name, position, a in run({"devto": lambda: [described, article(2, title="Plain")]}):
+        writer(name, position, a)
+    writer.close()
+    saved = ebm.load_snapshot("devto")
+    assert [a.get("summary") for a in saved] == ["We moved to kubernetes", None]
+    assert saved[0]["topic"] == "☁️ Cloud / Infra"
+
+    replayed = run({"devto": lambda: ebm.replay_snapshot("devto")})
+    assert [a["topic"] for _, _, a in replayed] == [a["topic"] for a in saved]
+
+
+def test_a_consumer_that_stops_early_cancels_every_stage(workdir):
+    produced = []
+
+    def endless():
+        for i in range(100_000):
+            produced.append(i)
+            yield article(i)
+
+    stream = ebm.stream_articles(["hn"], {"hn": endless})
+    assert [a["title"] for _, (_, _, a) in zip(range(3), stream)] == ["Story 0", "Story 1", "Story 2"]
+    stream.close()
+    deadline = time.time() + 5
+    while any(t.name == "fetch" or t.name.startswith(("fetch:", "stage:")) for t in threading.enumerate()):
+        assert time.time() < deadline, "pipeline threads still running after the consumer left"
+        time.sleep(0.05)
+    assert len(produced) < 1_000  # the fetcher stopped once the queues filled up
+
+
+def test_a_failed_or_empty_fetch_keeps_the_last_snapshot(workdir):
+    def snapshot(sources):
+        writer, failed = ebm.SnapshotWriter(list(sources)), set()
+        ebm.run_pipeline(list(sources), writer, sources=sources, failed=failed)
+        writer.close(failed)
+        return failed
+
+    assert snapshot({"hn": lambda: [article(1)], "devto": lambda: [article(2)], "rss": lambda: [article(3)]}) == set()
+
+    def down():
+        yield article(9)
+        raise ConnectionError("reset")
+
+    assert snapshot({"hn": down, "devto": lambda: [], "rss": lambda: [article(4)]}) == {"hn"}
+    assert [[a["title"] for a in ebm.load_snapshot(name)] for name in ("hn", "devto", "rss")] == [
+        ["Story 1"], ["Story 2"], ["Story 4"]]
+    assert not list((workdir / ".ebm-state").rglob("*.tmp"))
+
+
+def test_concurrent_atomic_writes_never_share_a_temp_file(workdir):
+    path = str(workdir / "state" / "shared.json")
+    errors = []
+
+    def write(n):
+        try:
+            for i in range(50):
+                ebm._write_json_atomic(path, {"writer": n, "payload": list(range(i))})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert ebm.json.loads(open(path, encoding="utf-8").read())["payload"] == list(range(49))
+    assert not list((workdir / "state").glob("*.tmp"))
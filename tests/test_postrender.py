@@ -0,0 +1,52 @@
+import gzip
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import ebm
+
+TRICKY_JS = """
+  // a comment with a `backtick` and an apostrophe: it's
+  const page = `
+    // this line is page text, not a comment
+      <pre>  keep   this  </pre>
+    ${ok ? `<b>${"}"}</b>` : ""}
+  `;
+  const quoted = s.replace(/"/g, "&quot;").replace(/`/g, "'");  // trailing comments stay
+  const half = total / 2 / count;
+  if (!/\\\\s$/.test(q)) { url = "https://example.com//path"; }
+"""
+
+
+def test_minify_js_keeps_template_literals_and_strings_intact():
+    out = ebm._minify_js(TRICKY_JS)
+    assert "a comment with" not in out
+    assert "\n    // this line is page text, not a comment\n      <pre>  keep   this  </pre>\n" in out
+    assert 'url = "https://example.com//path"' in out and "const half = total / 2 / count;" in out
+    assert out.startswith("const page = `") and "\n  `;\nconst quoted = s.replace(/\"/g" in out
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="needs node to parse the script")
+def test_minified_page_script_still_parses():
+    script = (ebm.render_script(ebm.TOPIC_KEYWORDS) + ebm.SPLIT_SCRIPT + ebm.SEARCH_SCRIPT + ebm.LIVE_SCRIPT)
+    check = "new Function(require('fs').readFileSync(0, 'utf8'))"
+    subprocess.run(["node", "-e", check], input=ebm._minify_js(script), text=True, check=True)
+
+
+def test_precompressed_siblings_round_trip(workdir):
+    brotli = pytest.importorskip("brotli")
+    page = "<!doctype html><p>" + "trend " * 500 + "</p>"
+    assert ebm.write_outputs(str(workdir / "index.html"), page, {"articles.json": "[]"}, precompress=True)
+    for name, body in (("index.html", page), ("articles.json", "[]")):
+        assert gzip.decompress((workdir / f"{name}.gz").read_bytes()).decode("utf-8") == body
+        assert brotli.decompress((workdir / f"{name}.br").read_bytes()).decode("utf-8") == body
+
+
+def test_budget_warns_or_fails_the_build(capsys):
+    ebm.check_budget(50_000, 40_000, fail=False)
+    assert "Budget exceeded: page is 48.8 KB gzipped, over the 39.1 KB budget" in capsys.readouterr().out
+    with pytest.raises(SystemExit, match="Budget exceeded"):
+        ebm.check_budget(50_000, 40_000, fail=True)
+    ebm.check_budget(40_000, 40_000, fail=True)
+    ebm.check_budget(10**9, 0, fail=True)  # 0 disables the budget
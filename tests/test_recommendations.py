@@ -0,0 +1,25 @@
+from conftest import article, ebm
+
+
+def test_sparse_topics_are_padded_without_repeats(workdir):
+    for articles in ([], [article(1, topic="🔐 Security", title="New CVE in OpenSSL")]):
+        recs = ebm.generate_miro_recommendations(articles)
+        assert len(recs) == 5
+        assert len({r["title"] for r in recs}) == 5 and len({r["topic"] for r in recs}) == 5
+    assert recs[0]["topic"] == "🔐 Security" and recs[0]["inspired_by"] == ["New CVE in OpenSSL"]
+    assert all(r["inspired_by"] == [] for r in recs[1:])
+
+
+def test_a_small_library_uses_each_default_once(workdir, monkeypatch):
+    library = {"MIRO_CONTENT_TEMPLATES": {"🔐 Security": [{"title": "Threat models", "tags": ["security"]}]},
+               "DEFAULT_RECS": [{"title": "Generic", "topic": "🔧 Engineering"}]}
+    monkeypatch.setattr(ebm, "template_index", lambda: ebm.TemplateIndex(library))
+    assert [r["title"] for r in ebm.generate_miro_recommendations([])] == ["Threat models", "Generic"]
+
+
+def test_trending_terms_pick_the_matching_template(workdir):
+    articles = [article(i, topic="🤖 AI / ML", title=f"RAG pipeline with a vector database {i}", score=500 + i)
+                for i in range(5)]
+    recs = ebm.generate_miro_recommendations(articles)
+    assert recs[0]["topic"] == "🤖 AI / ML" and "rag" in recs[0]["tags"]
+    assert recs[0]["inspired_by"] == ["RAG pipeline with a vector database 4", "RAG pipeline with a vector database 3"]
@@ -0,0 +1,184 @@
+import json
+import shutil
+import subprocess
+import time
+import urllib.parse
+
+import pytest
+
+from conftest import ebm, serve
+
+QUIET = dict(ebm.SIM_FAULTS, latency=0, jitter=0, **{"429": 0, "5xx": 0, "truncate": 0, "hang": 0})
+
+
+def upstream(fail=lambda subs, query: None):
+    """simulator_handler without random faults, recording each Reddit listing
+    as (subs, query) and answering with fail(subs, query) when that's a status
+    (or a (status, headers) pair)."""
+    listings = []
+
+    class Handler(ebm.simulator_handler(QUIET)):
+        def do_GET(self):
+            parts = urllib.parse.urlsplit(self.path)
+            if "/r/" in parts.path:
+                subs = parts.path.split("/r/")[1].split("/")[0]
+                query = dict(urllib.parse.parse_qsl(parts.query))
+                listings.append((subs, query))
+                if reply := fail(subs, query):
+                    status, headers = reply if isinstance(reply, tuple) else (reply, ())
+                    return self._send(status, {"message": "injected"}, headers=headers)
+            super().do_GET()
+
+    return Handler, listings
+
+
+@pytest.fixture
+def reddit(workdir, monkeypatch):
+    def run(handler, **settings):
+        with monkeypatch.context() as m, serve(handler) as base:
+            for name, value in dict(settings, UPSTREAM=base).items():
+                m.setattr(ebm, name, value)
+            return [(a["source"], a["title"], a["url"], a["score"]) for a in ebm.fetch_reddit(limit=15)]
+    return run
+
+
+def test_batches_match_per_subreddit_listings_in_fewer_requests(reddit):
+    handler, single = upstream()
+    expected = reddit(handler, REDDIT_BATCH_SIZE=1)
+    handler, batched = upstream()
+    got = reddit(handler)
+    assert got == expected and len({source for source, *_ in got}) == len(ebm.SUBREDDITS)
+    assert len(single) == len(ebm.SUBREDDITS)
+    assert len(batched) < len(single)
+    multi = [(subs, q) for subs, q in batched if "+" in subs]
+    assert len(multi) >= len(ebm.SUBREDDITS) // ebm.REDDIT_BATCH_SIZE
+    assert all(len(subs.split("+")) <= ebm.REDDIT_BATCH_SIZE for subs, _ in multi)
+    assert all(q["limit"] == str(ebm.REDDIT_PAGE_SIZE) for _, q in multi)
+
+
+def test_listings_are_paged_with_after_and_short_subs_backfilled(reddit):
+    handler, listings = upstream()
+    expected = reddit(handler, REDDIT_BATCH_SIZE=1)
+    handler, listings = upstream()
+    assert reddit(handler, REDDIT_PAGE_SIZE=10, REDDIT_MAX_PAGES=2) == expected
+    multi = [(subs, q) for subs, q in listings if "+" in subs]
+    assert any("after" in q for _, q in multi)  # second pages
+    assert [subs for subs, _ in listings if "+" not in subs]  # backfills after two small pages
+
+
+def test_a_failing_multireddit_falls_back_to_one_request_per_subreddit(reddit, capsys):
+    handler, _ = upstream()
+    expected = reddit(handler, REDDIT_BATCH_SIZE=1)
+    handler, listings = upstream(lambda subs, query: 503 if "+" in subs else None)
+    assert reddit(handler) == expected
+    assert "falling back to one request per subreddit" in capsys.readouterr().out
+    assert {subs for subs, _ in listings if "+" not in subs} == {sub for _, sub in ebm.SUBREDDITS}
+
+
+def test_a_rate_limited_listing_waits_for_retry_after_then_carries_on(reddit, capsys):
+    handler, clean = upstream()
+    expected = reddit(handler)
+    refused = []
+
+    def once(subs, query):
+        if "+" in subs and not refused:
+            refused.append(subs)
+            return 429, [("Retry-After", "0.3")]
+
+    handler, listings = upstream(once)
+    started = time.monotonic()
+    assert reddit(handler) == expected
+    assert time.monotonic() - started >= 0.3
+    assert len(listings) == len(clean) + 1 and listings[0] == listings[1]
+    assert "falling back" not in capsys.readouterr().out
+
+
+def test_a_listing_that_stays_rate_limited_stops_without_fanning_out(reddit, capsys):
+    handler, listings = upstream(lambda subs, query: 429)
+    assert reddit(handler, REDDIT_BACKOFF_SECONDS=0.01) == []
+    assert len(listings) == ebm.REDDIT_MAX_RETRIES + 1
+    assert all("+" in subs for subs, _ in listings)  # not one request per subreddit
+    assert "stopping Reddit for this run" in capsys.readouterr().out
+
+
+def test_a_retry_after_past_the_cap_gives_up_at_once(reddit):
+    handler, _ = upstream()
+    expected = reddit(handler)
+    first_batch = {name for name, _ in ebm.SUBREDDITS[:ebm.REDDIT_BATCH_SIZE]}
+    second = ebm.SUBREDDITS[ebm.REDDIT_BATCH_SIZE][1]
+    handler, listings = upstream(lambda subs, query: (429, [("Retry-After", "3600")]) if second in subs else None)
+    started = time.monotonic()
+    got = reddit(handler)
+    assert time.monotonic() - started < 5
+    assert got == [row for row in expected if row[0] in first_batch]
+    assert sum(second in subs for subs, _ in listings) == 1
+
+
+PANEL_HARNESS = """
+const window = globalThis;
+const stores = new Map();
+window.indexedDB = {open: () => {
+  const req = {};
+  const db = {transaction: () => ({objectStore: () => ({
+    get: key => { const r = {}; setTimeout(() => { r.result = stores.get(key); r.onsuccess(); }); return r; },
+    put: value => stores.set(value.key, value),
+  })})};
+  setTimeout(() => { req.result = db; req.onsuccess(); });
+  return req;
+}};
+let inFlight = 0, maxInFlight = 0, requests = [], status = () => 200;
+window.fetch = url => {
+  const subs = url.split("/r/")[1].split("/")[0];
+  requests.push(subs);
+  inFlight++; maxInFlight = Math.max(maxInFlight, inFlight);
+  return new Promise(resolve => setTimeout(() => {
+    inFlight--;
+    const code = status(subs);
+    const children = subs.split("+").flatMap(sub =>
+      Array.from({length: REDDIT_PER_SUB}, (_, i) => ({data: {subreddit: sub, id: `${sub}${i}`}})));
+    resolve({ok: code === 200, status: code, headers: {get: () => null},
+             json: async () => ({data: {children, after: null}})});
+  }, 5));
+};
+async function load(subs) {
+  const seen = [];
+  requests = [];
+  await loadSubreddits(subs, "week", (sub, posts, origin) => seen.push([sub, posts.length, origin]));
+  return {seen, requests: requests.slice(), maxInFlight};
+}
+(async () => {
+  const subs = Array.from({length: 18}, (_, i) => `sub${i}`);
+  const live = await load(subs);
+  const cached = await load(subs);
+  stores.clear();
+  status = () => 429;
+  const limited = await load(subs);
+  console.log(JSON.stringify({live, cached, limited}));
+})();
+"""
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="needs node to run the panel script")
+def test_panel_batches_bounds_and_caches_listings():
+    script = ebm.PAGE_SCRIPT
+    panel = script[script.index("// ── Reddit listings"):script.index("// ── Main fetch")]
+    constants = (f"const REDDIT_BATCH_SIZE = {ebm.REDDIT_BATCH_SIZE}, REDDIT_PAGE_SIZE = {ebm.REDDIT_PAGE_SIZE}, "
+                 f"REDDIT_MAX_PAGES = 1, REDDIT_MAX_RETRIES = {ebm.REDDIT_MAX_RETRIES}, "
+                 f"REDDIT_BACKOFF_SECONDS = 0.001, REDDIT_MAX_BACKOFF_SECONDS = 1;\n")
+    out = subprocess.run(["node", "-e", constants + panel + PANEL_HARNESS],
+                         capture_output=True, text=True, check=True, timeout=60).stdout
+    runs = json.loads(out)
+    batches = -(-18 // ebm.REDDIT_BATCH_SIZE)
+
+    live = runs["live"]
+    assert len(live["requests"]) == batches and all("+" in subs for subs in live["requests"])
+    assert live["maxInFlight"] <= 4
+    assert sorted(live["seen"]) == sorted([f"sub{i}", 25, "live"] for i in range(18))
+
+    cached = runs["cached"]
+    assert cached["requests"] == [] and {origin for _, _, origin in cached["seen"]} == {"cached"}
+
+    limited = runs["limited"]  # retried, then given up on: never one request per subreddit
+    assert len(limited["requests"]) == batches * (ebm.REDDIT_MAX_RETRIES + 1)
+    assert all("+" in subs for subs in limited["requests"])
+    assert {origin for _, _, origin in limited["seen"]} == {"error"}
@@ -0,0 +1,78 @@
+import gzip
+import json
+import threading
+
+import pytest
+import requests
+
+from conftest import article, ebm, serve
+
+
+@pytest.fixture
+def server(workdir):
+    index, events = ebm.ArticleIndex(), ebm.EventBroadcaster()
+    handler = ebm.dashboard_handler(index, events, str(workdir), ("index.html", ebm.SEARCH_INDEX))
+    with serve(handler) as base:
+        yield base, index, events
+
+
+def build(index, *articles):
+    topics = sorted({a["topic"] for a in articles})
+    return index.update(list(articles), [(t, sum(a["topic"] == t for a in articles)) for t in topics], [])
+
+
+def test_etag_answers_repeat_requests_with_304_until_the_data_changes(server):
+    base, index, _ = server
+    build(index, article(1, topic="🦀 Languages"))
+    first = requests.get(f"{base}/api/articles")
+    assert first.status_code == 200 and first.json()["data"][0]["title"] == "Story 1"
+    etag = first.headers["ETag"]
+    again = requests.get(f"{base}/api/articles", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b"" and again.headers["ETag"] == etag
+
+    build(index, article(1, topic="🦀 Languages"), article(2, topic="🦀 Languages"))
+    changed = requests.get(f"{base}/api/articles", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag and changed.json()["version"] == 2
+
+
+def test_static_files_are_gzipped_and_missing_ones_explained(server, workdir):
+    base, _, _ = server
+    assert requests.get(base + "/").status_code == 503  # not built yet
+    page = "<!doctype html>" + "<p>trend</p>" * 200
+    (workdir / "index.html").write_text(page, encoding="utf-8")
+    raw = requests.get(base + "/", headers={"Accept-Encoding": "gzip"}, stream=True).raw
+    assert raw.headers["Content-Encoding"] == "gzip" and gzip.decompress(raw.read()).decode() == page
+    assert requests.get(f"{base}/../secrets.txt").status_code == 404
+    assert requests.get(f"{base}/api/unknown").status_code == 404
+
+
+def test_articles_filter_by_topic_source_and_first_seen(server, monkeypatch):
+    base, index, _ = server
+    monkeypatch.setattr(ebm.time, "time", lambda: 1_000.0)
+    build(index, article(1, topic="🦀 Languages"), article(2, topic="🤖 AI / ML", source="HN"))
+    monkeypatch.setattr(ebm.time, "time", lambda: 2_000.0)
+    build(index, article(1, topic="🦀 Languages"), article(2, topic="🤖 AI / ML", source="HN"),
+          article(3, topic="🤖 AI / ML"))
+
+    def titles(**params):
+        return [a["title"] for a in requests.get(f"{base}/api/articles", params=params).json()["data"]]
+
+    assert titles(topic="🤖 AI / ML") == ["Story 2", "Story 3"]
+    assert titles(source="HN") == ["Story 2"]
+    assert titles(since="1500") == ["Story 3"]
+    assert titles(since="1970-01-01T00:25:00+00:00") == ["Story 3"]
+    topics = requests.get(f"{base}/api/topics").json()["data"]
+    assert topics == [{"topic": "🤖 AI / ML", "count": 2}, {"topic": "🦀 Languages", "count": 1}]
+
+
+def test_stream_says_hello_then_relays_published_events(server):
+    base, index, events = server
+    build(index, article(1, topic="🦀 Languages"))
+    with requests.get(f"{base}/api/stream", stream=True, timeout=10) as resp:
+        resp.encoding = "utf-8"  # what EventSource always decodes as
+        lines = resp.iter_lines(chunk_size=1, decode_unicode=True)
+        assert [next(lines), next(lines)] == ["event: hello", "data: 1"]
+        assert next(lines) == ""
+        payload = {"new": [ebm._live_article(article(2))]}
+        threading.Timer(0.1, events.publish, ("articles", payload)).start()
+        assert [next(lines), next(lines)] == ["event: articles", "data: " + json.dumps(payload, ensure_ascii=False)]
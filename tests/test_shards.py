@@ -0,0 +1,48 @@
+from conftest import article, ebm
+
+
+def crawl(shard, sources):
+    args = ebm.argparse.Namespace(shard=shard)
+    return ebm.crawl_shard(args, sources, list(sources))
+
+
+def test_merge_dedupes_across_shards_on_the_canonical_url(workdir):
+    first = crawl((1, 2), {"hn": lambda: [article(1, url="https://example.com/post?utm_source=hn"), article(2)]})
+    second = crawl((2, 2), {"hn": lambda: [article(1, url="http://www.example.com/post/#top", score=99),
+                                           article(3)],
+                            "devto": lambda: [article(1, url="https://example.com/post")]})
+    results, agg = ebm.merge_partials([second, first])  # shard order, not argument order
+    assert [(a["title"], a["score"]) for a in results["hn"]] == [("Story 1", 1), ("Story 2", 2), ("Story 3", 3)]
+    assert [a["title"] for a in results["devto"]] == ["Story 1"]  # other sources keep their copy
+    assert agg.total == 4
+
+
+def test_only_refetches_the_named_sources_and_reuses_the_rest(workdir, monkeypatch, capsys):
+    fetched = []
+
+    def fetcher(name, titles):
+        def fetch():
+            fetched.append(name)
+            return [article(i, title=f"{name}: {t}", url=f"https://{name}.example.com/{i}") for i, t in enumerate(titles)]
+        return fetch
+
+    def sources(hn_titles):
+        fakes = {name: fetcher(name, ["first run"]) for name in ebm.SOURCES}
+        fakes["hn"] = fetcher("hn", hn_titles)
+        monkeypatch.setattr(ebm, "SOURCES", fakes)
+        monkeypatch.setattr(ebm, "fetch_rss_feeds", lambda feeds: fakes["rss"]())
+
+    sources(["first run"])
+    ebm.main(["--output", "index.html"])
+    devto_mtime = (workdir / ".ebm-state" / "snapshot" / "devto.jsonl").stat().st_mtime_ns
+
+    fetched.clear()
+    sources(["second run", "another story"])
+    _, count, _, _ = ebm.main(["--only", "hn", "--output", "index.html"])
+    assert fetched == ["hn"]
+    page = (workdir / "index.html").read_text(encoding="utf-8")
+    assert "hn: second run" in page and "hn: first run" not in page and "devto: first run" in page
+    assert count == len(ebm.SOURCES) + 1
+    assert [a["title"] for a in ebm.load_snapshot("hn")] == ["hn: second run", "hn: another story"]
+    assert (workdir / ".ebm-state" / "snapshot" / "devto.jsonl").stat().st_mtime_ns == devto_mtime
+    assert "devto: 1 articles from snapshot" in capsys.readouterr().out
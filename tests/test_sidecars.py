@@ -0,0 +1,104 @@
+import itertools
+import json
+import random
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import article, ebm
+
+
+def decode(payload):
+    """The client's view of build_article_payload(): one dict per row."""
+    strings = payload["strings"]
+    return [{"title": payload["title"][i], "url": payload["url"][i], "comments_url": payload["comments_url"][i],
+             "score": payload["score"][i], "source": strings[payload["source"][i]],
+             "topic": strings[payload["topic"][i]], "change": strings[payload["change"][i]]}
+            for i in range(payload["n"])]
+
+
+def test_article_payload_is_columnar_best_scored_first():
+    articles = [article(1, topic="🦀 Languages"), article(3, topic="🤖 AI / ML", change="new"),
+                article(2, topic="🦀 Languages", comments_url="https://news.example.com/item?id=2")]
+    for a in articles[:2]:
+        a["comments_url"] = a["url"]
+    payload = ebm.build_article_payload(articles)
+    assert [row["title"] for row in decode(payload)] == ["Story 3", "Story 2", "Story 1"]
+    assert [row["comments_url"] for row in decode(payload)] == ["", "https://news.example.com/item?id=2", ""]
+    assert decode(payload)[0]["change"] == "new"
+    # every repeated string is stored once
+    assert len(payload["strings"]) == len(set(payload["strings"])) and payload["strings"].count("🦀 Languages") == 1
+
+
+def test_a_split_build_ships_the_articles_next_to_a_shell(workdir):
+    writer = ebm.SnapshotWriter(list(ebm.SOURCES))
+    for i in range(30):
+        writer("hn", None, article(i, title=f"Unique headline {i}", topic="🦀 Languages"))
+    writer.close()
+    (workdir / "split").mkdir()
+    (workdir / "full").mkdir()
+    ebm.main(["--replay", "--split", "--output", "split/index.html"])
+    ebm.main(["--replay", "--output", "full/index.html"])
+    shell = (workdir / "split" / "index.html").read_text(encoding="utf-8")
+    full = (workdir / "full" / "index.html").read_text(encoding="utf-8")
+    payload = json.loads((workdir / "split" / ebm.ARTICLES_PAYLOAD).read_text(encoding="utf-8"))
+    assert payload["n"] == 30 and "Unique headline 29" in payload["title"]
+    version = re.search(r'"articles\.json\?v=([0-9a-f]{12})"', shell).group(1)
+    assert version == ebm.content_hash((workdir / "split" / ebm.ARTICLES_PAYLOAD).read_text(encoding="utf-8"))[:12]
+    assert "Unique headline 29" in full and "Unique headline 29" not in shell
+    assert 'id="topic-cards"' in shell and 'id="topic-cards"' not in full  # filled in by the client
+
+
+WORDS = ["rust", "rusty", "go", "c++", "c#", "kubernetes", "k8s", "llm", "agents", "postgres", "the", "and", "ship"]
+
+
+def corpus(n=200, seed=7):
+    rng = random.Random(seed)
+    return [article(i, title=" ".join(rng.sample(WORDS, 4)).title(), score=rng.randint(0, 500),
+                    topic=rng.choice(["🦀 Languages", "🤖 AI / ML"]), source=rng.choice(["HN", "dev.to"]))
+            for i in range(n)]
+
+
+def test_search_postings_decode_to_exactly_the_matching_docs():
+    index = ebm.build_search_index(corpus())
+    docs = index["docs"]
+    strings = docs["strings"]
+    texts = [set(ebm.search_tokens(f'{title} {strings[docs["topic"][i]]} {strings[docs["source"][i]]}'))
+             for i, title in enumerate(docs["title"])]
+    assert index["terms"] == sorted(set().union(*texts)) and "the" not in index["terms"]
+    assert {"c++", "c#", "k8s"} <= set(index["terms"])
+    for term, deltas in zip(index["terms"], index["postings"]):
+        assert all(d > 0 for d in deltas[1:])
+        assert list(itertools.accumulate(deltas)) == [i for i, tokens in enumerate(texts) if term in tokens]
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="needs node to run the search script")
+def test_client_search_matches_a_brute_force_scan():
+    index = ebm.build_search_index(corpus())
+    script = ebm.SEARCH_SCRIPT
+    queries = ["rust", "rust ", "rust k8s ", "ru", "c++ llm", "agents languages", "nothing-here", "the"]
+    harness = (script[:script.index("function renderSearch")] + f"""
+const ix = {json.dumps(index)};
+const prepared = {{...ix, lookup: new Map(ix.terms.map((t, i) => [t, i])), stop: new Set(ix.stop),
+                   decoded: new Array(ix.terms.length)}};
+console.log(JSON.stringify({json.dumps(queries)}.map(q => {{
+  const hits = searchDocs(prepared, q);
+  return hits && Array.from(hits);
+}})));""")
+    results = json.loads(subprocess.run(["node", "-e", harness], capture_output=True, text=True,
+                                        check=True, timeout=60).stdout)
+    docs, strings = index["docs"], index["docs"]["strings"]
+    texts = [ebm.search_tokens(f'{title} {strings[docs["topic"][i]]} {strings[docs["source"][i]]}')
+             for i, title in enumerate(docs["title"])]
+    for query, hits in zip(queries, results):
+        tokens = ebm.search_tokens(query)
+        if not tokens:
+            assert hits is None
+            continue
+        typing = not query.endswith(" ")
+        expected = [i for i, words in enumerate(texts)
+                    if all(any(w == t or (typing and n == len(tokens) - 1 and w.startswith(t)) for w in words)
+                           for n, t in enumerate(tokens))]
+        assert hits == expected, query
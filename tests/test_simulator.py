@@ -0,0 +1,60 @@
+import argparse
+import itertools
+
+import pytest
+import requests
+
+from conftest import ebm, serve
+
+
+def faults(spec):
+    return ebm._fault_spec("latency=0,jitter=0,429=0,5xx=0,truncate=0,hang=0," + spec)
+
+
+def statuses(spec, path="/hacker-news.firebaseio.com/v0/item/1.json", n=200):
+    with serve(ebm.simulator_handler(faults(spec))) as base:
+        return [requests.get(base + path).status_code for _ in range(n)]
+
+
+def test_fault_spec_overrides_defaults_and_rejects_unknown_keys():
+    spec = ebm._fault_spec("latency=200, 429=0.1,hang=0,")
+    assert spec == dict(ebm.SIM_FAULTS, latency=200, hang=0, **{"429": 0.1})
+    with pytest.raises(argparse.ArgumentTypeError, match="unknown fault 'lag'"):
+        ebm._fault_spec("lag=1")
+    with pytest.raises(argparse.ArgumentTypeError, match="expected a number"):
+        ebm._fault_spec("429=often")
+
+
+def test_fault_rates_are_sampled_from_the_seed():
+    first = statuses("429=0.25,seed=3")
+    assert first == statuses("429=0.25,seed=3") != statuses("429=0.25,seed=4")
+    assert set(first) == {200, 429} and 0.15 < first.count(429) / len(first) < 0.35
+
+
+def test_429s_carry_retry_after(workdir):
+    with serve(ebm.simulator_handler(faults("429=1"))) as base:
+        resp = requests.get(f"{base}/dev.to/api/articles?per_page=3")
+    assert resp.status_code == 429 and 1 <= int(resp.headers["Retry-After"]) <= 30
+
+
+def test_5xx_come_in_bursts_per_host():
+    runs = [len(list(group)) for status, group in itertools.groupby(statuses("5xx=0.05,burst=4,seed=1"))
+            if status == 503]
+    assert runs and all(n % 4 == 0 for n in runs[:-1]) and runs[-1] <= 4 * len(runs)
+
+
+def test_truncated_bodies_fail_the_read():
+    with serve(ebm.simulator_handler(faults("truncate=1"))) as base:
+        with pytest.raises(requests.exceptions.RequestException):
+            requests.get(f"{base}/dev.to/api/articles?per_page=20").json()
+
+
+def test_fetchers_run_offline_against_the_simulator(workdir, monkeypatch):
+    handler = ebm.simulator_handler(faults("seed=5"))
+    with serve(handler) as base:
+        monkeypatch.setattr(ebm, "UPSTREAM", base)
+        first = list(ebm.fetch_hn_top(limit=10))
+        again = list(ebm.fetch_hn_top(limit=10))
+    assert len(first) == 10 and [a["title"] for a in first] == [a["title"] for a in again]
+    assert all(a["url"].startswith("https://example.com/hn/") for a in first)
+    assert handler.stats["ok"] == 22  # two id lists plus 20 items
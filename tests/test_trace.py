@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from conftest import article, ebm
+
+
+def test_a_traced_build_writes_nested_chrome_trace_events(workdir):
+    writer = ebm.SnapshotWriter(list(ebm.SOURCES))
+    for i in range(10):
+        writer("hn", None, article(i, topic="🦀 Languages"))
+    writer.close()
+    ebm.main(["--replay", "--trace", "trace.json", "--output", "index.html"])
+    assert ebm.TRACER is None  # written and cleared on the way out
+
+    trace = json.loads((workdir / "trace.json").read_text(encoding="utf-8"))
+    assert trace["displayTimeUnit"] == "ms"
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    meta = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    for e in events:
+        assert set(e) == {"name", "cat", "ph", "ts", "dur", "pid", "tid", "args"}
+        assert isinstance(e["ts"], int) and e["dur"] >= 0 and isinstance(e["args"], dict)
+    (run,) = [e for e in events if e["cat"] == "run"]
+    assert run["name"] == "build"
+    inner = [e for e in events if e is not run and e["pid"] == run["pid"]]
+    assert inner and all(run["ts"] <= e["ts"] and e["ts"] + e["dur"] <= run["ts"] + run["dur"] for e in inner)
+    assert {"generate_html", "sidecars"} <= {e["name"] for e in events}
+    threads = {e["args"]["name"] for e in meta if e["name"] == "thread_name"}
+    assert {"stage:normalize", "stage:classify"} <= threads
+    assert any(e["name"] == "process_name" and e["args"]["name"] == "eng_brand_machine" for e in meta)
+    normalize = next(e for e in events if e["name"] == "stage:normalize")
+    assert normalize["cat"] == "pipeline" and normalize["args"]["items"] == 10
+
+
+def test_a_failing_span_records_the_error_and_still_raises():
+    tracer = ebm.Tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("parse", "stage", feed="x") as s:
+            s.set(bytes=10)
+            raise ValueError("bad xml")
+    (event,) = tracer.events
+    assert event["args"] == {"feed": "x", "bytes": 10, "error": "ValueError: bad xml"}
+
+
+def test_threads_that_reuse_an_id_get_their_own_track(tmp_path):
+    tracer = ebm.Tracer()
+    me = ebm.threading.current_thread()
+    name = me.name
+    try:
+        for me.name in ("fetch:hn", "stage:classify"):  # one id, as when a finished thread's id is reused
+            with tracer.span("work", "pipeline"):
+                pass
+    finally:
+        me.name = name
+    tracer.write(str(tmp_path / "trace.json"))
+    trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+    tracks = {e["tid"]: e["args"]["name"] for e in trace if e["name"] == "thread_name"}
+    assert sorted(tracks[e["tid"]] for e in trace if e["ph"] == "X") == ["fetch:hn", "stage:classify"]